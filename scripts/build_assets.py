@@ -0,0 +1,9 @@
+"""Rebuilds the asset manifest and the template atlas of the package, run
+it whenever assets are added, renamed, removed or edited."""
+
+from ark._assets import MANIFEST_PATH, build_manifest
+from ark._atlas import ATLAS_PATH, build_atlas
+
+if __name__ == "__main__":
+    print(f"Wrote {len(build_manifest())} assets to {MANIFEST_PATH}")
+    print(f"Packed {build_atlas() / 1e6:.1f}MB of templates into {ATLAS_PATH}")
@@ -0,0 +1,81 @@
+"""Measures how long `import ark` takes in a fresh interpreter and which
+modules take the longest to import, and checks that the input and image
+backends are not imported with it.
+
+Usage: python scripts/import_time.py [--runs 10] [--module ark] [--top 15]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+_SNIPPET = "import time; t = time.perf_counter(); import {0}; print(time.perf_counter() - t)"
+_LOADED = "import sys, {0}; print(' '.join(m for m in {1!r} if m in sys.modules))"
+
+# backends that must only be imported once they are used
+_LAZY_MODULES = ("pynput", "cv2")
+
+
+def measure(module: str) -> tuple[float, dict[str, int]]:
+    """Imports the module in a new interpreter, returns the wall time and the
+    cumulative import time of each module in microseconds."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _SNIPPET.format(module)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cum, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        if cum.isdigit():
+            cumulative[name] = int(cum)
+    return float(proc.stdout.strip().splitlines()[-1]), cumulative
+
+
+def loaded(module: str, names: tuple[str, ...]) -> list[str]:
+    """Imports the module in a new interpreter, returns which of the given
+    modules have been imported along with it."""
+    proc = subprocess.run(
+        [sys.executable, "-c", _LOADED.format(module, names)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return proc.stdout.split()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--module", default="ark")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    times = []
+    cumulative: dict[str, list[int]] = {}
+    for _ in range(args.runs):
+        wall, modules = measure(args.module)
+        times.append(wall)
+        for name, micros in modules.items():
+            cumulative.setdefault(name, []).append(micros)
+
+    print(
+        f"import {args.module}: median {statistics.median(times) * 1000:.1f}ms, "
+        f"min {min(times) * 1000:.1f}ms over {args.runs} runs"
+    )
+    slowest = sorted(
+        cumulative.items(), key=lambda kv: statistics.median(kv[1]), reverse=True
+    )
+    for name, micros in slowest[: args.top]:
+        print(f"{statistics.median(micros) / 1000:9.1f}ms  {name}")
+
+    eager = loaded(args.module, _LAZY_MODULES)
+    assert not eager, f"import {args.module} imported {', '.join(eager)}"
+
+
+if __name__ == "__main__":
+    main()
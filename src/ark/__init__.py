@@ -1,9 +1,86 @@
-from .entities import *
-from .interfaces import *
-from .server import Server
-from .settings import InputSettings, UserSettings, DinoExport
-from .state import State
-from .window import ArkWindow
-
-__all__ = ("State", "ArkWindow", "Server", "InputSettings", "UserSettings", "DinoExport")
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from ._helpers import WaitStats, wait_stats
+from .context import ArkContext, current_context
+from .executor import PoolMetrics, TaskPool, get_pool, pool_metrics
+from .state import State, StateToken, bind_token, current_token
+
+if TYPE_CHECKING:
+    from .entities import *
+    from .interfaces import *
+    from .server import Server
+    from .settings import DinoExport, InputSettings, SettingsWatcher, UserSettings
+    from .window import ArkWindow
+
+# the window, the interfaces and the entities pull in the screen capture,
+# OCR and input backends, they are only imported once they are accessed
+_LAZY = {
+    "ArkWindow": ".window",
+    "Server": ".server",
+    "InputSettings": ".settings",
+    "UserSettings": ".settings",
+    "DinoExport": ".settings",
+    "SettingsWatcher": ".settings",
+    **dict.fromkeys(("Player", "Dinosaur", "Stryder", "Gacha"), ".entities"),
+    **dict.fromkeys(
+        (
+            "ActionWheel",
+            "Bed",
+            "ChemistryBench",
+            "Console",
+            "CryoBreeder",
+            "CryobreederState",
+            "EscapeMenu",
+            "HUDInfo",
+            "IndustrialForge",
+            "IndustrialGrinder",
+            "Inventory",
+            "MainMenu",
+            "PlayerInventory",
+            "SessionList",
+            "SpawnScreen",
+            "Structure",
+            "TekCropPlot",
+            "TekDedicatedStorage",
+            "TekSleepingPod",
+            "TribeLog",
+            "TribeLogEvent",
+            "TribeLogEventType",
+            "TribeLogMessage",
+        ),
+        ".interfaces",
+    ),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = (
+    "ArkContext",
+    "current_context",
+    "TaskPool",
+    "PoolMetrics",
+    "get_pool",
+    "pool_metrics",
+    "State",
+    "StateToken",
+    "bind_token",
+    "current_token",
+    "ArkWindow",
+    "Server",
+    "InputSettings",
+    "UserSettings",
+    "DinoExport",
+    "SettingsWatcher",
+    "WaitStats",
+    "wait_stats",
+)
 __version__ = "1.3.2"
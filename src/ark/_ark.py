@@ -1,4 +1,3 @@
-import time
 from pathlib import Path
 from typing import Optional
 
@@ -6,42 +5,89 @@ import pyautogui as pg  # type: ignore[import]
 import pydirectinput  # type: ignore[import]
 from pynput.mouse import Button, Controller  # type: ignore[import]
 
+from inspect import getattr_static
+
 from ._helpers import state_checker
+from ._rate import TransferRateController
+from ._tracker import InterfaceTracker
+from .context import ArkContext, ContextAttribute, current_context
 from .settings import InputSettings, UserSettings
+from .state import StateToken, current_token
 from .window import ArkWindow
 
 pg.FAILSAFE = False
 pydirectinput.FAILSAFE = False
 
 
-class Ark:
+class _ArkMeta(type):
+    """Routes assignments of context attributes on the class, such as
+    `Ark.window = ...`, to the active context."""
+
+    def __setattr__(cls, name: str, value) -> None:
+        attr = getattr_static(cls, name, None)
+        if isinstance(attr, ContextAttribute):
+            attr.__set__(None, value)
+        else:
+            super().__setattr__(name, value)
+
+
+class Ark(metaclass=_ArkMeta):
     """Base parent class for all classes representing objects in ark
     Provides access to the games window, mouse and keypress simulation,
     and program state checking.
+
+    The window, input and settings are resolved through an `ArkContext`,
+    either the one passed or the context active in the current thread.
+
+    Parameters
+    ----------
+    reinit :class:`bool`:
+        Whether to recreate the window and reload the settings of the context
+
+    context :class:`ArkContext` [Optional]:
+        The context to bind the object to rather than the active context
     """
 
     PKG_DIR = str(Path(__file__).parent)
-    window: ArkWindow = None  # type: ignore[assignment]
-    keybinds: InputSettings = None  # type: ignore[assignment]
-    settings: UserSettings = None  # type: ignore[assignment]
-    mouse = Controller()
-    last_interface_exit: float | None = None
-    last_view_changed: float | None = None
+    window: ArkWindow = ContextAttribute()  # type: ignore[assignment]
+    keybinds: InputSettings = ContextAttribute()  # type: ignore[assignment]
+    settings: UserSettings = ContextAttribute()  # type: ignore[assignment]
+    mouse: Controller = ContextAttribute()  # type: ignore[assignment]
+    transfer_rate: TransferRateController = ContextAttribute()  # type: ignore[assignment]
+    tracker: InterfaceTracker = ContextAttribute()  # type: ignore[assignment]
+    last_interface_exit: float | None = ContextAttribute()  # type: ignore[assignment]
+    last_view_changed: float | None = ContextAttribute()  # type: ignore[assignment]
 
-    def __init__(self, reinit: bool = False) -> None:
-        if Ark.window is None or reinit:
-            Ark.window = ArkWindow()
+    _context: Optional[ArkContext] = None
 
-        if Ark.keybinds is None or reinit:
-            Ark.keybinds = InputSettings.load()
+    def __init__(self, reinit: bool = False, *, context: Optional[ArkContext] = None) -> None:
+        if context is not None:
+            self._context = context
 
-        if Ark.settings is None or reinit:
-            Ark.settings = UserSettings.load()
+        context = self.context
+        if context.window is None or reinit:
+            context.window = ArkWindow()
+
+        if context.keybinds is None or reinit:
+            context.keybinds = InputSettings.load()
+
+        if context.settings is None or reinit:
+            context.settings = UserSettings.load()
+
+    @property
+    def context(self) -> ArkContext:
+        """The context of the object, the active context if it is not bound."""
+        return self._context or current_context()
+
+    @property
+    def state_token(self) -> StateToken:
+        """The token of the context, the token of the thread if it has none."""
+        return self.context.token or current_token()
 
-    @state_checker
     def sleep(self, duration: int | float) -> None:
-        """Sleeps for a given duration"""
-        time.sleep(duration)
+        """Sleeps for a given duration, returns early with a `TerminatedError`
+        if the state token of the thread is cancelled."""
+        self.state_token.sleep(duration)
 
     @state_checker
     def move_to(
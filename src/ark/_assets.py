@@ -0,0 +1,84 @@
+"""Resolves the assets shipped with the package through a manifest of all
+asset images, so the templates of the items, buffs and buttons created at
+import time do not each have to be looked up on disk.
+
+The manifest has to be rebuilt whenever assets are added or renamed:
+```
+python scripts/build_assets.py
+```
+Assets missing from the manifest are still found on disk, only slower.
+"""
+
+import json
+import os
+import posixpath
+from pathlib import Path
+from typing import Optional
+
+PKG_DIR = str(Path(__file__).parent)
+ASSET_DIR = os.path.join(PKG_DIR, "assets")
+MANIFEST_PATH = os.path.join(ASSET_DIR, "manifest.json")
+
+_MANIFEST: Optional[dict[str, str]] = None
+
+
+def load_manifest() -> dict[str, str]:
+    """Returns the asset files of the manifest, mapping their lowercase path
+    relative to the asset directory to the path as it is on disk. Empty if
+    there is no manifest."""
+    global _MANIFEST
+
+    if _MANIFEST is None:
+        try:
+            with open(MANIFEST_PATH, encoding="utf-8") as f:
+                files = json.load(f)["files"]
+        except (OSError, ValueError, KeyError):
+            files = []
+        _MANIFEST = {path.lower(): path for path in files}
+    return _MANIFEST
+
+
+def asset_name(filepath: str) -> Optional[str]:
+    """Returns the path of an asset of the manifest relative to the asset
+    directory, as it is on disk. The path may be relative to the package
+    (`assets/...`) or absolute, `None` if it is not an asset of the manifest."""
+    path = filepath.replace("\\", "/")
+    pkg_dir = PKG_DIR.replace("\\", "/")
+
+    if path.lower().startswith(pkg_dir.lower() + "/"):
+        path = path[len(pkg_dir) + 1 :]
+    elif os.path.isabs(path):
+        return None
+
+    path = posixpath.normpath(path)
+    if not path.lower().startswith("assets/"):
+        return None
+    return load_manifest().get(path[len("assets/") :].lower())
+
+
+def resolve_asset(filepath: str) -> Optional[str]:
+    """Resolves a path to an asset of the package to its absolute path,
+    `None` if the path is not an asset of the manifest."""
+    asset = asset_name(filepath)
+    if asset is None:
+        return None
+    return os.path.join(ASSET_DIR, asset).replace("/", "\\")
+
+
+def build_manifest() -> list[str]:
+    """Writes the manifest of all images in the asset directory."""
+    global _MANIFEST
+
+    files = []
+    for root, _, filenames in os.walk(ASSET_DIR):
+        for filename in filenames:
+            path = os.path.relpath(os.path.join(root, filename), ASSET_DIR)
+            files.append(path.replace(os.sep, "/"))
+
+    files = sorted(path for path in files if path.lower().endswith(".png"))
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump({"files": files}, f, indent=2)
+        f.write("\n")
+
+    _MANIFEST = None
+    return files
@@ -0,0 +1,171 @@
+"""Packs the templates of the package into a single atlas so they are
+decoded once at build time rather than every time they are matched.
+
+Every template of the asset manifest is stored in color (BGR) and in
+grayscale in one flat buffer, which is memory mapped when it is first
+needed. Templates are returned as read-only views into that buffer, so
+processes running several bots share the same pages.
+
+The atlas is built along with the manifest:
+```
+python scripts/build_assets.py
+```
+If it has not been built or does not match the manifest, templates are
+loaded from their PNG files instead. The same goes for a single template
+whose PNG has been edited since the atlas was built.
+"""
+
+import hashlib
+import json
+import os
+from threading import Lock
+from typing import Optional
+
+import cv2 as cv  # type: ignore[import]
+import numpy as np
+
+from ._assets import ASSET_DIR, asset_name, load_manifest
+
+ATLAS_PATH = os.path.join(ASSET_DIR, "atlas.npy")
+INDEX_PATH = os.path.join(ASSET_DIR, "atlas.json")
+
+
+class TemplateAtlas:
+    """Templates packed into a single buffer.
+
+    Parameters
+    ----------
+    buffer :class:`np.ndarray`:
+        The flat buffer all templates are packed into
+
+    index :class:`dict[str, dict]`:
+        The shape, offsets and file signature of each template, keyed by its
+        path relative to the asset directory
+    """
+
+    def __init__(self, buffer: np.ndarray, index: dict[str, dict]) -> None:
+        self._buffer = buffer
+        self._index = index
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get(self, name: str, grayscale: bool = False) -> Optional[np.ndarray]:
+        """Returns a view of the template, `None` if it is not in the atlas."""
+        entry = self._index.get(name)
+        if entry is None:
+            return None
+
+        height, width = entry["shape"]
+        if grayscale:
+            start = entry["gray"]
+            return self._buffer[start : start + height * width].reshape(height, width)
+
+        start = entry["color"]
+        size = height * width * 3
+        return self._buffer[start : start + size].reshape(height, width, 3)
+
+
+_ATLAS: Optional[TemplateAtlas] = None
+_LOADED = False
+_LOCK = Lock()
+
+
+def load_atlas() -> Optional[TemplateAtlas]:
+    """Memory maps the atlas on the first call, `None` if it has not been
+    built or was built for a different set of assets. Templates whose PNG
+    has changed since are left out, so they are loaded from the PNG."""
+    global _ATLAS, _LOADED
+
+    with _LOCK:
+        if _LOADED:
+            return _ATLAS
+        _LOADED = True
+
+        try:
+            with open(INDEX_PATH, encoding="utf-8") as f:
+                index = json.load(f)
+            buffer = np.load(ATLAS_PATH, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+
+        if sorted(index) != sorted(load_manifest().values()):
+            return None
+        index = {
+            name: entry for name, entry in index.items() if _is_current(name, entry)
+        }
+        _ATLAS = TemplateAtlas(buffer, index)
+        return _ATLAS
+
+
+def get_template(filepath: str, grayscale: bool = False) -> Optional[np.ndarray]:
+    """Returns the packed template of an asset, `None` if it is not packed."""
+    name = asset_name(filepath)
+    if name is None:
+        return None
+
+    atlas = load_atlas()
+    return None if atlas is None else atlas.get(name, grayscale)
+
+
+def build_atlas() -> int:
+    """Decodes every asset of the manifest and writes them into the atlas,
+    returns the size of the atlas in bytes."""
+    global _ATLAS, _LOADED
+
+    index: dict[str, dict] = {}
+    chunks: list[np.ndarray] = []
+    offset = 0
+
+    for name in load_manifest().values():
+        # decoded the same way a template is decoded when it is matched by path
+        path = os.path.join(ASSET_DIR, name)
+        color = cv.imread(path, cv.IMREAD_COLOR)
+        gray = cv.imread(path, cv.IMREAD_GRAYSCALE)
+        if color is None or gray is None:
+            raise FileNotFoundError(f"Could not read asset {name}.")
+
+        index[name] = {
+            "shape": list(gray.shape),
+            "color": offset,
+            "gray": offset + color.size,
+            **_signature(path),
+        }
+        chunks.extend((color.ravel(), gray.ravel()))
+        offset += color.size + gray.size
+
+    buffer = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.uint8)
+    np.save(ATLAS_PATH, buffer)
+    with open(INDEX_PATH, "w", encoding="utf-8") as f:
+        json.dump(index, f)
+
+    with _LOCK:
+        _ATLAS, _LOADED = None, False
+    return buffer.nbytes
+
+
+def _signature(path: str) -> dict:
+    """The size, modification time and hash of an asset when it was packed."""
+    stat = os.stat(path)
+    with open(path, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    return {"size": stat.st_size, "mtime": stat.st_mtime_ns, "sha1": digest}
+
+
+def _is_current(name: str, entry: dict) -> bool:
+    """Checks whether the PNG of a packed template is unchanged, it is only
+    hashed if its modification time changed, i.e. when it was copied."""
+    path = os.path.join(ASSET_DIR, name)
+    try:
+        stat = os.stat(path)
+        if stat.st_size != entry.get("size"):
+            return False
+        if stat.st_mtime_ns == entry.get("mtime"):
+            return True
+        with open(path, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest() == entry.get("sha1")
+    except OSError:
+        return False
@@ -2,16 +2,17 @@ import functools
 import math
 import os
 import time
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
 from inspect import signature
 from pathlib import Path
-from threading import Thread
-from typing import Any, Callable
+from threading import Lock
+from typing import Any, Callable, Optional
 
-import psutil  # type: ignore[import]
-import win32clipboard  # type: ignore[import]
-
-from .exceptions import TerminatedError
-from .state import State
+from . import config
+from ._assets import resolve_asset
+from .executor import get_pool
+from .state import current_token
 
 
 def state_checker(func: Callable):
@@ -19,11 +20,8 @@ def state_checker(func: Callable):
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        while State.paused:
-            time.sleep(0.1)
-
-        if not State.running:
-            raise TerminatedError
+        token = getattr(args[0], "state_token", None) if args else None
+        (token or current_token()).check()
         return func(*args, **kwargs)
 
     return wrapper
@@ -31,10 +29,17 @@ def state_checker(func: Callable):
 
 def get_filepath(filepath: str) -> str:
     """Validates the given filepath to allow to adjust files to the package
-    path as well as loading files from the relative bot files."""
+    path as well as loading files from the relative bot files.
+
+    A file at the given path wins over the package asset of the same name,
+    otherwise assets of the package are resolved through the asset manifest
+    and any other path is checked relative to the package."""
     if os.path.exists(filepath):
         return filepath.replace("/", "\\")
 
+    if (asset := resolve_asset(filepath)) is not None:
+        return asset
+
     abs_path = os.path.join(str(Path(__file__).parent), filepath)
     if not os.path.exists(abs_path):
         raise FileNotFoundError(f"Could not find {filepath} anywhere.")
@@ -50,66 +55,171 @@ def yes_no(boolean_value: bool) -> str:
     return ["No", "Yes"][boolean_value]
 
 
-def threaded(name: str):
-    """Threads a function, beware that it will lose its return values"""
+def threaded(name: str, max_workers: Optional[int] = None):
+    """Runs a function in the task pool of the given name, calling it returns
+    the `Future` of its result."""
 
     def outer(func: Callable):
         @functools.wraps(func)
-        def inner(*args, **kwargs):
-            thread = Thread(target=func, name=name, args=args, kwargs=kwargs)
-            thread.start()
+        def inner(*args, **kwargs) -> Future:
+            return get_pool(name, max_workers).submit(func, *args, **kwargs)
 
         return inner
 
     return outer
 
 
+@dataclass
+class WaitStats:
+    """Timing statistics of the waits on a single predicate.
+
+    Attributes
+    ----------
+    name :class:`str`:
+        The qualified name of the awaited predicate
+
+    calls :class:`int`:
+        How often the predicate was awaited
+
+    timeouts :class:`int`:
+        How many of the waits timed out
+
+    evaluations :class:`int`:
+        How often the predicate was evaluated across all waits
+
+    total :class:`float`:
+        The total time spent waiting in seconds
+
+    longest :class:`float`:
+        The longest single wait in seconds
+    """
+
+    name: str
+    calls: int = 0
+    timeouts: int = 0
+    evaluations: int = 0
+    total: float = 0
+    longest: float = 0
+
+    @property
+    def average(self) -> float:
+        return self.total / self.calls if self.calls else 0
+
+
+_WAIT_STATS: dict[str, WaitStats] = {}
+_WAIT_STATS_LOCK = Lock()
+_PREDICATE_INFO: dict[Any, tuple[str, Any]] = {}
+
+
+def wait_stats() -> dict[str, WaitStats]:
+    """Returns a snapshot of the timing statistics of all awaited predicates,
+    keyed by the qualified name of the predicate."""
+    with _WAIT_STATS_LOCK:
+        return {name: replace(stats) for name, stats in _WAIT_STATS.items()}
+
+
+def reset_wait_stats() -> None:
+    with _WAIT_STATS_LOCK:
+        _WAIT_STATS.clear()
+
+
+def _get_predicate_info(func: Callable) -> tuple[str, Any]:
+    """Returns the name and return annotation of a predicate, cached by its
+    code so bound methods and lambdas are only inspected once."""
+    key = getattr(getattr(func, "__func__", func), "__code__", None)
+    if key is not None and key in _PREDICATE_INFO:
+        return _PREDICATE_INFO[key]
+
+    name = getattr(func, "__qualname__", repr(func))
+    info = name, signature(func).return_annotation
+    if key is not None:
+        _PREDICATE_INFO[key] = info
+    return info
+
+
 def await_event(
     func: Callable,
     expected_return_value: Any = True,
     max_duration: int | float = 5,
     ignore_annotation: bool = False,
+    trigger: Optional[Callable[[], Any]] = None,
 ) -> bool:
     """Awaits for the given function to return an expected value.
     Returns whether the function returned the value in the expected time.
-    """
-
-    @state_checker
-    def sleep(s):
-        time.sleep(s)
 
-    if not func.__name__ == "<lambda>":
-        log_str = f"Awaiting function '{func.__name__}' "
-    else:
-        log_str = f"Awaiting function '{func.__qualname__}' "
-    if hasattr(func, "__self__"):
-        log_str += f"of '{type(func.__self__).__name__}' "
-    log_str += f"to return '{expected_return_value}' within {max_duration}s"
-    # print(log_str)
-
-    return_type = signature(func).return_annotation
+    The function is polled in short intervals at first, which grow the
+    longer the wait takes. If a `trigger` is passed, the function is only
+    evaluated again once the value of the trigger changes, i.e a signature
+    of the screen region the function checks.
+    """
+    name, return_type = _get_predicate_info(func)
     assert (
         return_type == type(expected_return_value) or ignore_annotation
     ), "Functions return type does not match expected return type."
 
-    counter = 0
-    while not func() == expected_return_value:
-        counter += 1
-        sleep(0.05)
+    start = time.monotonic()
+    deadline = start + max_duration
+    interval = config.AWAIT_MIN_POLL
+    evaluations = 0
+    last_trigger: Any = None
+    result = False
+
+    while True:
+        changed = True
+        if trigger is not None:
+            current = trigger()
+            changed = evaluations == 0 or not _equals(current, last_trigger)
+            last_trigger = current
+
+        if changed:
+            evaluations += 1
+            if func() == expected_return_value:
+                result = True
+                break
+            if trigger is not None:
+                # the region just changed, it may well keep changing
+                interval = config.AWAIT_MIN_POLL
+
+        now = time.monotonic()
+        if now >= deadline:
+            break
+        current_token().sleep(min(interval, deadline - now))
+        interval = min(interval * config.AWAIT_BACKOFF, config.AWAIT_MAX_POLL)
+
+    _record_wait(name, time.monotonic() - start, evaluations, result)
+    return result
+
+
+def _equals(a: Any, b: Any) -> bool:
+    if hasattr(a, "shape") or hasattr(b, "shape"):
+        return a is not None and b is not None and a.shape == b.shape and (a == b).all()
+    return a == b
 
-        if (counter / 20) > max_duration:
-            return False
-    return True
+
+def _record_wait(name: str, duration: float, evaluations: int, result: bool) -> None:
+    with _WAIT_STATS_LOCK:
+        stats = _WAIT_STATS.get(name)
+        if stats is None:
+            stats = _WAIT_STATS[name] = WaitStats(name)
+        stats.calls += 1
+        stats.timeouts += not result
+        stats.evaluations += evaluations
+        stats.total += duration
+        stats.longest = max(stats.longest, duration)
 
 
 def ark_is_running() -> bool:
     """Checks if the passed process is running"""
+    import psutil  # type: ignore[import]
+
     return "ARK: Survival Evolved" in [
         process.name() for process in psutil.process_iter()
     ]
 
 
 def close_ark() -> None:
+    import psutil  # type: ignore[import]
+
     for process in psutil.process_iter():
         if process.name() == "ARK: Survival Evolved":
             process.kill()
@@ -157,6 +267,8 @@ def filter_points(points: set, minimum_distance: int) -> set:
 
 def set_clipboard(text):
     """Puts the passed text into the clipboard to allow for pasting"""
+    import win32clipboard  # type: ignore[import]
+
     win32clipboard.OpenClipboard()
     win32clipboard.EmptyClipboard()
     win32clipboard.SetClipboardText(text, win32clipboard.CF_TEXT)
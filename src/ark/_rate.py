@@ -0,0 +1,104 @@
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Optional
+
+from . import config
+from .state import current_token
+
+
+@dataclass
+class TransferRate:
+    """The learned transfer rate of a single kind of transfer.
+
+    Attributes
+    ----------
+    interval :class:`float`:
+        The current minimum gap between two transfers in seconds
+
+    floor :class:`float`:
+        The smallest interval the rate may tighten to
+
+    ceiling :class:`float`:
+        The largest interval the rate may back off to
+
+    latency :class:`float` [Optional]:
+        The smoothed time the server took to acknowledge a transfer
+    """
+
+    interval: float
+    floor: float
+    ceiling: float
+    latency: Optional[float] = None
+    last_sent: Optional[float] = None
+
+
+class TransferRateController:
+    """Paces transfers based on how fast the server acknowledges them.
+
+    Each kind of transfer (i.e transferring all out of a certain inventory
+    type) has its own rate. Every acknowledged transfer tightens the interval
+    by a small step, a transfer that was not acknowledged in time multiplies
+    it instead. The interval never drops below the observed latency, so a
+    slow server is not flooded with transfers it has not processed yet.
+    """
+
+    def __init__(self) -> None:
+        self._rates: dict[str, TransferRate] = {}
+        self._lock = Lock()
+
+    def register(self, key: str, interval: float, floor: float, ceiling: float) -> None:
+        """Registers a kind of transfer, does nothing if it already exists."""
+        with self._lock:
+            if key not in self._rates:
+                self._rates[key] = TransferRate(interval, floor, ceiling)
+
+    def get(self, key: str) -> TransferRate:
+        return self._rates[key]
+
+    def interval(self, key: str) -> float:
+        return self._rates[key].interval
+
+    def remaining(self, key: str) -> float:
+        """Returns how long to wait before the next transfer may be sent."""
+        rate = self._rates[key]
+        if rate.last_sent is None:
+            return 0
+        return max(0, rate.last_sent + rate.interval - time.monotonic())
+
+    def wait(self, key: str) -> None:
+        """Waits until the next transfer of the given kind may be sent."""
+        while (remaining := self.remaining(key)) > 0:
+            current_token().sleep(remaining)
+
+    def sent(self, key: str) -> None:
+        """Marks a transfer of the given kind as sent."""
+        self._rates[key].last_sent = time.monotonic()
+
+    def since_sent(self, key: str) -> float:
+        """Returns the time since the last transfer was sent."""
+        rate = self._rates[key]
+        if rate.last_sent is None:
+            return float("inf")
+        return time.monotonic() - rate.last_sent
+
+    def acknowledged(self, key: str) -> None:
+        """Marks the last transfer as acknowledged, tightening the interval."""
+        with self._lock:
+            rate = self._rates[key]
+            latency = self.since_sent(key)
+            if rate.latency is None:
+                rate.latency = latency
+            else:
+                smoothing = config.TRANSFER_LATENCY_SMOOTHING
+                rate.latency += smoothing * (latency - rate.latency)
+
+            interval = rate.interval - config.TRANSFER_RATE_STEP * rate.interval
+            lower = max(rate.floor, rate.latency * config.TRANSFER_LATENCY_MARGIN)
+            rate.interval = min(rate.ceiling, max(lower, interval))
+
+    def missed(self, key: str) -> None:
+        """Marks the last transfer as not acknowledged, backing off the interval."""
+        with self._lock:
+            rate = self._rates[key]
+            rate.interval = min(rate.ceiling, rate.interval * config.TRANSFER_BACKOFF)
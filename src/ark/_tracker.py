@@ -0,0 +1,120 @@
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Optional
+
+import numpy as np
+
+from . import config
+
+
+@dataclass
+class InterfaceState:
+    """The last verified state of an interface.
+
+    Attributes
+    ----------
+    open :class:`bool`:
+        Whether the interface was open when it was last verified
+
+    verified :class:`float`:
+        The monotonic time the state was last verified at
+
+    sentinel :class:`np.ndarray`:
+        The pixels of the sentinel area when the state was verified
+    """
+
+    open: bool
+    verified: float
+    sentinel: np.ndarray
+
+
+class InterfaceTracker:
+    """Keeps track of which interfaces are open.
+
+    Every full check that finds an interface open records it together with a
+    few pixels of a sentinel area within the interface. A cached check only
+    repeats the full check once the state is older than the recheck interval
+    or the sentinel pixels have changed, otherwise the recorded state is
+    trusted. The sentinel is only grabbed when a state is recorded or
+    compared, so probing a closed interface in a loop costs no extra grabs.
+
+    Parameters
+    ----------
+    grab :class:`Callable`:
+        Grabs a region of the screen, usually `ArkWindow.grab_screen`
+    """
+
+    # size of the sentinel patch taken from the center of a region
+    _SENTINEL_SIZE = (8, 4)
+
+    def __init__(self, grab: Callable) -> None:
+        self._grab = grab
+        self._states: dict[str, InterfaceState] = {}
+        self._lock = Lock()
+
+    def check(
+        self,
+        key: str,
+        probe: Callable[[], bool],
+        region: tuple[int, int, int, int],
+        cached: bool = False,
+    ) -> bool:
+        """Checks whether an interface is open.
+
+        Parameters
+        ----------
+        key :class:`str`:
+            The key the state of the interface is tracked by
+
+        probe :class:`Callable[[], bool]`:
+            The full check of the interface, i.e a template match
+
+        region :class:`tuple[int, int, int, int]`:
+            The region the probe checks, the sentinel is taken from its center
+
+        cached :class:`bool`:
+            Whether a recorded state may be used instead of probing
+        """
+        state = self._states.get(key)
+        if cached and state is not None and not self._expired(state):
+            sentinel = self._grab_sentinel(region)
+            if self._matches(state, sentinel):
+                return state.open
+
+        is_open = probe()
+        # the sentinel of a closed interface shows the game behind it, which
+        # rarely stays the same, so only open interfaces are recorded
+        with self._lock:
+            if is_open:
+                sentinel = self._grab_sentinel(region)
+                self._states[key] = InterfaceState(is_open, time.monotonic(), sentinel)
+            else:
+                self._states.pop(key, None)
+        return is_open
+
+    def get(self, key: str) -> Optional[InterfaceState]:
+        return self._states.get(key)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Forgets the state of the given interface, or of all interfaces."""
+        with self._lock:
+            if key is None:
+                self._states.clear()
+            else:
+                self._states.pop(key, None)
+
+    def _expired(self, state: InterfaceState) -> bool:
+        return time.monotonic() - state.verified > config.INTERFACE_RECHECK_INTERVAL
+
+    def _matches(self, state: InterfaceState, sentinel: np.ndarray) -> bool:
+        if state.sentinel.shape != sentinel.shape:
+            return False
+        diff = np.abs(state.sentinel.astype(np.int16) - sentinel).mean()
+        return diff <= config.INTERFACE_SENTINEL_TOLERANCE
+
+    def _grab_sentinel(self, region: tuple[int, int, int, int]) -> np.ndarray:
+        x, y, w, h = region
+        sw, sh = self._SENTINEL_SIZE
+        area = (x + (w - sw) // 2, y + (h - sh) // 2, sw, sh)
+        return np.array(self._grab(area))[..., :3]
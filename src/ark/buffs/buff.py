@@ -1,4 +1,3 @@
-import os
 from dataclasses import dataclass
 
 from .._helpers import get_filepath
@@ -11,6 +10,4 @@ class Buff:
 
 
     def __post_init__(self) -> None:
-        self.image = get_filepath(self.image)
-
-        assert os.path.exists(self.image), f"Path not found: {self.image}"
\ No newline at end of file
+        self.image = get_filepath(self.image)
\ No newline at end of file
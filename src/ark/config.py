@@ -2,4 +2,38 @@ INVENTORY_OPEN_INTERVAL: int | float = 5
 INVENTORY_CLOSE_INTERVAL: int | float = 5
 TIMER_FACTOR: int | float = 1
 ARK_PATH: str = "F:\ARKSurvivalEvolved"
-TESSERACT_PATH: str = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
\ No newline at end of file
+TESSERACT_PATH: str = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
+
+# bounds of the adaptive transfer intervals in seconds
+TRANSFER_ALL_FLOOR: int | float = 1
+TRANSFER_ALL_CEILING: int | float = 10
+TRANSFER_SWEEP_FLOOR: int | float = 0.05
+TRANSFER_SWEEP_CEILING: int | float = 1
+TRANSFER_TOOL_FLOOR: int | float = 0.5
+TRANSFER_TOOL_CEILING: int | float = 5
+# fraction an interval tightens by per acknowledged transfer
+TRANSFER_RATE_STEP: float = 0.1
+# factor an interval backs off by per transfer that was not acknowledged
+TRANSFER_BACKOFF: float = 2
+# weight of the newest latency sample and how far the interval stays above it
+TRANSFER_LATENCY_SMOOTHING: float = 0.3
+TRANSFER_LATENCY_MARGIN: float = 1.5
+
+# seconds an interface state is trusted for, and how much its sentinel pixels
+# may change on average before the state is checked again
+INTERFACE_RECHECK_INTERVAL: int | float = 2
+INTERFACE_SENTINEL_TOLERANCE: int | float = 12
+
+# polling interval bounds of `await_event` and how fast it backs off
+AWAIT_MIN_POLL: float = 0.01
+AWAIT_MAX_POLL: float = 0.2
+AWAIT_BACKOFF: float = 1.5
+
+# default amount of workers of a task pool, and of the pool tooltips are OCR'd in
+EXECUTOR_WORKERS: int = 4
+OCR_WORKERS: int = 2
+
+# how often the settings watcher checks the .ini files, and how long a change
+# has to settle before the files are parsed again
+SETTINGS_POLL_INTERVAL: float = 0.5
+SETTINGS_DEBOUNCE: float = 0.25
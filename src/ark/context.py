@@ -0,0 +1,139 @@
+import time
+from contextlib import contextmanager
+from threading import local
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from ._rate import TransferRateController
+from ._tracker import InterfaceTracker
+from .state import StateToken, bind_token
+
+if TYPE_CHECKING:
+    from pynput.mouse import Controller  # type: ignore[import]
+
+    from .settings import InputSettings, UserSettings
+    from .window import ArkWindow
+
+
+class ArkContext:
+    """Holds everything needed to drive a single game client.
+
+    Every `Ark` object uses the context that is active in its thread unless
+    it was created with a context of its own, so one process can drive
+    several clients by giving each of them a context. Immutable resources
+    such as templates are shared between all contexts.
+
+    Parameters
+    ----------
+    window :class:`ArkWindow` [Optional]:
+        The window of the client, created when the first `Ark` object is
+
+    keybinds :class:`InputSettings` [Optional]:
+        The keybinds of the client, loaded when the first `Ark` object is created
+
+    settings :class:`UserSettings` [Optional]:
+        The settings of the client, loaded when the first `Ark` object is created
+
+    mouse :class:`Controller` [Optional]:
+        The mouse input backend, created when it is first used
+
+    token :class:`StateToken` [Optional]:
+        The token to pause and cancel the client with, if not passed the token
+        bound to the current thread is used
+
+    name :class:`str` [Optional]:
+        A name to identify the context by
+    """
+
+    def __init__(
+        self,
+        window: Optional["ArkWindow"] = None,
+        keybinds: Optional["InputSettings"] = None,
+        settings: Optional["UserSettings"] = None,
+        mouse: Optional["Controller"] = None,
+        token: Optional[StateToken] = None,
+        name: str = "",
+    ) -> None:
+        self.name = name
+        self.window = window
+        self.keybinds = keybinds
+        self.settings = settings
+        self._mouse = mouse
+        self.token = token
+
+        self.tracker = InterfaceTracker(lambda region: self.window.grab_screen(region))
+        self.transfer_rate = TransferRateController()
+        self.last_interface_exit: Optional[float] = None
+        self.last_view_changed: Optional[float] = None
+        self.last_transfer_all: float = time.time()
+
+    @property
+    def mouse(self) -> "Controller":
+        # pynput loads its platform backend on import
+        if self._mouse is None:
+            from pynput.mouse import Controller  # type: ignore[import]
+
+            self._mouse = Controller()
+        return self._mouse
+
+    @mouse.setter
+    def mouse(self, mouse: "Controller") -> None:
+        self._mouse = mouse
+
+    def __repr__(self) -> str:
+        return f"ArkContext(name={self.name!r}, window={self.window})"
+
+    @contextmanager
+    def activate(self) -> Iterator["ArkContext"]:
+        """Makes this the active context of the current thread for the
+        duration of the block, binding its token to the thread as well."""
+        prev = getattr(_active, "context", None)
+        _active.context = self
+        try:
+            if self.token is None:
+                yield self
+            else:
+                with bind_token(self.token):
+                    yield self
+        finally:
+            if prev is None:
+                del _active.context
+            else:
+                _active.context = prev
+
+
+DEFAULT_CONTEXT = ArkContext(name="default")
+_active = local()
+
+
+def current_context() -> ArkContext:
+    """Returns the context active in the current thread, the default
+    context if no context has been activated."""
+    return getattr(_active, "context", DEFAULT_CONTEXT)
+
+
+class ContextAttribute:
+    """Resolves an attribute of `Ark` objects through their context.
+
+    Accessed on an object it uses the context of the object, accessed on
+    the class it uses the active context, so `Ark.window` keeps working.
+
+    Parameters
+    ----------
+    name :class:`str` [Optional]:
+        The name of the attribute on the context, the attribute name by default
+    """
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        self._name = name
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        if self._name is None:
+            self._name = name
+
+    def __get__(self, obj: Any, owner: Optional[type] = None) -> Any:
+        context = getattr(obj, "_context", None) or current_context()
+        return getattr(context, self._name)
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        context = getattr(obj, "_context", None) or current_context()
+        setattr(context, self._name, value)
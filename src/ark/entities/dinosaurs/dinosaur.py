@@ -1,13 +1,19 @@
+from typing import Optional
+
 from ..._ark import Ark
+from ...context import ArkContext
 from ...exceptions import DinoNotMountedError, InventoryNotAccessibleError, WheelError
-from ...interfaces import ActionWheel, Inventory
+from ...interfaces.inventories import Inventory
+from ...interfaces.wheels import ActionWheel
 
 class Dinosaur(Ark):
-    def __init__(self, entity_name, wheel) -> None:
-        super().__init__()
+    def __init__(
+        self, entity_name, wheel, *, context: Optional[ArkContext] = None
+    ) -> None:
+        super().__init__(context=context)
         self.name = entity_name
-        self.inventory = Inventory(entity_name)
-        self.action_wheel = ActionWheel(entity_name, wheel)
+        self.inventory = Inventory(entity_name, context=self._context)
+        self.action_wheel = ActionWheel(entity_name, wheel, context=self._context)
 
     def access(self) -> None:
         """Wraps the inventory `open` function using the action wheel to
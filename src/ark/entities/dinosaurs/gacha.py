@@ -1,7 +1,9 @@
+from typing import Optional
 
+from ...context import ArkContext
 from .dinosaur import Dinosaur
 
 
 class Gacha(Dinosaur):
-    def __init__(self, name: str) -> None:
-        super().__init__(name, "assets/wheels/gacha.png")
\ No newline at end of file
+    def __init__(self, name: str, *, context: Optional[ArkContext] = None) -> None:
+        super().__init__(name, "assets/wheels/gacha.png", context=context)
@@ -1,15 +1,18 @@
+from typing import Optional
+
 import cv2 as cv  # type: ignore[import]
 import numpy as np
 import pydirectinput as input  # type: ignore[import]
 
+from ...context import ArkContext
 from .dinosaur import Dinosaur
 
 
 class Stryder(Dinosaur):
     """Represents a stryder in ark, used for resource logistics."""
 
-    def __init__(self) -> None:
-        super().__init__("Tek Stryder", "assets/wheels/stryder.png")
+    def __init__(self, *, context: Optional[ArkContext] = None) -> None:
+        super().__init__("Tek Stryder", "assets/wheels/stryder.png", context=context)
 
     def find_dedi_transfer_tab(self) -> tuple | None:
         """Finds the dedi transfer tab by denoising for the orange text.
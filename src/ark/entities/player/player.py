@@ -4,11 +4,12 @@ from typing import Iterable, Literal, Optional, overload
 import pyautogui as pg  # type: ignore[import]
 import pydirectinput as input  # type: ignore[import]
 
-from ark.state import State
+from ark.state import current_token
 from ..._ark import Ark
 from ..._helpers import await_event, timedout
 from ...buffs import BROKEN_BONES, HUNGRY, THIRSTY, Buff
-from ...exceptions import PlayerDidntTravelError, PlayerDiedError, TerminatedError
+from ...context import ArkContext
+from ...exceptions import PlayerDidntTravelError, PlayerDiedError
 from ...interfaces.hud_info import HUDInfo
 from ...interfaces.inventories import Inventory, PlayerInventory
 from ...interfaces.structures.structure import Structure
@@ -42,21 +43,43 @@ class Player(Ark):
     _STAM_BAR = (1850, 955, 70, 65)
 
     @overload
-    def __init__(self, *, stats: Stats) -> None: ...
+    def __init__(
+        self, *, stats: Stats, context: Optional[ArkContext] = None
+    ) -> None: ...
 
     @overload
-    def __init__(self, health: int, food: int, water: int, weight: int) -> None: ...
+    def __init__(
+        self,
+        health: int,
+        food: int,
+        water: int,
+        weight: int,
+        *,
+        context: Optional[ArkContext] = None,
+    ) -> None: ...
 
     def __init__(
-        self, health=None, food=None, water=None, weight=None, *, stats=None
+        self,
+        health=None,
+        food=None,
+        water=None,
+        weight=None,
+        *,
+        stats=None,
+        context: Optional[ArkContext] = None,
     ) -> None:
-        super().__init__()
-        self.inventory = PlayerInventory()
+        super().__init__(context=context)
+        self.inventory = PlayerInventory(context=self._context)
         if stats is not None:
             self.stats = stats
         else:
             self.stats = Stats(health, food, water, weight)
-        self.HOTBAR = [
+        self.hud = HUDInfo(context=self._context)
+
+    # derived from the current settings so a reload of the settings applies
+    @property
+    def HOTBAR(self) -> list[str]:
+        return [
             self.keybinds.hotbar_1,
             self.keybinds.hotbar_2,
             self.keybinds.hotbar_3,
@@ -68,10 +91,18 @@ class Player(Ark):
             self.keybinds.hotbar_9,
             self.keybinds.hotbar_0,
         ]
-        self.hud = HUDInfo()
-        self._lr_factor = 3.2 / self.settings.left_right_sens
-        self._ud_factor = 3.2 / self.settings.up_down_sens
-        self._fov_factor = 1.25 / self.settings.fov_multiplier
+
+    @property
+    def _lr_factor(self) -> float:
+        return 3.2 / self.settings.left_right_sens
+
+    @property
+    def _ud_factor(self) -> float:
+        return 3.2 / self.settings.up_down_sens
+
+    @property
+    def _fov_factor(self) -> float:
+        return 1.25 / self.settings.fov_multiplier
 
     def turn_90_degrees(
         self, direction: Literal["right", "left"] = "right", delay: int | float = 0
@@ -108,7 +139,7 @@ class Player(Ark):
             False,
             True,
         )
-        Ark.last_view_changed = time.time()
+        self.context.last_view_changed = time.time()
         self.sleep(delay)
 
     def turn_x_by(self, amount: int, delay: int | float = 0.1) -> None:
@@ -126,7 +157,7 @@ class Player(Ark):
             False,
             True,
         )
-        Ark.last_view_changed = time.time()
+        self.context.last_view_changed = time.time()
         self.sleep(delay)
 
     def turn_by(self, x, y, delay: int | float = 0.1) -> None:
@@ -146,7 +177,7 @@ class Player(Ark):
             False,
             True,
         )
-        Ark.last_view_changed = time.time()
+        self.context.last_view_changed = time.time()
         self.sleep(delay)
 
     def attack(self) -> None:
@@ -173,8 +204,7 @@ class Player(Ark):
         try:
             for kb in self.HOTBAR:
                 pg.press(kb)
-            if not State.running:
-                raise TerminatedError
+            current_token().check()
         finally:
             pg.PAUSE = prev
 
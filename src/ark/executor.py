@@ -0,0 +1,226 @@
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from threading import Lock
+from typing import Any, Callable, Literal, Optional
+
+from . import config
+from .context import current_context
+from .state import bind_token, current_token
+
+
+@dataclass
+class PoolMetrics:
+    """Metrics of a task pool to help size it for the workload.
+
+    Attributes
+    ----------
+    name :class:`str`:
+        The name of the pool
+
+    submitted :class:`int`:
+        How many tasks have been submitted to the pool
+
+    completed :class:`int`:
+        How many tasks have completed successfully
+
+    failed :class:`int`:
+        How many tasks have raised an exception or were cancelled
+
+    queued :class:`int`:
+        How many tasks are waiting for a worker right now
+
+    running :class:`int`:
+        How many tasks are being worked on right now
+
+    queue_time :class:`float`:
+        The total time tasks have spent waiting for a worker in seconds
+
+    run_time :class:`float`:
+        The total time tasks have spent running in seconds
+    """
+
+    name: str
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    queued: int = 0
+    running: int = 0
+    queue_time: float = 0
+    run_time: float = 0
+
+    @property
+    def average_queue_time(self) -> float:
+        finished = self.completed + self.failed
+        return self.queue_time / finished if finished else 0
+
+    @property
+    def average_run_time(self) -> float:
+        finished = self.completed + self.failed
+        return self.run_time / finished if finished else 0
+
+
+class TaskPool:
+    """A named pool with a bounded amount of workers that returns a `Future`
+    for every submitted task, exceptions raised by a task are set on its
+    future rather than being lost.
+
+    Tasks of a thread pool run with the state token and context that were
+    active when they were submitted, so pausing or cancelling the submitting
+    bot pauses or cancels its tasks as well. Tasks of a process pool can only
+    be cancelled before they have started.
+
+    Parameters
+    ----------
+    name :class:`str`:
+        The name of the pool, its threads are named after it
+
+    max_workers :class:`int`:
+        The maximum amount of tasks to run at once
+
+    kind :class:`str`:
+        Whether to run the tasks in threads or in processes
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        kind: Literal["thread", "process"] = "thread",
+    ) -> None:
+        self.name = name
+        self.kind = kind
+        self.max_workers = max_workers
+        self._metrics = PoolMetrics(name)
+        self._lock = Lock()
+
+        self._executor: Executor
+        if kind == "thread":
+            self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix=name)
+        else:
+            self._executor = ProcessPoolExecutor(max_workers)
+
+    def __repr__(self) -> str:
+        return f"TaskPool(name={self.name!r}, kind={self.kind!r}, max_workers={self.max_workers})"
+
+    @property
+    def metrics(self) -> PoolMetrics:
+        """A snapshot of the metrics of the pool."""
+        with self._lock:
+            return replace(self._metrics)
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Submits a task to the pool, returns the `Future` of its result.
+
+        Raises
+        ------
+        `TerminatedError`
+            If the state token of the calling thread has been cancelled
+        """
+        token = current_token()
+        token.check()
+        submitted = time.monotonic()
+        started: list[float] = []
+
+        with self._lock:
+            self._metrics.submitted += 1
+            self._metrics.queued += 1
+
+        if self.kind == "thread":
+            context = current_context()
+
+            def run() -> Any:
+                self._start(submitted, started)
+                token.check()
+                with context.activate(), bind_token(token):
+                    return fn(*args, **kwargs)
+
+            future = self._executor.submit(run)
+        else:
+            # the token can not be shared with another process and the start of
+            # the task can not be observed, it counts as running once submitted
+            future = self._executor.submit(fn, *args, **kwargs)
+            self._start(submitted, started)
+
+        future.add_done_callback(lambda f: self._finish(f, submitted, started))
+        return future
+
+    def map(self, fn: Callable, *iterables) -> list[Future]:
+        """Submits a task for each set of arguments, returns their futures."""
+        return [self.submit(fn, *args) for args in zip(*iterables)]
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_pending)
+
+    def _start(self, submitted: float, started: list[float]) -> None:
+        now = time.monotonic()
+        started.append(now)
+        with self._lock:
+            self._metrics.queued -= 1
+            self._metrics.running += 1
+            self._metrics.queue_time += now - submitted
+
+    def _finish(self, future: Future, submitted: float, started: list[float]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if started:
+                self._metrics.running -= 1
+                self._metrics.run_time += now - started[0]
+            else:
+                # cancelled before it was ever picked up
+                self._metrics.queued -= 1
+                self._metrics.queue_time += now - submitted
+
+            if future.cancelled() or future.exception() is not None:
+                self._metrics.failed += 1
+            else:
+                self._metrics.completed += 1
+
+
+_POOLS: dict[str, TaskPool] = {}
+_POOLS_LOCK = Lock()
+
+
+def get_pool(
+    name: str,
+    max_workers: Optional[int] = None,
+    kind: Literal["thread", "process"] = "thread",
+) -> TaskPool:
+    """Returns the pool of the given name, creating it if it does not exist yet.
+
+    Parameters
+    ----------
+    name :class:`str`:
+        The name of the pool
+
+    max_workers :class:`int` [Optional]:
+        The maximum amount of workers if the pool has to be created,
+        `config.EXECUTOR_WORKERS` by default
+
+    kind :class:`str`:
+        Whether the pool runs its tasks in threads or in processes
+    """
+    with _POOLS_LOCK:
+        pool = _POOLS.get(name)
+        if pool is None:
+            pool = TaskPool(name, max_workers or config.EXECUTOR_WORKERS, kind)
+            _POOLS[name] = pool
+        elif pool.kind != kind:
+            raise ValueError(f"Pool '{name}' is a {pool.kind} pool, not a {kind} pool.")
+        return pool
+
+
+def pool_metrics() -> dict[str, PoolMetrics]:
+    """Returns a snapshot of the metrics of all pools, keyed by their name."""
+    with _POOLS_LOCK:
+        return {name: pool.metrics for name, pool in _POOLS.items()}
+
+
+def shutdown_pools(wait: bool = True) -> None:
+    """Shuts down all pools, cancelling the tasks that have not started yet."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+
+    for pool in pools:
+        pool.shutdown(wait=wait, cancel_pending=True)
@@ -0,0 +1,51 @@
+import numpy as np
+
+from .._ark import Ark
+from ..window import ArkWindow
+
+# the popup listing what was added to an inventory, it stays up for a few seconds
+ADDED_TEMPLATE = f"{Ark.PKG_DIR}/assets/templates/added.png"
+
+# pixels that have to brighten by the given amount for a new popup, a popup
+# that was already visible only darkens as it fades out
+_BRIGHTENED_PIXELS = 40
+_BRIGHTENED_BY = 60
+
+
+def added_popup_visible(
+    window: ArkWindow, region: tuple[int, int, int, int], confidence: float = 0.7
+) -> bool:
+    """Checks whether an added popup is visible within the region."""
+    return window.locate_template(ADDED_TEMPLATE, region, confidence) is not None
+
+
+def capture_added_region(
+    window: ArkWindow, region: tuple[int, int, int, int]
+) -> np.ndarray:
+    """Captures the area of the added popups, to tell a popup that appears
+    afterwards apart from one that was already visible."""
+    return np.asarray(window.grab_screen(region))[..., :3].astype(np.int16)
+
+
+def new_added_popup(
+    window: ArkWindow,
+    region: tuple[int, int, int, int],
+    before: np.ndarray,
+    confidence: float = 0.7,
+) -> bool:
+    """Checks whether an added popup is visible that was not yet visible when
+    the given capture was taken.
+
+    Parameters
+    ----------
+    before :class:`np.ndarray`:
+        The capture of the region from `capture_added_region`
+    """
+    current = capture_added_region(window, region)
+    if current.shape != before.shape:
+        return added_popup_visible(window, region, confidence)
+
+    brightened = (current - before).max(axis=-1) > _BRIGHTENED_BY
+    if np.count_nonzero(brightened) < _BRIGHTENED_PIXELS:
+        return False
+    return added_popup_visible(window, region, confidence)
@@ -51,8 +51,12 @@ class HUDInfo(Ark):
         if is_open() != enabled:
             pyautogui.press(self.keybinds.toggle_hud)
 
-    def is_open(self) -> bool:
-        """Returns whether the HUD info interface is open."""
+    def is_open(self, cached: bool = False) -> bool:
+        """Returns whether the HUD info interface is open. If `cached` is set,
+        a recent result is trusted as long as the day display looks the same."""
+        return self.tracker.check("hud_info", self._check_open, self._DAY_REGION, cached)
+
+    def _check_open(self) -> bool:
         return (
             self.window.locate_template(
                 f"{self.PKG_DIR}/assets/interfaces/day.png",
@@ -2,5 +2,6 @@ from .crop_plot_inventory import CropPlotInventory
 from .dedi_inventory import DedicatedStorageInventory
 from .inventory import Inventory
 from .player_inventory import PlayerInventory
+from ._scan import SlotScan
 
-__all__ = ("Inventory", "DedicatedStorageInventory", "PlayerInventory", "CropPlotInventory")
+__all__ = ("Inventory", "DedicatedStorageInventory", "PlayerInventory", "CropPlotInventory", "SlotScan")
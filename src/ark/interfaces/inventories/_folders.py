@@ -0,0 +1,32 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass
+class FolderMap:
+    """Represents the folders in the first rows of an inventory, read from
+    a single capture of those rows.
+
+    Attributes
+    ----------
+    frame :class:`np.ndarray`:
+        The captured rows, the folder names are read from it on demand
+
+    rows :class:`int`:
+        The amount of rows that were captured
+
+    slots :class:`tuple[int, ...]`:
+        The slots that contain a folder, in ascending order
+
+    names :class:`dict[int, str]`:
+        The names of the folders that have been read so far
+    """
+
+    frame: np.ndarray
+    rows: int
+    slots: tuple[int, ...]
+    names: dict[int, str] = field(default_factory=dict)
+
+    def __contains__(self, slot: int) -> bool:
+        return slot in self.slots
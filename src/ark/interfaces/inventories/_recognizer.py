@@ -0,0 +1,185 @@
+from typing import Iterable, Optional
+
+import cv2 as cv  # type: ignore[import]
+import numpy as np
+
+from ..._atlas import get_template
+from ...items import Item, get_registry
+
+
+class ItemRecognizer:
+    """Recognizes the items in a batch of inventory slot tiles.
+
+    Each item icon of the catalog is reduced to a small, normalized descriptor
+    once. The tiles are described the same way at a range of offsets, since
+    an icon is not always centered in its slot, so all tiles can be compared
+    against all icons through a single correlation matrix. The best candidates
+    of each tile are then verified by a template match on the tile itself.
+    Tiles whose best descriptor score is too low are not verified at all,
+    most items in an inventory are usually not in the catalog.
+
+    Items that share an icon can not be told apart, a tile showing such an
+    icon is recognized as the first of these items in the catalog.
+
+    Parameters
+    ----------
+    catalog :class:`Iterable[Item]` [Optional]:
+        The items to recognize, all items of the item registry by default
+    """
+
+    # center area of a tile / icon that is described, and the descriptor size
+    _CROP = 64
+    _SIZE = 16
+    # the most pixels an icon may be off the tile center, and the step size
+    _SHIFT = 8
+    _STEP = 2
+    _CANDIDATES = 5
+    # descriptor score a candidate needs to be verified, any catalog icon
+    # scores above it on its own tile at every offset
+    _MIN_SCORE = 0.65
+
+    def __init__(self, catalog: Optional[Iterable[Item]] = None) -> None:
+        if catalog is None:
+            catalog = get_registry()
+        self._catalog = list({item.name: item for item in catalog}.values())
+
+        # items sharing an icon only need to be described and verified once
+        by_icon: dict[str, Item] = {}
+        for item in self._catalog:
+            by_icon.setdefault(item.inventory_icon, item)
+        self._unique = list(by_icon.values())
+        self._icons = [self._load_icon(item.inventory_icon) for item in self._unique]
+
+        # only the blocks that lie within an icon are part of its descriptor
+        block = self._CROP // self._SIZE
+        descriptors, masks = [], []
+        for icon in self._icons:
+            h, w = (min(d, self._CROP) for d in icon.shape[:2])
+            y, x = (self._CROP - h) // 2, (self._CROP - w) // 2
+            mask = np.zeros((self._SIZE, self._SIZE), dtype=np.float32)
+            top, left = -(-y // block), -(-x // block)
+            mask[top : (y + h) // block, left : (x + w) // block] = 1
+
+            small = self._blocks(self._center(icon, self._CROP)[None], 0)[0, 0]
+            small = (small - small[mask > 0].mean()) * mask
+            descriptors.append(small.ravel() / max(np.linalg.norm(small), 1e-6))
+            masks.append(mask.ravel())
+        self._descriptors = np.stack(descriptors)
+        self._masks = np.stack(masks)
+        self._mask_sizes = self._masks.sum(axis=1)
+
+    @property
+    def catalog(self) -> list[Item]:
+        return self._catalog
+
+    def recognize(
+        self, tiles: np.ndarray, confidence: float = 0.8
+    ) -> list[Optional[Item]]:
+        """Recognizes the item in each of the given tiles.
+
+        Parameters
+        ----------
+        tiles :class:`np.ndarray`:
+            The grayscale tiles as array of shape `(N, height, width)`
+
+        confidence :class:`float`:
+            The confidence a candidate must be verified with
+
+        Returns
+        -------
+        :class:`list[Item | None]`:
+            The recognized item of each tile, `None` if it could not be determined
+        """
+        if not len(tiles):
+            return []
+
+        scores = self._correlate(tiles)
+        ranking = np.argsort(-scores, axis=1)
+
+        result: list[Optional[Item]] = []
+        for tile, tile_scores, ranked in zip(tiles, scores, ranking):
+            candidates = ranked[: self._CANDIDATES]
+            candidates = candidates[tile_scores[candidates] >= self._MIN_SCORE]
+            idx = self._verify(tile, candidates, confidence)
+            result.append(None if idx is None else self._unique[idx])
+        return result
+
+    def _verify(
+        self, tile: np.ndarray, candidates: np.ndarray, confidence: float
+    ) -> Optional[int]:
+        """Returns the candidate that matches the tile best, as long as it
+        matches with at least the given confidence."""
+        best, best_score = None, confidence
+        for idx in candidates:
+            icon = self._icons[idx]
+            if icon.shape[0] > tile.shape[0] or icon.shape[1] > tile.shape[1]:
+                continue
+
+            match = cv.matchTemplate(tile, icon, cv.TM_CCOEFF_NORMED)
+            score = cv.minMaxLoc(match)[1]
+            if score >= best_score:
+                best, best_score = idx, score
+        return best
+
+    def _load_icon(self, path: str) -> np.ndarray:
+        icon = get_template(path, grayscale=True)
+        if icon is None:
+            icon = cv.imread(path, cv.IMREAD_GRAYSCALE)
+        return icon
+
+    def _center(self, img: np.ndarray, size: int) -> np.ndarray:
+        """Crops or pads the image to its center area of the given size, the
+        padding uses the mean of the image so it does not add any contrast."""
+        canvas = np.full((size, size), img.mean(), dtype=np.float32)
+
+        h, w = img.shape[:2]
+        src_y, src_x = max(0, (h - size) // 2), max(0, (w - size) // 2)
+        dst_y, dst_x = max(0, (size - h) // 2), max(0, (size - w) // 2)
+        ch, cw = min(h, size), min(w, size)
+
+        canvas[dst_y : dst_y + ch, dst_x : dst_x + cw] = img[
+            src_y : src_y + ch, src_x : src_x + cw
+        ]
+        return canvas
+
+    def _correlate(self, tiles: np.ndarray) -> np.ndarray:
+        """Returns the normalized correlation of the tile blocks within each
+        icon with that icon at the best offset, of shape `(tiles, icons)`."""
+        blocks = self._blocks(
+            np.stack([self._center(t, self._CROP + 2 * self._SHIFT) for t in tiles]),
+            self._SHIFT,
+        )
+        n, offsets = blocks.shape[:2]
+        blocks = blocks.reshape(n * offsets, -1)
+
+        # the icon descriptors are zero mean within their mask, so the mean
+        # of the tile blocks only has to be removed from their variance
+        dot = blocks @ self._descriptors.T
+        sums = blocks @ self._masks.T
+        squares = (blocks * blocks) @ self._masks.T
+        variance = squares - sums * sums / self._mask_sizes
+        scores = dot / np.sqrt(np.maximum(variance, 1e-6))
+        return scores.reshape(n, offsets, -1).max(axis=1)
+
+    def _blocks(self, imgs: np.ndarray, shift: int) -> np.ndarray:
+        """Averages blocks of pixels of the center areas at every offset up to
+        the shift, returns an array of shape `(images, offsets, size, size)`.
+
+        The block sums of every possible block position are taken from the
+        integral image once, each offset then just samples them."""
+        block = self._CROP // self._SIZE
+        sums = []
+        for img in imgs:
+            integral = cv.integral(img, sdepth=cv.CV_64F)
+            sums.append(
+                integral[block:, block:]
+                - integral[:-block, block:]
+                - integral[block:, :-block]
+                + integral[:-block, :-block]
+            )
+
+        offsets = np.arange(0, 2 * shift + 1, self._STEP)
+        grid = offsets[:, None] + block * np.arange(self._SIZE)[None, :]
+        blocks = np.stack(sums)[:, grid[:, None, :, None], grid[None, :, None, :]]
+        n = len(imgs)
+        return (blocks / block**2).reshape(n, len(offsets) ** 2, self._SIZE, self._SIZE)
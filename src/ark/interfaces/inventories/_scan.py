@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class SlotScan:
+    """Represents the result of scanning the tooltip of a single slot.
+
+    Attributes
+    ----------
+    slot :class:`int`:
+        The index of the slot that was scanned
+
+    stats :class:`dict[str, dict | str]`:
+        The analyzed stats, empty if the scan failed
+
+    error :class:`Exception` [Optional]:
+        The error that caused the scan to fail, if any
+    """
+
+    slot: int
+    stats: dict[str, dict | str] = field(default_factory=dict)
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
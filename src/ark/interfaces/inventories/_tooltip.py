@@ -0,0 +1,191 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import cv2 as cv  # type: ignore[import]
+import numpy as np
+
+from ..._ark import Ark
+from ...context import ArkContext
+from ...window import ArkWindow
+from ...exceptions import PopupError
+
+
+@dataclass
+class Tooltip:
+    """Represents an item tooltip popup that was located on the screen.
+
+    Attributes
+    ----------
+    region :class:`tuple[int, int, int, int]`:
+        The region of the popup on the screen as (x, y, w, h)
+
+    image :class:`np.ndarray`:
+        The BGR image of the popup
+
+    window :class:`ArkWindow`:
+        The window the popup was located in
+    """
+
+    region: tuple[int, int, int, int]
+    image: np.ndarray
+    window: ArkWindow
+
+    def crop(self, x: int, y: int, w: int, h: int) -> np.ndarray:
+        """Crops a region relative to the popup out of its image."""
+        return self.image[y : y + h, x : x + w]
+
+    def find(self, template: str, confidence: float = 0.7):
+        """Finds the given template within the popup, returns the box
+        relative to the popup or `None` if it could not be found."""
+        return self.window.locate_in_image(template, self.image, confidence=confidence)
+
+
+class TooltipLocator(Ark):
+    """Locates the tooltip popup of hovered inventory slots.
+
+    The popup is found by the rectangular contour of its border, which is
+    confirmed to be a tooltip by the health icon within it.
+
+    The geometry of a found popup is cached per slot position, when the same
+    position is hovered again the cached border is verified instead of
+    searching for it, so the health template only has to be matched once.
+    Only the cached popup plus a small margin is grabbed to verify it, the
+    whole search region is only grabbed when the popup has to be located.
+    """
+
+    _SEARCH_REGION = (916, 0, 1003, 1079)
+    _BORDER_RGB = (244, 236, 175)
+    _BORDER_VARIANCE = 45
+    _MIN_AREA = 150000
+    _MAX_AREA = 500000
+
+    # pixels grabbed around a cached popup when verifying its border
+    _MARGIN = 4
+
+    # size of the egg tooltip, which is not located but anchored to the slot
+    _EGG_TOOLTIP_SIZE = (300, 367)
+
+    def __init__(self, *, context: Optional[ArkContext] = None) -> None:
+        super().__init__(context=context)
+        self._cache: dict[tuple[int, int], tuple[int, int, int, int]] = {}
+
+    def locate(self, key: tuple[int, int]) -> Tooltip:
+        """Locates the tooltip popup of the currently hovered slot.
+
+        Parameters
+        ----------
+        key :class:`tuple[int, int]`:
+            The column and row of the hovered slot to cache the geometry by
+
+        Raises
+        ------
+        `PopupError`
+            If the popup could not be found
+        """
+        region = self._cache.get(key)
+        if region is not None:
+            tooltip = self._verify(region)
+            if tooltip is not None:
+                return tooltip
+
+        sx, sy, *_ = self._SEARCH_REGION
+        screen = self.window.grab_screen(self._SEARCH_REGION)
+        masked = self.window.denoise_text(
+            screen, self._BORDER_RGB, variance=self._BORDER_VARIANCE, dilate=True
+        )
+        img = cv.cvtColor(np.asarray(screen), cv.COLOR_BGRA2BGR)
+
+        region = self._locate_by_contours(masked, img)
+        if region is None:
+            self._cache.pop(key, None)
+            raise PopupError("Could not find the item tooltip")
+        self._cache[key] = region
+
+        x, y, w, h = region
+        return Tooltip((x + sx, y + sy, w, h), img[y : y + h, x : x + w], self.window)
+
+    def anchored(
+        self, slot: tuple[int, int, int, int], column: int, row: int
+    ) -> tuple[int, int, int, int]:
+        """Returns the region of an egg tooltip, which is displayed at a fixed
+        position relative to the hovered slot. It is displayed on the left
+        of the slot for the last two columns, and above it past the first row."""
+        w, h = self._EGG_TOOLTIP_SIZE
+        x = slot[0] - 304 if column in (4, 5) else slot[0] + 98
+        y = slot[1] if row == 0 else slot[1] - 282
+        return x, y, w, h
+
+    def invalidate(self) -> None:
+        """Clears all cached popup geometry."""
+        self._cache.clear()
+
+    def _verify(self, region: tuple[int, int, int, int]) -> Optional[Tooltip]:
+        """Grabs only the cached region plus a small margin and returns the
+        tooltip if its border is still visible there."""
+        sx, sy, sw, sh = self._SEARCH_REGION
+        x, y, w, h = region
+        left, top = max(0, x - self._MARGIN), max(0, y - self._MARGIN)
+        right = min(sw, x + w + self._MARGIN)
+        bottom = min(sh, y + h + self._MARGIN)
+
+        screen = self.window.grab_screen(
+            (sx + left, sy + top, right - left, bottom - top)
+        )
+        masked = self.window.denoise_text(
+            screen, self._BORDER_RGB, variance=self._BORDER_VARIANCE, dilate=True
+        )
+        x, y = x - left, y - top
+        if not self._has_border(masked, (x, y, w, h)):
+            return None
+
+        img = cv.cvtColor(np.asarray(screen), cv.COLOR_BGRA2BGR)
+        return Tooltip(
+            (x + left + sx, y + top + sy, w, h), img[y : y + h, x : x + w], self.window
+        )
+
+    def _has_border(self, masked: np.ndarray, region: tuple[int, int, int, int]) -> bool:
+        """Checks whether the border of a cached region is still visible by
+        sampling all of its edges, allowing a few pixels of tolerance. A larger
+        popup in the same position lacks the bottom or right edge."""
+        x, y, w, h = region
+        bottom, right = y + h - 1, x + w - 1
+        horizontal = [
+            masked[max(0, edge - 2) : edge + 3, x : x + w].max(axis=0, initial=0)
+            for edge in (y, bottom)
+        ]
+        vertical = [
+            masked[y : y + h, max(0, edge - 2) : edge + 3].max(axis=1, initial=0)
+            for edge in (x, right)
+        ]
+        return all(np.count_nonzero(edge) > 0.8 * w for edge in horizontal) and all(
+            np.count_nonzero(edge) > 0.8 * h for edge in vertical
+        )
+
+    def _locate_by_contours(
+        self, masked: np.ndarray, img: np.ndarray
+    ) -> Optional[tuple[int, int, int, int]]:
+        """Locates the popup by finding a rectangular contour of the border."""
+        contours, _ = cv.findContours(masked, cv.RETR_LIST, cv.CHAIN_APPROX_SIMPLE)
+
+        for cnt in contours:
+            area: int = cv.contourArea(cnt)
+            if not self._MIN_AREA < area < self._MAX_AREA:
+                continue
+
+            peri = cv.arcLength(cnt, True)
+            approx = cv.approxPolyDP(cnt, 0.02 * peri, True)
+            if len(approx) != 4:
+                continue
+
+            x, y, w, h = cv.boundingRect(approx)
+            if self._is_stat_popup(img[y : y + h, x : x + w]):
+                return x, y, w, h
+        return None
+
+    def _is_stat_popup(self, popup: np.ndarray) -> bool:
+        return (
+            self.window.locate_in_image(
+                f"{self.PKG_DIR}/assets/stats/health.png", popup, confidence=0.7
+            )
+            is not None
+        )
@@ -1,5 +1,6 @@
-from typing import Literal, final
+from typing import Literal, Optional, final
 
+from ...context import ArkContext
 from .._button import Button
 from .inventory import Inventory
 
@@ -20,8 +21,10 @@ class DedicatedStorageInventory(Inventory):
     _WITHDRAW_FIVE = Button((962, 822))
     _WITHDRAW_TEN = Button((962, 877))
 
-    def __init__(self):
-        super().__init__("Tek Dedicated Storage", "assets/wheels/dedi.png")
+    def __init__(self, *, context: Optional[ArkContext] = None) -> None:
+        super().__init__(
+            "Tek Dedicated Storage", "assets/wheels/dedi.png", context=context
+        )
 
     def deposit(self) -> None:
         self.click_at(self._DEPOSIT_ALL.location)
@@ -1,5 +1,7 @@
 import math
 import time
+from difflib import SequenceMatcher
+from concurrent.futures import Future
 from typing import Iterable, Literal, Optional, final, overload
 
 import pathlib
@@ -10,6 +12,8 @@ from pytesseract import pytesseract as tes  # type: ignore[import]
 
 from ... import config
 from ..._ark import Ark
+from ...context import ArkContext, ContextAttribute
+from ...executor import get_pool
 from ..._helpers import await_event, get_center, get_filepath, set_clipboard, timedout
 from ...exceptions import (
     InventoryNotAccessibleError,
@@ -24,8 +28,12 @@ from ...exceptions import (
     PopupError,
 )
 
-from ...items import Item
+from ...items import Item, get_registry
+from .._added import added_popup_visible
 from .._button import Button
+from ._folders import FolderMap
+from ._scan import SlotScan
+from ._tooltip import Tooltip, TooltipLocator
 
 
 class Inventory(Ark):
@@ -50,6 +58,9 @@ class Inventory(Ark):
     capacity :class:`str`: [Optional]
         An image path containing the image of the max capacity.
 
+    context :class:`ArkContext`: [Optional]
+        The context to bind the inventory to rather than the active context
+
     Properties:
     ----------
     contents :class:`dict[Item, int]`:
@@ -62,7 +73,7 @@ class Inventory(Ark):
         A list of items that can be crafted in the inventories crafting tab.
     """
 
-    LAST_TRANSFER_ALL = time.time()
+    LAST_TRANSFER_ALL: float = ContextAttribute("last_transfer_all")  # type: ignore[assignment]
     SLOTS = [
         (x, y, 93, 93) for y in range(232, 883, 93) for x in range(1243, 1708 + 93, 93)
     ]
@@ -104,20 +115,32 @@ class Inventory(Ark):
     _LEVEL_UP = Button((1150, 515), (1227, 494, 45, 45), "level_up.png")
 
     _SEARCHBAR = (1300, 190)
+    _SEARCHBAR_REGION = (1243, 176, 160, 28)
+    _SEARCHBAR_RGB = (255, 255, 255)
     _ADDED_REGION = (40, 1020, 360, 60)
     _ITEM_REGION = (1243, 232, 562, 710)
     _UPPER_ITEM_REGION = (1240, 230, 568, 191)
     _SLOTS_REGION = (1074, 500, 60, 23)
     _REMOTE_INVENTORY = (1346, 563, 345, 43)
     _CAPPED_ICON = (1210, 230, 55, 54)
+    # region of a slot (relative to the slot) the stack quantity is shown in
+    _SLOT_QUANTITY = (69, 76, 27, 15)
+    _SLOT_QUANTITY_RGB = (255, 205, 56)
+
+    _folder_map: Optional[FolderMap] = None
+    # the active search term, `None` if it is unknown, and when it was entered
+    _active_term: Optional[str] = None
+    _term_entered: float = 0
 
     def __init__(
         self,
         entity_name: str,
         craftables: Optional[list[Item]] = None,
         capacity: Optional[str | int] = None,
+        *,
+        context: Optional[ArkContext] = None,
     ) -> None:
-        super().__init__()
+        super().__init__(context=context)
         self._name = entity_name
         self._capacity = capacity
         self._craftables = craftables
@@ -125,6 +148,7 @@ class Inventory(Ark):
             self._capacity = get_filepath(capacity)
 
         self._contents: dict[str, int] = {}
+        self._tooltips = TooltipLocator(context=self._context)
 
     def __str__(self) -> str:
         return f"Inventory of {self._name} with max slots {self._capacity}"
@@ -167,8 +191,30 @@ class Inventory(Ark):
             is not None
         )
 
-    def is_open(self) -> bool:
-        """Checks if the inventory is open."""
+    def is_open(self, cached: bool = False) -> bool:
+        """Checks if the inventory is open. If `cached` is set, a recent result
+        is trusted as long as the inventory tab looks the same."""
+        region = self._INVENTORY_TAB.region
+        assert region is not None
+        # the player and remote inventory are open at the same time
+        key = f"{type(self).__name__}:{region}"
+        return self.tracker.check(key, self._check_open, region, cached)
+
+    @property
+    def _search_term(self) -> Optional[str]:
+        """The active search term, it is unknown once any inventory has been
+        closed since, closing a remote inventory closes both panes."""
+        last_exit = self.context.last_interface_exit
+        if last_exit is not None and last_exit >= self._term_entered:
+            return None
+        return self._active_term
+
+    @_search_term.setter
+    def _search_term(self, term: Optional[str]) -> None:
+        self._active_term = term
+        self._term_entered = time.time()
+
+    def _check_open(self) -> bool:
         return self.locate_button(
             self._INVENTORY_TAB, confidence=0.8
         ) or self.locate_button(self._CRAFTING_TAB, confidence=0.8)
@@ -204,6 +250,9 @@ class Inventory(Ark):
                 max_duration * config.TIMER_FACTOR / config.INVENTORY_OPEN_INTERVAL
             ):
                 raise InventoryNotAccessibleError(self)
+        self._folder_map = None
+        self._search_term = None
+        self._tooltips.invalidate()
         self._await_receiving_remove_inventory()
 
     def close(self) -> None:
@@ -226,7 +275,10 @@ class Inventory(Ark):
 
             if attempts > (40 * config.TIMER_FACTOR / config.INVENTORY_OPEN_INTERVAL):
                 raise InventoryNotClosableError(self)
-        Ark.last_interface_exit = time.time()
+        self._folder_map = None
+        self._search_term = None
+        self._tooltips.invalidate()
+        self.context.last_interface_exit = time.time()
         self.sleep(0.3)
 
     @overload
@@ -255,7 +307,7 @@ class Inventory(Ark):
         if way not in ["up", "down"]:
             raise ValueError(f'Expected one of {["up", "down"]}, got "{way}".')
 
-        if not self.is_open():
+        if not self.is_open(cached=True):
             raise InventoryNotOpenError
 
         if pages:
@@ -265,30 +317,54 @@ class Inventory(Ark):
             self.mouse_scroll(2.91 * (1 if way == "up" else -1))
 
     @final
-    def search(self, item: Item | str, delete_prior: bool = True) -> None:
+    def search(
+        self, item: Item | str, delete_prior: bool = True, verify: bool = False
+    ) -> None:
         """Searches for an item or word in the searchbar. Then presses
         escape to tab back out of the spacebar.
 
+        The active search term is tracked until the inventory is opened or
+        any inventory is closed, searching for the active term again does nothing.
+
         Parameters
         ----------
         items :class:`Item | str`:
             The item or term to search for
+
+        delete_prior :class:`bool`:
+            Whether to replace the prior term rather than appending to it
+
+        verify :class:`bool`:
+            Whether to confirm an active term by reading the searchbar
+            before skipping the search
         """
-        if not self.is_open():
+        if not self.is_open(cached=True):
             raise InventoryNotOpenError
 
+        term = self._get_search_term(item)
+        if (
+            delete_prior
+            and term == self._search_term
+            and (not verify or self._searchbar_shows(term))
+        ):
+            return
+
+        self._folder_map = None
         self._click_searchbar(delete_prior)
         # lowercasing the term because pyautogui has a weird gist where it will
         # actually use shift + letter to capitalize it, which opens the chat somehow
-        if isinstance(item, str):
-            if "*" in item:
-                set_clipboard(item)
-                self.sleep(0.3)
-                pg.hotkey("ctrl", "v", interval=0.2)
-            else:
-                pg.typewrite(item.lower(), interval=0.001)
+        if "*" in term:
+            set_clipboard(term)
+            self.sleep(0.3)
+            pg.hotkey("ctrl", "v", interval=0.2)
+        else:
+            pg.typewrite(term, interval=0.001)
+
+        # appending to an unknown or prior term leaves the result unknown
+        if delete_prior or self._search_term == "":
+            self._search_term = term
         else:
-            pg.typewrite(item.search_name.lower(), interval=0.001)
+            self._search_term = None
 
         # escape out of the searchbar so presing f closes the inventory
         self.sleep(0.2)
@@ -304,7 +380,7 @@ class Inventory(Ark):
         items :class:`Iterable[Item | str]`: [Optional]
             An iterable of items to search for, then drop
         """
-        if not self.is_open():
+        if not self.is_open(cached=True):
             raise InventoryNotOpenError
 
         if items is None:
@@ -318,8 +394,8 @@ class Inventory(Ark):
         else:
             items = set(items)
 
-        for item in items:
-            self.search(item, delete_prior=False)
+        for item in self._order_searches(items):
+            self.search(item)
             self.click_at(self._DROP_ALL.location)
 
     @final
@@ -338,52 +414,42 @@ class Inventory(Ark):
         items :class:`Iterable[Item | str]`: [Optional]
             An iterable of items to search for, then transfer
         """
-        if not self.is_open():
+        if not self.is_open(cached=True):
             raise InventoryNotOpenError
 
         def press_button() -> None:
+            rate = self._transfer_rate("all")
             start = time.time()
+            awaiting = False
             while enforce_from_slot is None or not self.is_empty(enforce_from_slot):
-                if (time.time() - self.LAST_TRANSFER_ALL) < 5:
+                if self.transfer_rate.remaining(rate) > 0:
                     self.sleep(0.1)
                     continue
 
+                if awaiting:
+                    # the slot was not emptied within the interval
+                    self.transfer_rate.missed(rate)
+                    awaiting = False
+                    continue
+
                 if (
                     items is None
                     and enforce_from_slot is not None
                     and timedout(start, 15)
                 ) or (no_button and enforce_from_slot is not None):
-                    last_filled_row = 6
                     # got the folder glitch, transferring all wont work..
-                    prev = pg.PAUSE
-                    pg.PAUSE = 0
-                    try:
-                        while not self.is_empty(enforce_from_slot):
-                            self.window.begin_snapshot()
-                            for row in range(last_filled_row, -1, -1):
-                                first_slot = row * 6
-                                if row != 0 and self.is_empty(first_slot):
-                                    continue
-                                last_filled_row = max(last_filled_row, row)
-
-                                for slot in range(5, -1, -1):
-                                    area = self.SLOTS[first_slot + slot]
-                                    self.move_to(get_center(area))
-                                    if row == 0:
-                                        self.sleep(0.05)
-                                    self.press(self.keybinds.transfer)
-                                    self.sleep(0.01)
-                            self.window.end_snapshot()
-                            self.sleep(0.2)
-                    finally:
-                        pg.PAUSE = prev
-                        self.window.end_snapshot()
+                    self._transfer_slots(enforce_from_slot)
                     continue
 
                 self.click_at(self._TRANSFER_ALL.location, delay=0.2)
-                Inventory.LAST_TRANSFER_ALL = time.time()
+                self.transfer_rate.sent(rate)
+                self.context.last_transfer_all = time.time()
                 if enforce_from_slot is None:
                     break
+                awaiting = True
+
+            if awaiting:
+                self.transfer_rate.acknowledged(rate)
 
         if items is None:
             press_button()
@@ -396,7 +462,7 @@ class Inventory(Ark):
         else:
             items = set(items)
 
-        for item in items:
+        for item in self._order_searches(items):
             self.search(item, delete_prior=delete_search or len(items) > 1)
 
             press_button()
@@ -411,7 +477,7 @@ class Inventory(Ark):
         tab :class:`Literal["inventory", "crafting"]`:
             The tab to open
         """
-        if not self.is_open():
+        if not self.is_open(cached=True):
             raise InventoryNotOpenError
 
         if tab == "crafting":
@@ -431,7 +497,7 @@ class Inventory(Ark):
         item :class:`Item`:
             The item to be popcorned
         """
-        if not self.is_open():
+        if not self.is_open(cached=True):
             raise InventoryNotOpenError
 
         if search:
@@ -581,7 +647,7 @@ class Inventory(Ark):
                 f'Expected one of {["folder view", "show engrams", "unlearned engrams"]}, got {option}'
             )
 
-        if not self.is_open():
+        if not self.is_open(cached=True):
             raise InventoryNotOpenError
 
         buttons = {
@@ -635,6 +701,12 @@ class Inventory(Ark):
     def get_folder_index(self) -> int:
         """Returns the number of the crop plot in the stack by checking for
         the folder name from AAA to HHH, being 1 to 9."""
+        name = self.get_folder_name(0)
+        if name in self._FOLDERS:
+            return self._FOLDERS.index(name) + 1
+
+        # the inventory may not have loaded when the map was captured
+        self._folder_map = None
         for _ in range(3):
             for index, option in enumerate(self._FOLDERS, start=1):
                 if self.window.locate_template(
@@ -646,6 +718,66 @@ class Inventory(Ark):
             self.sleep(0.5)
         raise UnknownFolderIndexError(self)
 
+    def get_folder_map(self, rows: int = 1) -> FolderMap:
+        """Returns the folders in the given amount of rows from the top.
+
+        The rows are captured once and the folder icons are located in a
+        single pass, the map is kept until the inventory is opened, closed,
+        searched or a folder is opened, closed or created.
+        """
+        if self._folder_map is not None and self._folder_map.rows >= rows:
+            return self._folder_map
+
+        x, y, _, h = self.SLOTS[0]
+        w = self.SLOTS[5][0] + self.SLOTS[5][2] - x
+        frame = np.asarray(self.window.grab_screen((x, y, w, h * rows)))
+        frame = cv.cvtColor(frame, cv.COLOR_RGB2BGR)
+        frame = cv.cvtColor(frame, cv.COLOR_BGR2RGB)
+
+        # the folder icon is at the top left of the slot
+        slots = set()
+        for box in self.window.locate_all_in_image(
+            f"{self.PKG_DIR}/assets/interfaces/folder.png", frame, confidence=0.7
+        ):
+            col, col_offset = divmod(box[0], 93)
+            row, row_offset = divmod(box[1], 93)
+            if col_offset < 54 and row_offset < 30:
+                slots.add(row * 6 + col)
+
+        self._folder_map = FolderMap(frame, rows, tuple(sorted(slots)))
+        return self._folder_map
+
+    def get_folder_name(self, slot: int) -> str | None:
+        """Returns the name of the folder in the given slot from the folder
+        map, or `None` if there is no folder in the slot.
+
+        The known folder names are matched first, other names are read
+        with the same OCR as `read_folder_name`.
+        """
+        folders = self.get_folder_map(slot // 6 + 1)
+        if slot not in folders:
+            return None
+        if slot in folders.names:
+            return folders.names[slot]
+
+        x, y = (slot % 6) * 93, (slot // 6) * 93
+        name_crop = folders.frame[y + 58 : y + 93, max(0, x - 3) : x + 84]
+        for option in self._FOLDERS:
+            if self.window.locate_in_image(
+                f"{self.PKG_DIR}/assets/interfaces/folder_{option}.png",
+                name_crop,
+                confidence=0.9,
+            ):
+                name = option
+                break
+        else:
+            name = self._ocr_folder_name(
+                folders.frame[y + 68 : y + 93, x : x + 81], "--psm 7"
+            )
+
+        folders.names[slot] = name
+        return name
+
     def read_folder_name(self, slot: int, config: str) -> str:
         name_roi = (self.SLOTS[slot][0], self.SLOTS[slot][1] + 68, 81, 25)
 
@@ -653,7 +785,9 @@ class Inventory(Ark):
         img = np.asarray(img)
         img = cv.cvtColor(img, cv.COLOR_RGB2BGR)
         img = cv.cvtColor(img, cv.COLOR_BGR2RGB)
+        return self._ocr_folder_name(img, config)
 
+    def _ocr_folder_name(self, img: np.ndarray, config: str) -> str:
         hsv = cv.cvtColor(img, cv.COLOR_BGR2HSV)
 
         mask1 = cv.inRange(hsv, (97, 190, 160), (180, 255, 255))
@@ -666,15 +800,11 @@ class Inventory(Ark):
         return result
 
     def is_folder(self, slot: int, folder: str | None = None) -> bool:
-        roi = (self.SLOTS[slot][0], self.SLOTS[slot][1], 54, 30)
-        return (
-            self.window.locate_template(
-                f"{self.PKG_DIR}/assets/interfaces/folder.png",
-                region=roi,
-                confidence=0.7,
-            )
-            is not None
-        )
+        """Checks whether the given slot contains a folder, if a folder name
+        is passed the name of the folder has to match as well."""
+        if folder is not None:
+            return self.get_folder_name(slot) == folder
+        return slot in self.get_folder_map(slot // 6 + 1)
 
     def is_in_folder(self) -> bool:
         return (
@@ -687,6 +817,7 @@ class Inventory(Ark):
         )
 
     def open_folder(self, slot: int):
+        self._folder_map = None
         loc = self.SLOTS[slot]
         self.move_to(loc[0] + loc[2] / 2, loc[1] + loc[3] / 2)
         self.sleep(0.1)
@@ -709,6 +840,7 @@ class Inventory(Ark):
                     self.select_slot(0)
 
     def close_current_folder(self):
+        self._folder_map = None
         loc = self.SLOTS[0]
         self.move_to(loc[0] + loc[2] / 2, loc[1] + loc[3] / 2)
         self.sleep(0.1)
@@ -747,81 +879,26 @@ class Inventory(Ark):
 
         return cv.countNonZero(masked) > 5
 
-    def is_cryo_ready_to_breed(self, slot: int) -> int:
-        loc = self.SLOTS[slot]
-        self.move_to(loc[0] + loc[2] / 2, loc[1] + loc[3] / 2)
-        time.sleep(0.1)
-
-        img = self.window.grab_screen((916, 0, 1003, 1079))
-        masked = self.window.denoise_text(
-            img, (244, 236, 175), variance=45, dilate=True
-        )
-        img = np.asarray(img)
-        img = cv.cvtColor(img, cv.COLOR_RGB2BGR)
-        img = cv.cvtColor(img, cv.COLOR_BGR2RGB)
-
-        contours, _ = cv.findContours(masked, cv.RETR_LIST, cv.CHAIN_APPROX_SIMPLE)
-        popup = None
-
-        for cnt in contours:
-            peri = cv.arcLength(cnt, True)
-            approx = cv.approxPolyDP(cnt, 0.02 * peri, True)
-            area: int = cv.contourArea(cnt)
+    def get_tooltip(self, slot: int) -> Tooltip:
+        """Hovers the given slot and locates the tooltip popup of its item.
 
-            if len(approx) == 4 and area > 150000 and area < 500000:
-                x, y, w, h = cv.boundingRect(approx)
-                cropped_roi = np.asarray(img)[y : y + h, x : x + w]
-
-                if self.window.locate_in_image(
-                    f"{self.PKG_DIR}/assets/stats/health.png",
-                    cropped_roi,
-                    confidence=0.7,
-                ):
-                    popup = cropped_roi
-                    break
-        if popup is None:
-            raise PopupError("Could not find the item tooltip")
-
-        return self.window.locate_in_image(
-            f"{self.PKG_DIR}/assets/interfaces/ready_to_mate.png",
-            popup,
-            confidence=0.7,
-        )
-
-    def get_baby_time_left(self, slot: int) -> int:
+        Raises
+        ------
+        `PopupError`
+            If the tooltip could not be found
+        """
         loc = self.SLOTS[slot]
         self.move_to(loc[0] + loc[2] / 2, loc[1] + loc[3] / 2)
         time.sleep(0.1)
+        return self._tooltips.locate((slot % 6, slot // 6))
 
-        img = self.window.grab_screen((916, 0, 1003, 1079))
-        masked = self.window.denoise_text(
-            img, (244, 236, 175), variance=45, dilate=True
+    def is_cryo_ready_to_breed(self, slot: int) -> int:
+        return self.get_tooltip(slot).find(
+            f"{self.PKG_DIR}/assets/interfaces/ready_to_mate.png"
         )
-        img = np.asarray(img)
-        img = cv.cvtColor(img, cv.COLOR_RGB2BGR)
-        img = cv.cvtColor(img, cv.COLOR_BGR2RGB)
-
-        contours, _ = cv.findContours(masked, cv.RETR_LIST, cv.CHAIN_APPROX_SIMPLE)
-        popup = None
-
-        for cnt in contours:
-            peri = cv.arcLength(cnt, True)
-            approx = cv.approxPolyDP(cnt, 0.02 * peri, True)
-            area: int = cv.contourArea(cnt)
 
-            if len(approx) == 4 and area > 150000 and area < 500000:
-                x, y, w, h = cv.boundingRect(approx)
-                cropped_roi = np.asarray(img)[y : y + h, x : x + w]
-
-                if self.window.locate_in_image(
-                    f"{self.PKG_DIR}/assets/stats/health.png",
-                    cropped_roi,
-                    confidence=0.7,
-                ):
-                    popup = cropped_roi
-                    break
-        if popup is None:
-            raise
+    def get_baby_time_left(self, slot: int) -> int:
+        popup = self.get_tooltip(slot).image
 
         nursing = self.window.locate_in_image(
             f"{self.PKG_DIR}/assets/interfaces/nursing.png",
@@ -829,7 +906,7 @@ class Inventory(Ark):
             confidence=0.7,
         )
         if nursing is None:
-            raise
+            raise PopupError("Could not find the nursing timer in the tooltip")
 
         x, y, w, h = (nursing[0] + nursing[2] + 5, nursing[1] + 12, 100, 19)
         raise_time_crop = popup[y : y + h, x : x + w]
@@ -894,13 +971,18 @@ class Inventory(Ark):
                     self.sleep(0.5)
                     break
 
-    def is_empty(self, slot: int) -> bool:
-        """Checks if a slot is empty"""
-        roi = (self.SLOTS[slot][0] + 69, self.SLOTS[slot][1] + 76, 27, 15)
+    def is_empty(self, slot: int, grid: Optional[np.ndarray] = None) -> bool:
+        """Checks if a slot is empty, if a `grid` from `scan_grid` is passed the
+        occupancy is taken from it rather than grabbing the slot again."""
+        if grid is not None:
+            return not grid[slot]
+
+        x, y, w, h = self._SLOT_QUANTITY
+        roi = (self.SLOTS[slot][0] + x, self.SLOTS[slot][1] + y, w, h)
         img = self.window.grab_screen(roi)
         masked = self.window.denoise_text(
             img,
-            (255, 205, 56),
+            self._SLOT_QUANTITY_RGB,
             dilate=False,
             variance=5,
         )
@@ -908,28 +990,99 @@ class Inventory(Ark):
         count = cv.countNonZero(masked)
         return count < 5
 
+    def scan_grid(self) -> np.ndarray:
+        """Computes the occupancy of all `SLOTS` from a single capture of the
+        item region. A slot is occupied if its stack quantity is displayed,
+        the same way `is_empty` determines it for a single slot.
+
+        Returns
+        -------
+        :class:`np.ndarray`:
+            A boolean array with one entry per slot, `True` if it is occupied.
+            Rows can be accessed by reshaping it to `(-1, 6)`.
+        """
+        return self._compute_grid(*self._grab_slot_area())
+
+    def scan_contents(self, confidence: float = 0.8) -> dict[str, int]:
+        """Recognizes the items in all occupied slots from a single capture and
+        sets the inventories `contents` to the stacks of each item found.
+
+        Every occupied slot is compared against all items of the item registry
+        at once, so the cost does not grow with the items checked.
+
+        Returns
+        -------
+        :class:`dict[str, int]`:
+            The updated contents, mapping item names to their stacks
+        """
+        img, left, top = self._grab_slot_area()
+        grid = self._compute_grid(img, left, top)
+        gray = cv.cvtColor(img, cv.COLOR_BGR2GRAY)
+
+        tiles = np.stack(
+            [
+                gray[y - top : y + h - top, x - left : x + w - left]
+                for x, y, w, h in self.SLOTS
+            ]
+        )
+        recognized = get_registry().recognizer.recognize(tiles[grid], confidence)
+
+        self._contents = {}
+        for item in recognized:
+            if item is not None:
+                self.add_contents(item, 1)
+        return self._contents
+
     def get_egg_stats(self, slot: int, **kwargs) -> dict[str, dict | str]:
+        return self._analyze_egg_stats(self._capture_egg_tooltip(slot), kwargs)
+
+    def scan_slots(self, slots: Iterable[int], stats: dict[str, str]) -> list[SlotScan]:
+        """Scans the egg stats of multiple slots, the next slot is hovered and
+        captured while the tooltips of the prior slots are still analyzed.
+
+        Parameters
+        ----------
+        slots :class:`Iterable[int]`:
+            The slots to scan, in the order to hover them in
+
+        stats :class:`dict[str, str]`:
+            The stats to analyze, as would be passed to `get_egg_stats`
+
+        Returns
+        -------
+        :class:`list[SlotScan]`:
+            The result of each slot in the order the slots were passed
+        """
+        pool = get_pool("ocr", config.OCR_WORKERS)
+        pending: list[tuple[int, Future | Exception]] = []
+        for slot in slots:
+            try:
+                mat = self._capture_egg_tooltip(slot)
+            except EggStatError as e:
+                pending.append((slot, e))
+                continue
+            pending.append((slot, pool.submit(self._analyze_egg_stats, mat, stats)))
+
+        results: list[SlotScan] = []
+        for slot, job in pending:
+            if isinstance(job, Exception):
+                results.append(SlotScan(slot, error=job))
+            elif (error := job.exception()) is not None:
+                results.append(SlotScan(slot, error=error))
+            else:
+                results.append(SlotScan(slot, stats=job.result()))
+        return results
+
+    def _capture_egg_tooltip(self, slot: int) -> np.ndarray:
+        """Hovers the slot and captures the egg tooltip once it has rendered."""
         area = self.SLOTS[slot]
         self.move_to(area[0] + area[2] / 2, area[1] + area[3] / 2)
         self.sleep(0.3)
 
         # displays in a different loc depending on the slot
-        flipped = slot % 6 in (4, 5)
-        if slot <= 5:
-            if flipped:
-                roi = (area[0] - 304, area[1], 300, 367)
-            else:
-                roi = (area[0] + 98, area[1], 300, 367)
-        else:
-            if flipped:
-                roi = (area[0] - 304, area[1] - 282, 300, 367)
-            else:
-                roi = (area[0] + 98, area[1] - 282, 300, 367)
+        roi = self._tooltips.anchored(area, slot % 6, slot // 6)
 
         start = time.time()
-        female_stat_color = (191, 127, 255)
-        male_stat_color = (253, 190, 0)
-        muta_color = (64, 252, 63)
         name_color = (250, 249, 245)
 
         while True:
@@ -948,7 +1101,15 @@ class Inventory(Ark):
                 name_crop, name_color, variance=30, dilate=False
             )
             if cv.countNonZero(name_mask) > 50:
-                break
+                return mat
+
+    def _analyze_egg_stats(
+        self, mat: np.ndarray, stats: dict[str, str]
+    ) -> dict[str, dict | str]:
+        """Analyzes the requested stats of a captured egg tooltip."""
+        female_stat_color = (191, 127, 255)
+        male_stat_color = (253, 190, 0)
+        muta_color = (64, 252, 63)
 
         gx, gy, gw, gh = (99, 118, 24, 30)
         ix, iy, iw, ih = (144, 40, 144, 25)
@@ -958,7 +1119,7 @@ class Inventory(Ark):
 
         ret: dict[str, dict | str] = {}
 
-        for k, v in kwargs.items():
+        for k, v in stats.items():
             if k == "maturation":
                 # todo: check maturation percentage
                 ...
@@ -1062,10 +1223,11 @@ class Inventory(Ark):
 
     def create_folder(self, name: str) -> None:
         """Creates a folder in the inventory at the classes folder button"""
-        if not self.is_open():
+        if not self.is_open(cached=True):
             raise InventoryNotOpenError
 
         set_clipboard(name)
+        self._folder_map = None
 
         self.click_at(1585, 187)
         self.sleep(0.3)
@@ -1097,7 +1259,7 @@ class Inventory(Ark):
         """Attempts to OCR the amount of slots occupied in the structure.
         Returns the OCR'd amount as an integer, otherwise -1 on failure.
         """
-        if not self.is_open():
+        if not self.is_open(cached=True):
             raise InventoryNotOpenError
 
         slots = self.window.grab_screen((1090, 503, 31, 15))
@@ -1124,14 +1286,19 @@ class Inventory(Ark):
         # replace mistaken "0"s, strip off newlines
         return int(result.replace("O", "0")) or -1
 
-    def is_full(self) -> bool:
+    def is_full(self, grid: Optional[np.ndarray] = None) -> bool:
         """Checks if the vault is full, raises an `AttributeError` if no
-        max slot image path was defined."""
+        max slot image path was defined.
+
+        If a `grid` from `scan_grid` is passed and it has empty slots, the
+        occupied slots are counted from it instead of OCR'ing the slots. Only
+        pass a grid if there are no folders in the inventory.
+        """
         if self._capacity is None:
             raise AttributeError(
                 f"Unabled to check slots, missing 'capacity' for '{self._name}'"
             )
-        if not self.is_open():
+        if not self.is_open(cached=True):
             raise InventoryNotOpenError
 
         if isinstance(self._capacity, str):
@@ -1141,31 +1308,28 @@ class Inventory(Ark):
                 )
                 is not None
             )
+        if grid is not None and not grid.all():
+            return self._capacity - 5 <= int(grid.sum()) <= self._capacity
         return self._capacity - 5 <= self.get_slots() <= self._capacity
 
     def received_item(self) -> bool:
         """Checks if an item was added by matching for the added template"""
-        return (
-            self.window.locate_template(
-                f"{self.PKG_DIR}/assets/templates/added.png",
-                region=self._ADDED_REGION,
-                confidence=0.7,
-            )
-            is not None
-        )
+        return added_popup_visible(self.window, self._ADDED_REGION)
 
     def delete_search(self) -> None:
         """Deletes the last term in the searchbar by selecting all of it,
         deleting it with backspace and then escaping out."""
-        if not self.is_open():
+        if not self.is_open(cached=True):
             raise InventoryNotOpenError
 
         self._click_searchbar(delete_prior=True)
         self.press("backspace")
         self.press("esc")
+        self._search_term = ""
+        self._folder_map = None
 
     def transfer_top_row(self, speed: int | float = 0.2) -> None:
-        if not self.is_open():
+        if not self.is_open(cached=True):
             raise InventoryNotOpenError
 
         for idx, slot in enumerate(self.SLOTS, start=1):
@@ -1177,7 +1341,7 @@ class Inventory(Ark):
                 return
 
     def drop_top_row(self, speed: int | float = 0.1) -> None:
-        if not self.is_open():
+        if not self.is_open(cached=True):
             raise InventoryNotOpenError
 
         for idx, slot in enumerate(self.SLOTS, start=1):
@@ -1271,6 +1435,108 @@ class Inventory(Ark):
             self.window.convert_height(25),
         )
 
+    def _grab_slot_area(self) -> tuple[np.ndarray, int, int]:
+        """Grabs the area covering all `SLOTS` and their quantity regions.
+
+        Returns the BGR image and the position of its top left corner.
+        """
+        x, y, w, h = self._SLOT_QUANTITY
+        left = min(slot[0] for slot in self.SLOTS)
+        top = min(slot[1] for slot in self.SLOTS)
+        right = max(slot[0] + max(slot[2], x + w) for slot in self.SLOTS)
+        bottom = max(slot[1] + max(slot[3], y + h) for slot in self.SLOTS)
+
+        img = np.asarray(self.window.grab_screen((left, top, right - left, bottom - top)))
+        if img.shape[2] == 4:
+            img = cv.cvtColor(img, cv.COLOR_BGRA2BGR)
+        return img, left, top
+
+    def _compute_grid(self, img: np.ndarray, left: int, top: int) -> np.ndarray:
+        """Computes the occupancy of each slot from an image of the slot area."""
+        masked = self.window.denoise_text(
+            img, self._SLOT_QUANTITY_RGB, dilate=False, variance=5
+        )
+        x, y, w, h = self._SLOT_QUANTITY
+        x0 = np.array([slot[0] for slot in self.SLOTS]) + x - left
+        y0 = np.array([slot[1] for slot in self.SLOTS]) + y - top
+        x1, y1 = x0 + w, y0 + h
+
+        # sum up the masked pixels of each slots quantity region at once
+        integral = cv.integral((masked > 0).astype(np.uint8))
+        counts = integral[y1, x1] - integral[y0, x1] - integral[y1, x0] + integral[y0, x0]
+        return counts >= 5
+
+    def _transfer_rate(self, kind: Literal["all", "sweep"]) -> str:
+        """Returns the key of the transfer rate of this inventory type,
+        registering it with its initial interval and bounds if needed."""
+        key = f"{type(self).__name__}.{kind}"
+        if kind == "all":
+            bounds = (config.TRANSFER_ALL_FLOOR, config.TRANSFER_ALL_CEILING)
+            self.transfer_rate.register(key, 5, *bounds)
+        else:
+            bounds = (config.TRANSFER_SWEEP_FLOOR, config.TRANSFER_SWEEP_CEILING)
+            self.transfer_rate.register(key, 0.2, *bounds)
+        return key
+
+    def _transfer_slots(
+        self, until_empty: int, skip: int = 0, first_row_delay: float = 0.05
+    ) -> None:
+        """Transfers the slots one by one until the given slot is empty, rows
+        are swept bottom up and empty rows are skipped.
+
+        Parameters
+        ----------
+        until_empty :class:`int`:
+            The slot that must be empty for all items to be transferred
+
+        skip :class:`int`:
+            The amount of slots in the first row to leave alone
+
+        first_row_delay :class:`float`:
+            How long to hover the slots of the first row before transferring
+        """
+        rate = self._transfer_rate("sweep")
+        last_filled_row = 6
+        prev = pg.PAUSE
+        pg.PAUSE = 0
+        try:
+            grid = self.scan_grid()
+            while grid[until_empty]:
+                self.transfer_rate.wait(rate)
+                for row in range(last_filled_row, -1, -1):
+                    first_slot = row * 6
+                    if row != 0 and not grid[first_slot]:
+                        continue
+                    last_filled_row = max(last_filled_row, row)
+
+                    for slot in range(5, -1, -1):
+                        if row == 0 and slot < skip:
+                            continue
+                        area = self.SLOTS[first_slot + slot]
+                        self.move_to(get_center(area))
+                        if row == 0 and first_row_delay:
+                            self.sleep(first_row_delay)
+                        self.press(self.keybinds.transfer)
+                        self.sleep(0.01)
+                self.transfer_rate.sent(rate)
+                grid = self._await_grid_change(grid, rate)
+        finally:
+            pg.PAUSE = prev
+
+    def _await_grid_change(self, grid: np.ndarray, rate: str) -> np.ndarray:
+        """Rescans the grid until it differs from the given one, which
+        acknowledges the transfer unless it took longer than its interval."""
+        while True:
+            current = self.scan_grid()
+            if (current != grid).any():
+                self.transfer_rate.acknowledged(rate)
+                return current
+
+            if self.transfer_rate.since_sent(rate) > self.transfer_rate.interval(rate):
+                self.transfer_rate.missed(rate)
+                return current
+            self.sleep(0.02)
+
     def _await_receiving_remove_inventory(self) -> None:
         """Waits until 'Receiving Remote Inventory' disappears.
 
@@ -1286,6 +1552,33 @@ class Inventory(Ark):
             if c > 300:
                 raise ReceivingRemoveInventoryTimeout(self)
 
+    def _get_search_term(self, item: Item | str) -> str:
+        """Returns the term that is entered when searching for the item."""
+        if isinstance(item, str):
+            return item if "*" in item else item.lower()
+        return item.search_name.lower()
+
+    def _order_searches(self, items: Iterable[Item | str]) -> list[Item | str]:
+        """Orders the items to search for so that items sharing a search term
+        are adjacent and the active term comes first, ARK's search has no
+        way to combine several terms into one search."""
+        by_term: dict[str, list[Item | str]] = {}
+        for item in items:
+            by_term.setdefault(self._get_search_term(item), []).append(item)
+
+        terms = sorted(by_term, key=lambda term: term != self._search_term)
+        return [item for term in terms for item in by_term[term]]
+
+    def _searchbar_shows(self, term: str) -> bool:
+        """Reads the searchbar to check whether it shows the given term."""
+        img = self.window.grab_screen(self._SEARCHBAR_REGION)
+        masked = self.window.denoise_text(
+            img, self._SEARCHBAR_RGB, variance=60, upscale=True, upscale_by=3
+        )
+        text: str = tes.image_to_string(masked, config="--psm 7 -l eng")
+        text = "".join(text.lower().split())
+        return SequenceMatcher(None, text, "".join(term.split())).ratio() >= 0.8
+
     def _click_searchbar(self, delete_prior: bool = True) -> None:
         """Clicks into the searchbar"""
         self.click_at(self._SEARCHBAR)
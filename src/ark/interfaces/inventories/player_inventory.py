@@ -6,6 +6,7 @@ import pyautogui as pg  # type: ignore[import]
 
 from ... import config
 from ..._helpers import await_event, get_center, set_clipboard
+from ...context import ArkContext
 from ...exceptions import (
     InventoryNotAccessibleError,
     MissingItemErrror,
@@ -45,14 +46,15 @@ class PlayerInventory(Inventory):
     _CRAFTING_TAB = Button((600, 113), (491, 92, 204, 49), "crafting.png")
 
     _SEARCHBAR = (180, 180)
+    _SEARCHBAR_REGION = (117, 166, 160, 28)
     _ADDED_REGION = (10, 1000, 220, 80)
     _ITEM_REGION = (117, 232, 564, 708)
     _UPPER_ITEM_REGION = (117, 230, 568, 191)
     _CAPPED_ICON = (85, 235, 52, 50)
     _YOU = (794, 116)
 
-    def __init__(self):
-        super().__init__("Player")
+    def __init__(self, *, context: Optional[ArkContext] = None) -> None:
+        super().__init__("Player", context=context)
 
     def open(self, *_) -> None:
         """Opens the player inventory using the specified keybind.
@@ -60,6 +62,8 @@ class PlayerInventory(Inventory):
         If the inventory did not open after 30 seconds,
         an `InventoryNotAccessibleError` is raised.
         """
+        self._search_term = None
+        self._tooltips.invalidate()
         attempts = 0
         while not self.is_open():
             self.press(self.keybinds.inventory)
@@ -76,7 +80,6 @@ class PlayerInventory(Inventory):
             raise NoItemsAddedError(item.name if isinstance(item, Item) else item)
 
     def put_all(self, term: str | None = None) -> None:
-        last_filled_row = 6
         if term is not None:
             self.search(term, False)
 
@@ -87,33 +90,11 @@ class PlayerInventory(Inventory):
         if term is None:
             start += 1
 
-        prev = pg.PAUSE
-        pg.PAUSE = 0
-        try:
-            while not self.is_empty(start):
-                self.window.begin_snapshot()
-                for row in range(last_filled_row, -1, -1):
-                    first_slot = row * 6
-                    if row != 0 and self.is_empty(first_slot):
-                        continue
-                    last_filled_row = max(last_filled_row, row)
-
-                    for slot in range(5, -1, -1):
-                        # skip implants and folders
-                        if row == 0 and slot < start:
-                            continue
-                        area = self.SLOTS[first_slot + slot]
-                        self.move_to(get_center(area))
-                        self.press(self.keybinds.transfer)
-                        self.sleep(0.01)
-                self.window.end_snapshot()
-                self.sleep(0.2)
-        finally:
-            pg.PAUSE = prev
-            self.window.end_snapshot()
+        # skip implants and folders
+        self._transfer_slots(start, skip=start, first_row_delay=0)
 
     def create_folder(self, name: str) -> None:
-        if not self.is_open():
+        if not self.is_open(cached=True):
             raise InventoryNotOpenError
 
         set_clipboard(name)
@@ -22,6 +22,7 @@ class SpawnScreen(Ark):
 
     _BEDS_REGION = (160, 70, 1050, 880)
     _BED_NAME_AREA = (624, 967, 250, 25)
+    _BED_FILTER = (140, 950, 150, 50)
 
     def spawn(self) -> None:
         """Clicks the spawn button"""
@@ -106,12 +107,18 @@ class SpawnScreen(Ark):
             is not None
         )
 
-    def is_open(self) -> bool:
-        """Returns whether the spawn screen is currently open."""
+    def is_open(self, cached: bool = False) -> bool:
+        """Returns whether the spawn screen is currently open. If `cached` is
+        set, a recent result is trusted as long as the bed filter looks the same."""
+        return self.tracker.check(
+            "spawn_screen", self._check_open, self._BED_FILTER, cached
+        )
+
+    def _check_open(self) -> bool:
         return (
             self.window.locate_template(
                 f"{self.PKG_DIR}/assets/interfaces//bed_filter.png",
-                region=(140, 950, 150, 50),
+                region=self._BED_FILTER,
                 confidence=0.8,
             )
             is not None
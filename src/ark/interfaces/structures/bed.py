@@ -1,5 +1,6 @@
-from typing import final
+from typing import Optional, final
 
+from ...context import ArkContext
 from ..spawn_screen import SpawnScreen
 from .structure import Structure
 
@@ -7,9 +8,9 @@ from .structure import Structure
 @final
 class Bed(Structure):
 
-    def __init__(self, name: str) -> None:
-        super().__init__(name, "assets/wheels/bed.png")
-        self.interface = SpawnScreen()
+    def __init__(self, name: str, *, context: Optional[ArkContext] = None) -> None:
+        super().__init__(name, "assets/wheels/bed.png", context=context)
+        self.interface = SpawnScreen(context=self._context)
 
     def spawn(self, fast: bool = False) -> None:
         self.interface.travel_to(self.name, fast)
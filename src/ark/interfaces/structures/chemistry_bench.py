@@ -1,5 +1,6 @@
-from typing import final
+from typing import Optional, final
 
+from ...context import ArkContext
 from ...items import GUNPOWDER, SPARKPOWDER
 from .structure import Structure
 
@@ -10,12 +11,13 @@ class ChemistryBench(Structure):
     Is able to be turned on and off.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, *, context: Optional[ArkContext] = None) -> None:
         super().__init__(
             "Chemistry Bench",
             "assets/wheels/chemistry_bench.png",
             craftables=[SPARKPOWDER, GUNPOWDER],
-            toggleable=True
+            toggleable=True,
+            context=context,
         )
 
 
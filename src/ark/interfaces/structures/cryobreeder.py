@@ -1,10 +1,11 @@
-from typing import final
+from typing import Optional, final
 from .structure import Structure
 from .._button import Button
 from enum import Enum
 from ...exceptions import InterfaceError
 import time
 from ..._helpers import timedout
+from ...context import ArkContext
 
 
 class CryobreederState(str, Enum):
@@ -20,10 +21,11 @@ class CryoBreeder(Structure):
     BREED_BUTTON = Button((955, 620), (807, 606, 306, 33))
     START_BREEDING_BUTTON = Button((1210, 753), (1064, 739, 310, 30))
 
-    def __init__(self) -> None:
+    def __init__(self, *, context: Optional[ArkContext] = None) -> None:
         super().__init__(
             name="Cryo Breeder",
             action_wheel="assets/wheels/industrial_grinder.png",
+            context=context,
         )
 
     @property
@@ -1,8 +1,9 @@
-from typing import Literal, final, overload
+from typing import Literal, Optional, final, overload
 
 from ark.exceptions import InventoryNotAccessibleError, NoItemsDepositedError
 
 from ..._helpers import await_event
+from ...context import ArkContext
 from ...items import Item
 from ..inventories import DedicatedStorageInventory
 from .structure import Structure
@@ -20,9 +21,13 @@ class TekDedicatedStorage(Structure):
     _TRANSFERRED_REGION = (710, 4, 460, 130)
     _ITEM_ADDED_REGION = (0, 430, 160, 350)
 
-    def __init__(self) -> None:
-        super().__init__("Tek Dedicated Storage", "assets/wheels/dedi.png")
-        self.inventory: DedicatedStorageInventory = DedicatedStorageInventory()
+    def __init__(self, *, context: Optional[ArkContext] = None) -> None:
+        super().__init__(
+            "Tek Dedicated Storage", "assets/wheels/dedi.png", context=context
+        )
+        self.inventory: DedicatedStorageInventory = DedicatedStorageInventory(
+            context=self._context
+        )
 
     @overload
     def deposit(self, items: list[Item], get_amount: Literal[False]) -> None:
@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import Literal, Optional, final
 
 from ..._helpers import format_seconds
+from ...context import ArkContext
 from .structure import Structure
 
 
@@ -44,6 +45,8 @@ class IndustrialForge(Structure):
         self,
         burning_item: Literal["wood", "metal", "oil"] = "wood",
         started_cooking: Optional[datetime] = None,
+        *,
+        context: Optional[ArkContext] = None,
     ) -> None:
         if burning_item not in ["wood", "metal", "oil"]:
             raise ValueError(
@@ -54,6 +57,7 @@ class IndustrialForge(Structure):
             action_wheel="assets/wheels/industrial_forge.png",
             capacity="assets/interfaces/forge_full.png",
             toggleable=True,
+            context=context,
         )
         self.started_cooking = started_cooking
         self._burning_item = burning_item
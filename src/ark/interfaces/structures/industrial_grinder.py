@@ -1,5 +1,6 @@
-from typing import final
+from typing import Optional, final
 
+from ...context import ArkContext
 from ...items import FLINT, Item
 from .._button import Button
 from .structure import Structure
@@ -25,12 +26,13 @@ class IndustrialGrinder(Structure):
     GRIND_ALL = Button((969, 663), (740, 570, 444, 140), "grind_all_items.png")
     GRIND_STACK = Button((963, 701))
 
-    def __init__(self) -> None:
+    def __init__(self, *, context: Optional[ArkContext] = None) -> None:
         super().__init__(
             name="Industrial Grinder",
             action_wheel="assets/wheels/industrial_grinder.png",
             craftables=[FLINT],
             toggleable=True,
+            context=context,
         )
 
     def can_grind(self) -> bool:
@@ -1,8 +1,9 @@
 import time
-from typing import final
+from typing import Optional, final
 
 from ... import config
 from ..._helpers import timedout
+from ...context import ArkContext
 from ...entities.player import Player
 from ..spawn_screen import SpawnScreen
 from ..wheels import TekPodWheel
@@ -17,10 +18,10 @@ class TekSleepingPod(Structure):
     to the `TekPodWheel` class.
     """
 
-    def __init__(self, name: str) -> None:
-        super().__init__(name, TekPodWheel())
+    def __init__(self, name: str, *, context: Optional[ArkContext] = None) -> None:
+        super().__init__(name, TekPodWheel(context=context), context=context)
         self.action_wheel: TekPodWheel
-        self.interface = SpawnScreen()
+        self.interface = SpawnScreen(context=self._context)
         
     def spawn(self) -> None:
         self.interface.travel_to(self.name)
@@ -4,6 +4,7 @@ import cv2  # type: ignore[import]
 from pytesseract import pytesseract as tes  # type: ignore[import]
 
 from ..._ark import Ark
+from ...context import ArkContext
 from ...exceptions import InventoryNotAccessibleError, NoGasolineError, WheelError
 from ...items import Item
 from .._button import Button
@@ -43,6 +44,9 @@ class Structure(Ark):
     toggleable :class:`bool`:
         Whether the structure can be turned on and off, `False` by default.
 
+    context :class:`ArkContext` [Optional]:
+        The context to bind the structure, its inventory and wheel to
+
     Attributes:
     -----------
     TURN_ON :class:`Button`-
@@ -73,16 +77,19 @@ class Structure(Ark):
         capacity: Optional[int | str] = None,
         *,
         toggleable: bool = False,
+        context: Optional[ArkContext] = None,
     ) -> None:
-        super().__init__()
+        super().__init__(context=context)
         if inventory and any((craftables, capacity)):
             raise ValueError(
                 "Did not expect 'craftables' or 'capacity' alongside 'inventory'."
             )
         if isinstance(action_wheel, str):
-            action_wheel = ActionWheel(name, action_wheel)
+            action_wheel = ActionWheel(name, action_wheel, context=self._context)
         if inventory is None:
-            self.inventory = Inventory(name, craftables, capacity)
+            self.inventory = Inventory(
+                name, craftables, capacity, context=self._context
+            )
         else:
             self.inventory = inventory
         self.action_wheel = action_wheel
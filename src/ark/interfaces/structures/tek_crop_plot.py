@@ -1,14 +1,18 @@
-from typing import final
+from typing import Optional, final
 
+from ...context import ArkContext
 from ..inventories import CropPlotInventory
 from .structure import Structure
 
 
 @final
 class TekCropPlot(Structure):
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str, *, context: Optional[ArkContext] = None) -> None:
         super().__init__(
-            name, "assets/wheels/tek_crop_plot.png", inventory=CropPlotInventory(name)
+            name,
+            "assets/wheels/tek_crop_plot.png",
+            inventory=CropPlotInventory(name, context=context),
+            context=context,
         )
 
     def plant_is_visible(self) -> bool:
@@ -1,8 +1,10 @@
 import time
 
+from .. import config
 from .._ark import Ark
 from .._helpers import await_event, timedout
 from ..exceptions import InterfaceError
+from ._added import added_popup_visible, capture_added_region, new_added_popup
 import cv2 as cv
 
 import pyautogui as pg
@@ -12,6 +14,9 @@ class TransferTool(Ark):
 
     last_transfer = None
 
+    _RATE = "TransferTool.transfer"
+    _ADDED_REGION = (40, 1020, 360, 60)
+
     def open(self) -> None:
         """Opens the escape menu."""
         start = time.time()
@@ -35,7 +40,7 @@ class TransferTool(Ark):
 
             if timedout(start, 30):
                 raise InterfaceError("Failed to close transertool!")
-        Ark.last_interface_exit = time.time()
+        self.context.last_interface_exit = time.time()
 
     def is_presets_open(self):
         roi = (1057, 749, 28, 150)
@@ -85,13 +90,32 @@ class TransferTool(Ark):
             self.transfer()
 
     def transfer(self):
-        while self.last_transfer is not None and time.time() - self.last_transfer < 1.2:
-            self.sleep(0.1)
+        """Transfers once the transfer rate allows it, the transfer is
+        acknowledged once a new added popup shows up within its interval.
+        A popup that was already visible before the click does not count."""
+        rate = self._RATE
+        self.transfer_rate.register(
+            rate, 1.2, config.TRANSFER_TOOL_FLOOR, config.TRANSFER_TOOL_CEILING
+        )
+        self.transfer_rate.wait(rate)
 
+        before = capture_added_region(self.window, self._ADDED_REGION)
         self.click_at(580, 928)
-        self.sleep(0.5)
+        self.transfer_rate.sent(rate)
         self.last_transfer = time.time()
 
+        if await_event(
+            lambda: new_added_popup(self.window, self._ADDED_REGION, before),
+            max_duration=self.transfer_rate.interval(rate),
+        ):
+            self.transfer_rate.acknowledged(rate)
+        else:
+            self.transfer_rate.missed(rate)
+
+    def received_item(self) -> bool:
+        """Checks if an item was added by matching for the added template"""
+        return added_popup_visible(self.window, self._ADDED_REGION)
+
     def is_open(self) -> bool:
         """Checks if the menu is open."""
         return (
@@ -1 +1,2 @@
+from ._parser import TribeLogEvent, TribeLogEventType, TribeLogParser
 from .tribelog import TribeLog, TribeLogMessage
@@ -111,6 +111,19 @@ DENOISE_MAPPING: dict[tuple[int, int, int], str | list] = {
     (158, 76, 76): f"{Ark.PKG_DIR}/assets/tribelog/tribelog_sensor.png",
 }
 
+# variance allowed for each denoise RGB, the purple text needs a higher variance
+EVENT_COLOR_VARIANCE: dict[tuple[int, int, int], int] = {
+    (255, 0, 0): 30,
+    (208, 3, 211): 50,
+    (158, 76, 76): 30,
+}
+
+# pixels of an event color needed to classify a message without templates, and
+# how much more of it there must be than of the second most common event color.
+# Any message below either is ambiguous and verified by the templates.
+EVENT_COLOR_MIN_PIXELS = 15
+EVENT_COLOR_MIN_RATIO = 3
+
 # Denoise RGB indicating a certain tribelog event
 EVENT_MAPPING: dict[tuple, str] = {
     (255, 0, 0): "Something destroyed!",
@@ -135,4 +148,28 @@ DAYTIME_MAPPING: dict[str, str] = {
 }
 
 # terms to prevent alerting for
-INGORED_TERMS: list[str] = ["C4", "Baby"]
\ No newline at end of file
+INGORED_TERMS: list[str] = ["C4", "Baby"]
+
+# patterns the contents of a tribelog message are parsed with, ordered by priority.
+# Each pattern describes one full (already corrected) message, entities within them
+# are further split up using the `ENTITY_PATTERN`.
+EVENT_PATTERNS: dict[str, list[str]] = {
+    "sensor": [r"'(?P<structure>.+?)' triggered by (?P<actor>.+?)!?"],
+    "destroyed": [
+        r"Your '?(?P<structure>.+?)'? was (?P<decay>auto-decay )?destroyed!?",
+        r"(?P<actor>.+?) destroyed your '?(?P<structure>.+?)'?!?",
+    ],
+    "killed": [
+        r"Your Tribe killed (?P<victim>.+?)!?",
+        r"(?:Your )?(?P<victim>.+?) was killed(?: by (?P<actor>.+?))?!?",
+    ],
+    "tamed": [r"Your Tribe Tamed (?:an? )?(?P<victim>.+?)!?"],
+}
+
+# an entity within a message, i.e "Rexy - Lvl 150 (Rex) (Tribe of Bob)"
+ENTITY_PATTERN = (
+    r"(?P<name>.+?) - Lvl (?P<level>\d+)"
+    r"(?: \((?P<detail>[^()]*)\))?(?: \((?P<tribe>[^()]*)\))?"
+)
+
+PIN_CODED_TERM = "(Pin Coded)"
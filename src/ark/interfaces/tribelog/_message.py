@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from functools import cached_property
+
+from ._parser import TribeLogEvent, parse_event
 
 
 @dataclass
@@ -15,3 +18,8 @@ class TribeLogMessage:
 
     def __post_init__(self) -> None:
         self.day = f"Day {self.day[4:]}" 
+
+    @cached_property
+    def event(self) -> TribeLogEvent:
+        """The structured event parsed from the messages contents."""
+        return parse_event(self.content)
@@ -0,0 +1,168 @@
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from enum import Enum
+from typing import Iterable, Optional
+
+from ._config import ENTITY_PATTERN, EVENT_PATTERNS, PIN_CODED_TERM
+
+
+class TribeLogEventType(str, Enum):
+    DESTROYED = "destroyed"
+    KILLED = "killed"
+    TAMED = "tamed"
+    SENSOR = "sensor"
+    UNKNOWN = "unknown"
+
+
+@dataclass
+class TribeLogEvent:
+    """Represents the parsed contents of a tribelog message.
+
+    Attributes
+    ----------
+    type :class:`TribeLogEventType`:
+        The kind of event the message describes
+
+    content :class:`str`:
+        The contents the event was parsed from
+
+    actor :class:`str` [Optional]:
+        Whoever caused the event, i.e the killer or what triggered a sensor
+
+    victim :class:`str` [Optional]:
+        The name of the entity that was killed or tamed
+
+    structure :class:`str` [Optional]:
+        The structure that was destroyed or the name of the triggered sensor
+
+    tribe :class:`str` [Optional]:
+        The (enemy) tribe involved in the event, if it could be determined
+
+    level :class:`int` [Optional]:
+        The level of the victim, or of the actor if there is no victim
+
+    pin_coded :class:`bool`:
+        Whether the destroyed structure was pin coded
+
+    auto_decay :class:`bool`:
+        Whether the structure was destroyed by auto-decay rather than an enemy
+    """
+
+    type: TribeLogEventType
+    content: str
+    actor: Optional[str] = None
+    victim: Optional[str] = None
+    structure: Optional[str] = None
+    tribe: Optional[str] = None
+    level: Optional[int] = None
+    pin_coded: bool = False
+    auto_decay: bool = False
+
+
+class TribeLogParser:
+    """Parses the contents of tribelog messages into `TribeLogEvent`s.
+
+    The patterns of the `EVENT_PATTERNS` are compiled once, when parsing
+    a batch of messages each pattern runs a single time over all messages
+    joined together rather than once per message.
+    """
+
+    def __init__(self) -> None:
+        self._patterns = [
+            (TribeLogEventType(event), re.compile(f"^{pattern}$", re.MULTILINE))
+            for event, patterns in EVENT_PATTERNS.items()
+            for pattern in patterns
+        ]
+        self._entity = re.compile(f"^{ENTITY_PATTERN}$")
+
+    def parse(self, content: str) -> TribeLogEvent:
+        """Parses the contents of a single message."""
+        return self.parse_many([content])[0]
+
+    def parse_many(self, contents: Iterable[str]) -> list[TribeLogEvent]:
+        """Parses the contents of a batch of messages, the returned events
+        are in the same order as the contents that were passed."""
+        lines = [" ".join(content.split()) for content in contents]
+        blob = "\n".join(lines)
+
+        offsets, offset = [], 0
+        for line in lines:
+            offsets.append(offset)
+            offset += len(line) + 1
+
+        events: list[Optional[TribeLogEvent]] = [None] * len(lines)
+        unresolved = len(lines)
+        for event_type, pattern in self._patterns:
+            if not unresolved:
+                break
+
+            for match in pattern.finditer(blob):
+                idx = bisect_right(offsets, match.start()) - 1
+                if events[idx] is not None:
+                    continue
+                events[idx] = self._create_event(event_type, match, lines[idx])
+                unresolved -= 1
+
+        return [
+            event or TribeLogEvent(TribeLogEventType.UNKNOWN, line)
+            for event, line in zip(events, lines)
+        ]
+
+    def _create_event(
+        self, event_type: TribeLogEventType, match: re.Match, content: str
+    ) -> TribeLogEvent:
+        groups = match.groupdict()
+        event = TribeLogEvent(event_type, content, auto_decay=bool(groups.get("decay")))
+
+        if structure := groups.get("structure"):
+            event.pin_coded = PIN_CODED_TERM in structure
+            event.structure = structure.replace(PIN_CODED_TERM, "").strip(" '")
+
+        victim = self._entity.match(groups.get("victim") or "")
+        actor = self._entity.match(groups.get("actor") or "")
+
+        if victim is not None:
+            event.victim = victim["name"]
+            event.level = int(victim["level"])
+        else:
+            event.victim = groups.get("victim")
+
+        if actor is not None:
+            event.actor = actor["name"]
+            event.level = event.level or int(actor["level"])
+        else:
+            event.actor = groups.get("actor")
+
+        # the tribe of the actor is most relevant, if there is no actor
+        # it is the tribe of the victim (i.e our tribe killed someone)
+        event.tribe = groups.get("tribe")
+        if event_type == TribeLogEventType.DESTROYED and actor is None:
+            # structures are destroyed by an entity or by the tribe itself
+            event.tribe = event.actor
+        for entity in (actor, victim):
+            if event.tribe or entity is None:
+                continue
+            event.tribe = entity["tribe"] or self._get_entity_tribe(entity)
+        return event
+
+    def _get_entity_tribe(self, entity: re.Match) -> Optional[str]:
+        """A single detail is either the species of a dino or the tribe of a
+        player, it can only be told apart if the tribe has the default name."""
+        detail = entity["detail"]
+        if detail is None or not detail.startswith("Tribe of"):
+            return None
+        return detail
+
+
+_PARSER = TribeLogParser()
+
+
+def parse_event(content: str) -> TribeLogEvent:
+    """Parses the given tribelog contents using the shared parser."""
+    return _PARSER.parse(content)
+
+
+def parse_events(contents: Iterable[str]) -> list[TribeLogEvent]:
+    """Parses a batch of tribelog contents using the shared parser."""
+    return _PARSER.parse_many(contents)
@@ -1,4 +1,4 @@
-from typing import Generator
+from typing import Generator, Optional
 
 import cv2 as cv  # type: ignore[import]
 import numpy as np
@@ -7,11 +7,33 @@ from PIL import Image  # type: ignore[import]
 from pytesseract import pytesseract as tes  # type: ignore[import]
 
 from ..._ark import Ark
+from ...context import ArkContext
 from ...exceptions import LogsNotOpenedError
 from .._button import Button
 from ._config import (CONTENTS_MAPPING, DAYTIME_MAPPING, DENOISE_MAPPING,
-                      EVENT_MAPPING, INGORED_TERMS)
+                      EVENT_COLOR_MIN_PIXELS, EVENT_COLOR_MIN_RATIO,
+                      EVENT_COLOR_VARIANCE, EVENT_MAPPING, INGORED_TERMS)
 from ._message import TribeLogMessage
+from ._parser import TribeLogEvent, parse_events
+
+
+def _build_event_color_luts() -> tuple[np.ndarray, np.ndarray]:
+    """Builds a lookup table per BGR channel that maps a channel value to a
+    bitmask of the event colors it is within the variance of, as well as a
+    matrix to map each combined bitmask back to the colors it contains."""
+    colors = np.array(list(DENOISE_MAPPING), dtype=np.int16)
+    variance = np.array([EVENT_COLOR_VARIANCE[rgb] for rgb in DENOISE_MAPPING])
+    bits = 1 << np.arange(len(colors))
+    values = np.arange(256)[:, None]
+
+    luts = np.stack(
+        [
+            ((np.abs(values - colors[:, channel]) <= variance) * bits).sum(axis=1)
+            for channel in (2, 1, 0)
+        ]
+    ).astype(np.uint8)
+    masks = np.arange(1 << len(colors))[:, None]
+    return luts, (masks & bits) != 0
 
 
 class TribeLog(Ark):
@@ -26,16 +48,22 @@ class TribeLog(Ark):
 
     LOG_REGION = 1340, 180, 460, 820
 
+    _HEADER = (1300, 70, 230, 85)
     _ONLINE_AXIS = (1132, 315, 111, 720)
+    # color of the 'ONLINE' text as compared by `denoise_text` (from online.png)
+    _ONLINE_TEXT = (144, 127, 48)
 
     _TOGGLE_ONLINE = Button(
         (1063, 125), (1035, 97, 52, 52), "toggle_online_members.png"
     )
+    _EVENT_COLOR_LUTS, _EVENT_COLOR_MASKS = _build_event_color_luts()
 
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, *, context: Optional[ArkContext] = None) -> None:
+        super().__init__(context=context)
         self._tribe_log: list[TribeLogMessage] = []
         self._online_members: int | None = None
+        self._online_rows: list[int] = []
+        self._online_toggled = False
 
     def __repr__(self) -> str:
         """A representative string of the log message"""
@@ -45,22 +73,37 @@ class TribeLog(Ark):
         for message in self._tribe_log:
             yield message
 
+    @property
+    def events(self) -> list[TribeLogEvent]:
+        """The structured events of all messages currently in the tribelog,
+        parsed as a single batch."""
+        return parse_events(message.content for message in self._tribe_log)
+
     @property
     def online_members(self) -> str:
         if self._online_members is None:
             return "?"
-        if self._online_members >= 12:
-            return "12+"
+        if self._online_list_is_full():
+            return f"{self._online_members}+"
         return str(self._online_members)
 
+    @property
+    def online_rows(self) -> list[int]:
+        """The y-positions of the online members within the online axis."""
+        return self._online_rows
+
     def toggle_online_members(self) -> None:
+        """Toggles the panel to only show online members, the toggle state is
+        remembered until the tribelog is opened or closed again."""
         assert self._TOGGLE_ONLINE.template and self._TOGGLE_ONLINE.region
+        if self._online_toggled:
+            return
 
-        if self.window.locate_template(
+        if not self.window.locate_template(
             self._TOGGLE_ONLINE.template, self._TOGGLE_ONLINE.region, confidence=0.8
         ):
-            return
-        self.click_at(self._TOGGLE_ONLINE.location)
+            self.click_at(self._TOGGLE_ONLINE.location)
+        self._online_toggled = True
 
     def find_tribelog_events(self, img: ScreenShot) -> list[TribeLogMessage]:
         """Runs a scan on the tribelog snapshot to find all 'Day' occurrences, then
@@ -112,23 +155,35 @@ class TribeLog(Ark):
         return self.window.grab_screen(self.LOG_REGION)
 
     def get_online_members(self) -> None:
+        """Counts the online members by masking the 'ONLINE' text in the online
+        axis and counting the connected components, each being one member."""
         self.toggle_online_members()
-        online = len(
-            self.window.locate_all_template(
-                f"{self.PKG_DIR}/assets/interfaces/online.png",
-                region=self._ONLINE_AXIS,
-                confidence=0.7,
-                grayscale=True,
-            )
+        img = self.window.grab_screen(self._ONLINE_AXIS)
+        mask = self.window.denoise_text(
+            img, self._ONLINE_TEXT, variance=12, dilate=False
         )
-        self._online_members = online
 
-    def is_open(self) -> bool:
-        """Checks if the tribelog is open."""
+        # close the gaps between the letters so each 'ONLINE' is one component
+        mask = cv.morphologyEx(mask, cv.MORPH_CLOSE, np.ones((3, 9), np.uint8))
+        _, _, stats, centroids = cv.connectedComponentsWithStats(mask, connectivity=8)
+
+        self._online_rows = sorted(
+            int(cy)
+            for (_, _, w, _, area), (_, cy) in zip(stats[1:], centroids[1:])
+            if w >= 30 and area >= 40
+        )
+        self._online_members = len(self._online_rows)
+
+    def is_open(self, cached: bool = False) -> bool:
+        """Checks if the tribelog is open. If `cached` is set, a recent result
+        is trusted as long as the tribelog header looks the same."""
+        return self.tracker.check("tribelog", self._check_open, self._HEADER, cached)
+
+    def _check_open(self) -> bool:
         return (
             self.window.locate_template(
                 f"{self.PKG_DIR}/assets/interfaces/tribe_log.png",
-                region=(1300, 70, 230, 85),
+                region=self._HEADER,
                 confidence=0.8,
             )
             is not None
@@ -138,6 +193,7 @@ class TribeLog(Ark):
         """Opens the tribe log. Tries up to 20 times and raises a
         `LogsNotOpenedError` if unsuccessful.
         """
+        self._online_toggled = False
         c = 0
         while not self.is_open():
             self.press(self.keybinds.logs)
@@ -152,6 +208,7 @@ class TribeLog(Ark):
 
     def close(self) -> None:
         """Closes the tribelogs."""
+        self._online_toggled = False
         while self.is_open():
             self.press("esc")
             if self.await_closed():
@@ -302,7 +359,7 @@ class TribeLog(Ark):
         prepared_img = self.window.denoise_text(
             image,
             denoise_rgb,
-            30 if not denoise_rgb == (208, 3, 211) else 50,
+            EVENT_COLOR_VARIANCE[denoise_rgb],
             upscale=True,
             upscale_by=2,
         )
@@ -356,15 +413,18 @@ class TribeLog(Ark):
             image = np.array(image)
             image = cv.cvtColor(image, cv.COLOR_BGR2RGB)
         try:
+            rgb, ambiguous = self.classify_event_color(image)
+            if not ambiguous:
+                # auto-decay is displayed in the same red as destroyed structures
+                if rgb == (255, 0, 0) and self._is_auto_decay(image):
+                    return None
+                return rgb
+
             # filter out auto-decay
-            if self.window.locate_in_image(
-                f"{self.PKG_DIR}/assets/tribelog/tribelog_auto_decay.png",
-                image,
-                confidence=0.8,
-            ):
+            if self._is_auto_decay(image):
                 return None
 
-            # find the RGB we need to denoise
+            # ambiguous colors, find the RGB we need to denoise by templates
             for rgb in DENOISE_MAPPING:
                 template = DENOISE_MAPPING[rgb]
 
@@ -390,6 +450,46 @@ class TribeLog(Ark):
             print(f"Something went wrong!\n{e}")
             return None
 
+    def classify_event_color(
+        self, image: np.ndarray
+    ) -> tuple[tuple[int, int, int] | None, bool]:
+        """Classifies the event color of a message by counting the pixels of each
+        `DENOISE_MAPPING` color within its variance in a single pass.
+
+        Parameters:
+        ------------
+        image :class:`np.ndarray`:
+            The message as BGR image
+
+        Returns:
+        -----------
+        A tuple of the classified RGB (or `None` if it is not certain)
+        and whether the result is ambiguous and should be verified otherwise.
+        """
+        # every other pixel is plenty to tell the text colors apart
+        image = np.asarray(image)[::2, ::2]
+        luts = self._EVENT_COLOR_LUTS
+        mask = luts[0][image[..., 0]] & luts[1][image[..., 1]] & luts[2][image[..., 2]]
+        counts = np.bincount(mask.ravel(), minlength=len(self._EVENT_COLOR_MASKS))
+        hits = counts @ self._EVENT_COLOR_MASKS
+
+        order = np.argsort(hits)[::-1]
+        best, runner_up = hits[order[0]], hits[order[1]] if len(order) > 1 else 0
+        # too few pixels may just be a small or faint message, the templates decide
+        if best < EVENT_COLOR_MIN_PIXELS or best < runner_up * EVENT_COLOR_MIN_RATIO:
+            return None, True
+        return list(DENOISE_MAPPING)[order[0]], False
+
+    def _is_auto_decay(self, image: np.ndarray) -> bool:
+        return (
+            self.window.locate_in_image(
+                f"{self.PKG_DIR}/assets/tribelog/tribelog_auto_decay.png",
+                image,
+                confidence=0.8,
+            )
+            is not None
+        )
+
     def get_sensor_event(self, image: Image.Image | str) -> str:
         """Matches for different terms that could have triggered a tek sensor,
         returns the corresponding term.
@@ -448,6 +548,15 @@ class TribeLog(Ark):
                 return True
         return False
 
+    def _online_list_is_full(self) -> bool:
+        """Checks whether the online members fill up the entire axis, in which
+        case there may be more members than visible."""
+        if len(self._online_rows) < 2:
+            return False
+
+        pitch = float(np.median(np.diff(self._online_rows)))
+        return self._online_rows[-1] + pitch > self._ONLINE_AXIS[3]
+
     def delete_old_logs(self) -> None:
         """Deletes all but the past 30 messages in the tribelogs."""
         if len(self._tribe_log) < 30:
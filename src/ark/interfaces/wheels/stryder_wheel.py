@@ -1,15 +1,18 @@
+from typing import Optional
+
 import cv2 as cv  # type:ignore[import]
 import numpy as np
 import pyautogui  # type:ignore[import]
 
 from ..._helpers import find_center, find_closest_pixel, get_center
+from ...context import ArkContext
 from ...exceptions import ActionNotFoundError
 from .wheel import ActionWheel
 
 
 class StryderWheel(ActionWheel):
-    def __init__(self) -> None:
-        super().__init__("Stryder", "assets/wheels/stryder.png")
+    def __init__(self, *, context: Optional[ArkContext] = None) -> None:
+        super().__init__("Stryder", "assets/wheels/stryder.png", context=context)
 
     def enter_dedi_transfer_tab(self) -> None:
         self.sleep(1)
@@ -1,11 +1,14 @@
+from typing import Optional
+
 import pyautogui  # type:ignore[import]
 
+from ...context import ArkContext
 from .wheel import ActionWheel
 
 
 class TekPodWheel(ActionWheel):
-    def __init__(self) -> None:
-        super().__init__("Tek Sleeping Pod", "assets/wheels/pod.png")
+    def __init__(self, *, context: Optional[ArkContext] = None) -> None:
+        super().__init__("Tek Sleeping Pod", "assets/wheels/pod.png", context=context)
 
     def lay_on(self) -> None:
         self.select_action((1166, 495), click=False)
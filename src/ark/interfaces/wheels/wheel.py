@@ -1,3 +1,5 @@
+from typing import Optional
+
 import cv2  # type:ignore[import]
 import pyautogui  # type: ignore[import]
 import pydirectinput  # type: ignore[import]
@@ -6,6 +8,7 @@ from pytesseract import pytesseract as tes  # type: ignore[import]
 from ..._ark import Ark
 from ..._helpers import (await_event, find_center, find_closest_pixel,
                        get_center, get_filepath)
+from ...context import ArkContext
 from ...exceptions import UnexpectedWheelError, WheelNotAccessibleError
 
 
@@ -29,8 +32,10 @@ class ActionWheel(Ark):
     _WHEEL_NAME_AREA = (840, 425, 240, 230)
     _WHEEL_AREA = (543, 135, 867, 825)
 
-    def __init__(self, name: str, filepath: str) -> None:
-        super().__init__()
+    def __init__(
+        self, name: str, filepath: str, *, context: Optional[ArkContext] = None
+    ) -> None:
+        super().__init__(context=context)
         self._name = name
         self._filepath = get_filepath(filepath)
 
@@ -134,8 +139,14 @@ class ActionWheel(Ark):
         )
         return raw.replace("\n", " ").replace("{", "(").replace("}", "}")
 
-    def is_open(self) -> bool:
-        """Returns whether the action wheel is currently open"""
+    def is_open(self, cached: bool = False) -> bool:
+        """Returns whether the action wheel is currently open. If `cached` is
+        set, a recent result is trusted as long as the wheel looks the same."""
+        return self.tracker.check(
+            f"wheel:{self._filepath}", self._check_open, self._WHEEL_NAME_AREA, cached
+        )
+
+    def _check_open(self) -> bool:
         return (
             self.window.locate_template(
                 self._filepath,
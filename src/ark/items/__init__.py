@@ -1,4 +1,6 @@
 from .item import Item
+from ._recipes import RecipeGraph, get_recipe_graph
+from ._registry import ItemRegistry, get_registry, normalize_name
 from .armor import *
 from .consumables import *
 from .resources import *
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+import numpy as np
+
+from ._registry import get_registry
+from .item import Item
+
+
+class RecipeGraph:
+    """An index over the recipes of a set of items, built once.
+
+    The items are sorted topologically so every item comes after all of
+    its components. Each item is assigned a row of two dense matrices, the
+    direct components of a single craft and the base materials it breaks
+    down into, so the cost of any recipe is a single vector product rather
+    than a recursive walk of the recipes.
+
+    Parameters
+    ----------
+    items :class:`Iterable[Item]`:
+        The items to index, components of the items are indexed as well
+    """
+
+    def __init__(self, items: Iterable[Item]) -> None:
+        self._items = self._sort(items)
+        self._index = {item: idx for idx, item in enumerate(self._items)}
+
+        self._base = [item for item in self._items if item.recipe is None]
+        base_index = {item: idx for idx, item in enumerate(self._base)}
+
+        n = len(self._items)
+        self._components = np.zeros((n, n), dtype=np.int64)
+        self._base_cost = np.zeros((n, len(self._base)), dtype=np.int64)
+        self._depth = np.zeros(n, dtype=np.int64)
+
+        for idx, item in enumerate(self._items):
+            if item.recipe is None:
+                self._base_cost[idx, base_index[item]] = 1
+                continue
+
+            for component, amount in item.recipe.items():
+                comp_idx = self._index[component]
+                self._components[idx, comp_idx] += amount
+                self._base_cost[idx] += amount * self._base_cost[comp_idx]
+                self._depth[idx] = max(self._depth[idx], self._depth[comp_idx] + 1)
+
+    def __contains__(self, item: Item) -> bool:
+        return item in self._index
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def items(self) -> list[Item]:
+        """All indexed items, every item comes after its components."""
+        return self._items
+
+    @property
+    def base_materials(self) -> list[Item]:
+        """The indexed items that can not be crafted."""
+        return self._base
+
+    @property
+    def components(self) -> np.ndarray:
+        """The amount of each item (column) a single craft of an item (row) takes."""
+        return self._components
+
+    @property
+    def base_cost(self) -> np.ndarray:
+        """The amount of each base material (column) an item (row) breaks down into."""
+        return self._base_cost
+
+    def index(self, item: Item) -> int:
+        return self._index[item]
+
+    def depth(self, item: Item) -> int:
+        """Returns how many layers of components an item has."""
+        return int(self._depth[self._index[item]])
+
+    def vector(self, amounts: dict[Item, int]) -> np.ndarray:
+        """Converts a mapping of items to amounts into a vector over all items."""
+        vec = np.zeros(len(self._items), dtype=np.int64)
+        for item, amount in amounts.items():
+            vec[self._index[item]] += amount
+        return vec
+
+    def break_down(self, amounts: dict[Item, int]) -> dict[Item, int]:
+        """Returns the base materials the given items break down into."""
+        cost = self.vector(amounts) @ self._base_cost
+        return {
+            item: int(amount)
+            for item, amount in zip(self._base, cost)
+            if amount or item in amounts
+        }
+
+    def _sort(self, items: Iterable[Item]) -> list[Item]:
+        """Sorts the items and all of their components topologically."""
+        order: list[Item] = []
+        state: dict[Item, bool] = {}
+
+        def visit(item: Item) -> None:
+            if item in state:
+                if not state[item]:
+                    raise ValueError(f"Recipe of {item.name} depends on itself.")
+                return
+
+            state[item] = False
+            for component in item.recipe or ():
+                visit(component)
+            state[item] = True
+            order.append(item)
+
+        for item in items:
+            visit(item)
+        return order
+
+
+_GRAPH: Optional[RecipeGraph] = None
+
+
+def get_recipe_graph(*items: Item) -> RecipeGraph:
+    """Returns the recipe graph over all items of the item registry. It is built
+    on the first call and only rebuilt if an item is passed that it lacks."""
+    global _GRAPH
+
+    if _GRAPH is not None and all(item in _GRAPH for item in items):
+        return _GRAPH
+
+    registry = get_registry()
+    for item in items:
+        registry.register(item)
+
+    known = registry.items
+    if _GRAPH is not None:
+        known.extend(_GRAPH.items)
+    _GRAPH = RecipeGraph([*known, *items])
+    return _GRAPH
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import difflib
+import re
+from threading import Lock
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+from . import armor, consumables, resources, structures, weapons
+from .item import Item
+
+if TYPE_CHECKING:
+    from ..interfaces.inventories._recognizer import ItemRecognizer
+
+# characters tesseract commonly reads in place of letters, names may contain
+# digits (i.e. "C4 Remote Detonator") but none of these
+_OCR_CONFUSIONS = str.maketrans({"0": "o", "1": "l", "5": "s", "8": "b", "|": "l"})
+
+
+def normalize_name(text: str) -> str:
+    """Normalizes an item name or an OCR'd text of it for lookups, i.e
+    `"Metal  Ingot\\n"` and `"meta1 ingot"` both become `"metal ingot"`."""
+    text = text.lower().translate(_OCR_CONFUSIONS)
+    return " ".join(re.findall(r"[a-z0-9]+", text))
+
+
+class ItemRegistry:
+    """An index over a set of items to look them up by their name, their
+    search name, a fuzzy OCR'd name or one of their icons.
+
+    The icon descriptors to recognize the items in inventory tiles are
+    only computed once they are first needed.
+
+    Parameters
+    ----------
+    items :class:`Iterable[Item]`:
+        The items to index, items sharing a name are only indexed once
+    """
+
+    def __init__(self, items: Iterable[Item]) -> None:
+        self._items: dict[str, Item] = {}
+        self._by_search_name: dict[str, list[Item]] = {}
+        self._by_icon: dict[str, Item] = {}
+        self._matches: dict[tuple[str, float], Optional[Item]] = {}
+        self._recognizer: Optional[ItemRecognizer] = None
+        self._lock = Lock()
+
+        for item in items:
+            self.register(item)
+
+    def __contains__(self, item: Item) -> bool:
+        return normalize_name(item.name) in self._items
+
+    def __iter__(self) -> Iterator[Item]:
+        return iter(self._items.values())
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, name: str) -> Item:
+        return self._items[normalize_name(name)]
+
+    @property
+    def items(self) -> list[Item]:
+        return list(self._items.values())
+
+    def register(self, item: Item) -> None:
+        """Adds an item to the registry, does nothing if an item of the same
+        name is registered already."""
+        with self._lock:
+            key = normalize_name(item.name)
+            if key in self._items:
+                return
+
+            self._items[key] = item
+            self._by_search_name.setdefault(item.search_name.lower(), []).append(item)
+            for path in (item.inventory_icon, item.added_icon, item.added_text):
+                if path is not None:
+                    self._by_icon[path] = item
+
+            self._matches.clear()
+            self._recognizer = None
+
+    def get(self, name: str) -> Optional[Item]:
+        """Returns the item of the given name, `None` if there is none."""
+        return self._items.get(normalize_name(name))
+
+    def by_search_name(self, search_name: str) -> list[Item]:
+        """Returns the items that are searched for by the given term."""
+        return list(self._by_search_name.get(search_name.lower(), ()))
+
+    def by_icon(self, path: str) -> Optional[Item]:
+        """Returns the item one of the icons or texts of which is at the path."""
+        return self._by_icon.get(path)
+
+    def match(self, text: str, cutoff: float = 0.8) -> Optional[Item]:
+        """Returns the item whose name is closest to an OCR'd text.
+
+        Parameters
+        ----------
+        text :class:`str`:
+            The text to match, case and punctuation are ignored
+
+        cutoff :class:`float`:
+            How similar the text has to be to the name of an item to match it
+
+        Returns
+        -------
+        :class:`Item | None`:
+            The matching item, `None` if no item is similar enough
+        """
+        key = normalize_name(text)
+        if not key:
+            return None
+        if key in self._items:
+            return self._items[key]
+
+        cache_key = (key, cutoff)
+        if cache_key not in self._matches:
+            names = difflib.get_close_matches(key, self._items, n=1, cutoff=cutoff)
+            self._matches[cache_key] = self._items[names[0]] if names else None
+        return self._matches[cache_key]
+
+    @property
+    def recognizer(self) -> ItemRecognizer:
+        """The recognizer holding the icon descriptors of the registered items,
+        created on first access."""
+        from ..interfaces.inventories._recognizer import ItemRecognizer
+
+        with self._lock:
+            if self._recognizer is None:
+                self._recognizer = ItemRecognizer(self._items.values())
+            return self._recognizer
+
+
+_REGISTRY = ItemRegistry(
+    obj
+    for module in (armor, consumables, resources, structures, weapons)
+    for obj in vars(module).values()
+    if isinstance(obj, Item)
+)
+
+
+def get_registry() -> ItemRegistry:
+    """Returns the registry of all items of `ark.items`, built once on import.
+    Items defined elsewhere can be added to it with `ItemRegistry.register`."""
+    return _REGISTRY
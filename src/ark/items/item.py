@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import os
 from dataclasses import dataclass
 from typing import Optional
 
@@ -32,9 +31,4 @@ class Item:
             self.added_icon = get_filepath(self.added_icon)
 
         if self.added_text is not None:
-            self.added_text = get_filepath(self.added_text)
-
-        for path in (self.inventory_icon, self.added_icon, self.added_text):
-            if path is None:
-                continue
-            assert os.path.exists(path), f"Path not found: {path}"
\ No newline at end of file
+            self.added_text = get_filepath(self.added_text)
\ No newline at end of file
@@ -1,5 +1,18 @@
 from .input_settings import InputSettings
 from .user_settings import UserSettings
-from .dino_export import DinoExport
-__all__ = ("InputSettings", "UserSettings", "DinoExport")
+from .dino_export import DinoExport, DinoExportCatalog, ExportEntry
+from .dino_stats import DinoStatTable
+from ._watcher import SettingChange, SettingsChanged, SettingsWatcher
+
+__all__ = (
+    "InputSettings",
+    "UserSettings",
+    "DinoExport",
+    "DinoExportCatalog",
+    "ExportEntry",
+    "DinoStatTable",
+    "SettingsWatcher",
+    "SettingsChanged",
+    "SettingChange",
+)
 
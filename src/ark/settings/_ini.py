@@ -0,0 +1,88 @@
+import codecs
+import copy
+import os
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+# modification time in nanoseconds and size of a file
+Signature = tuple[int, int]
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+_CACHE: dict[tuple[str, Callable], tuple[Signature, Any]] = {}
+_CACHE_LOCK = Lock()
+
+
+def file_signature(path: str | Path) -> Optional[Signature]:
+    """Returns the signature of a file, `None` if it can not be accessed."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def detect_encoding(path: str | Path) -> str:
+    """Detects the encoding of a file from its byte order mark, the game
+    writes its .ini files in utf-16 or utf-8 depending on the file."""
+    with open(path, "rb") as f:
+        head = f.read(4)
+
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+
+    # utf-16 without a byte order mark, every ascii character has a null byte
+    if len(head) >= 2 and head[1] == 0:
+        return "utf-16-le"
+    return "utf-8"
+
+
+def iter_lines(path: str | Path) -> Iterator[str]:
+    """Streams the lines of an .ini file, detecting its encoding once."""
+    with open(path, encoding=detect_encoding(path), errors="replace") as f:
+        yield from f
+
+
+def load_cached(path: str | Path, parser: Callable[[str], T]) -> T:
+    """Parses the file with the parser, unless it has been parsed by it
+    before and has not changed since.
+
+    Parameters
+    ----------
+    path :class:`str | Path`:
+        The path of the file to parse
+
+    parser :class:`Callable[[str], T]`:
+        Parses the file at the given path, results are cached per parser
+
+    Returns
+    -------
+    `T`:
+        A copy of the parsed result, so changing it does not change the cache
+    """
+    signature = file_signature(path)
+    key = (os.path.abspath(path), parser)
+
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key)
+    if cached is not None and signature is not None and cached[0] == signature:
+        return copy.copy(cached[1])
+
+    result = parser(str(path))
+    if signature is not None:
+        with _CACHE_LOCK:
+            _CACHE[key] = (signature, result)
+    return copy.copy(result)
+
+
+def clear_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
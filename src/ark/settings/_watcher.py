@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Callable, Literal, Optional
+
+from .. import config
+from ..context import ArkContext, current_context
+from ._ini import Signature, file_signature
+from .input_settings import InputSettings
+from .user_settings import UserSettings
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SettingChange:
+    """A single setting that has changed.
+
+    Attributes
+    ----------
+    name :class:`str`:
+        The name of the attribute of the settings that changed
+
+    old :class:`Any`:
+        The value before the change
+
+    new :class:`Any`:
+        The value after the change
+    """
+
+    name: str
+    old: Any
+    new: Any
+
+
+@dataclass(frozen=True)
+class SettingsChanged:
+    """Published by the `SettingsWatcher` once the settings or keybinds of
+    its context have been swapped for the reloaded ones.
+
+    Attributes
+    ----------
+    kind :class:`str`:
+        Whether the `settings` or the `keybinds` changed
+
+    path :class:`Path`:
+        The file that changed
+
+    changes :class:`tuple[SettingChange, ...]`:
+        The settings that changed
+
+    current :class:`UserSettings | InputSettings`:
+        The settings that are now used by the context
+    """
+
+    kind: Literal["settings", "keybinds"]
+    path: Path
+    changes: tuple[SettingChange, ...]
+    current: UserSettings | InputSettings
+
+
+@dataclass
+class _WatchedFile:
+    kind: Literal["settings", "keybinds"]
+    path: Path
+    loader: Callable[[str], UserSettings | InputSettings]
+    signature: Optional[Signature]
+    pending: Optional[Signature] = None
+    pending_since: float = 0
+
+
+class SettingsWatcher:
+    """Watches the GameUserSettings.ini and the Input.ini of a context and
+    swaps the settings and keybinds of the context when either file changes.
+
+    On windows the watcher thread blocks on change notifications of the
+    config directory, elsewhere it polls the modification time and size of
+    the files. A change is only parsed once the file has not changed for
+    the debounce period, so a file that is still being written is not read.
+
+    Parameters
+    ----------
+    context :class:`ArkContext` [Optional]:
+        The context to watch the settings of, the active context by default
+
+    interval :class:`float` [Optional]:
+        The most time between two checks of the files
+
+    debounce :class:`float` [Optional]:
+        How long a change has to settle before the file is parsed
+    """
+
+    def __init__(
+        self,
+        context: Optional[ArkContext] = None,
+        interval: Optional[float] = None,
+        debounce: Optional[float] = None,
+    ) -> None:
+        self.context = context or current_context()
+        self.interval = interval or config.SETTINGS_POLL_INTERVAL
+        self.debounce = config.SETTINGS_DEBOUNCE if debounce is None else debounce
+
+        if self.context.settings is None:
+            self.context.settings = UserSettings.load()
+        if self.context.keybinds is None:
+            self.context.keybinds = InputSettings.load()
+
+        settings_path = self.context.settings.path
+        keybinds_path = settings_path.with_name("Input.ini")
+        self._files = [
+            _WatchedFile(
+                "settings", settings_path, UserSettings.load, file_signature(settings_path)
+            ),
+            _WatchedFile(
+                "keybinds", keybinds_path, InputSettings.load, file_signature(keybinds_path)
+            ),
+        ]
+
+        self._subscribers: list[Callable[[SettingsChanged], None]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> SettingsWatcher:
+        self.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.stop()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def subscribe(self, callback: Callable[[SettingsChanged], None]) -> Callable[[], None]:
+        """Calls the callback with every change that is published from now on,
+        returns a function to unsubscribe the callback again."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="settings-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def poll(self) -> list[SettingsChanged]:
+        """Checks the files once, reloading and publishing those that have
+        changed and settled since the last check."""
+        events = []
+        now = time.monotonic()
+
+        for file in self._files:
+            signature = file_signature(file.path)
+            if signature is None or signature == file.signature:
+                file.pending = None
+                continue
+
+            if signature != file.pending:
+                file.pending, file.pending_since = signature, now
+                if self.debounce:
+                    continue
+            elif now - file.pending_since < self.debounce:
+                continue
+
+            try:
+                current = file.loader(str(file.path))
+            except Exception:
+                # still being written or locked by the game, try again later
+                continue
+
+            file.signature, file.pending = signature, None
+            old = getattr(self.context, file.kind)
+            setattr(self.context, file.kind, current)
+
+            changes = _diff(old, current)
+            if changes:
+                events.append(SettingsChanged(file.kind, file.path, changes, current))
+
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for event in events:
+            for callback in subscribers:
+                # a failing subscriber must not stop the others or the watcher
+                try:
+                    callback(event)
+                except Exception:
+                    _log.exception("Settings subscriber %r failed", callback)
+        return events
+
+    def _run(self) -> None:
+        wait = _ChangeNotification(self._files[0].path.parent)
+        try:
+            while not self._stop.is_set():
+                try:
+                    self.poll()
+                except Exception:
+                    _log.exception("Polling the settings files failed")
+                pending = any(file.pending is not None for file in self._files)
+                # wake up once a pending change has settled
+                timeout = self.debounce if pending and self.debounce else self.interval
+                if not wait(timeout):
+                    self._stop.wait(timeout)
+        finally:
+            wait.close()
+
+
+class _ChangeNotification:
+    """Blocks until a file in the directory is written, only on windows.
+    Calling it returns `False` if notifications are not available."""
+
+    def __init__(self, directory: Path) -> None:
+        self._handle = None
+        try:
+            import win32con  # type: ignore[import]
+            import win32file  # type: ignore[import]
+
+            self._handle = win32file.FindFirstChangeNotification(
+                str(directory),
+                False,
+                win32con.FILE_NOTIFY_CHANGE_LAST_WRITE | win32con.FILE_NOTIFY_CHANGE_SIZE,
+            )
+        except Exception:
+            self._handle = None
+
+    def __call__(self, timeout: float) -> bool:
+        if self._handle is None:
+            return False
+
+        import win32event  # type: ignore[import]
+        import win32file  # type: ignore[import]
+
+        result = win32event.WaitForSingleObject(self._handle, int(timeout * 1000))
+        if result == win32event.WAIT_OBJECT_0:
+            win32file.FindNextChangeNotification(self._handle)
+        return True
+
+    def close(self) -> None:
+        if self._handle is not None:
+            import win32file  # type: ignore[import]
+
+            win32file.FindCloseChangeNotification(self._handle)
+            self._handle = None
+
+
+def _diff(old: Any, new: Any) -> tuple[SettingChange, ...]:
+    """Returns the fields of two settings dataclasses that differ."""
+    return tuple(
+        SettingChange(f.name, getattr(old, f.name, None), getattr(new, f.name))
+        for f in fields(new)
+        if f.name != "path" and getattr(old, f.name, None) != getattr(new, f.name)
+    )
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import bisect
+import os
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from threading import Lock
+from typing import Iterator, Optional
 
 import dacite
 
 from .. import config
+from ..executor import get_pool
+from ._ini import iter_lines
 
 
 @dataclass
@@ -24,51 +28,217 @@ class DinoExport:
     speed: float
     crafting: float
 
+    @staticmethod
+    def load(path: str | Path) -> DinoExport:
+        """Loads a single export file, parsing stops once all stats are read."""
+        return dacite.from_dict(DinoExport, read_export(path))
+
     @staticmethod
     def load_most_recent(path: Optional[str] = None) -> DinoExport:
-        """Loads the settings from input.ini, using the `ARK_PATH` provided
-        in the configs or an alternatively passed path."""
+        """Loads the most recent export, using the `ARK_PATH` provided in the
+        configs or an alternatively passed path."""
         if path is None:
             path = f"{config.ARK_PATH}\ShooterGame\Saved\DinoExports"
-            
+
         if "common" in path:
-            id_folder = max(
-                [p for p in Path(path).iterdir()],
-                key=lambda p: datetime.fromtimestamp(p.stat().st_mtime).strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                ),
-            )
-            path += f"\{id_folder.stem}"
-
-        file = max(
-            [p for p in Path(path).iterdir()],
-            key=lambda p: datetime.fromtimestamp(p.stat().st_mtime).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            ),
-        )
-        settings: dict[str, str | float] = {}
+            path = _most_recent(path, directories=True)
+        return DinoExport.load(_most_recent(path, directories=False))
+
+
+def read_export(path: str | Path) -> dict[str, str | float]:
+    """Reads the values of an export file, keyed by the `DinoExport` field."""
+    export: dict[str, str | float] = {}
+    for line in iter_lines(path):
+        line = line.strip()
+        if line.count("=") != 1:
+            continue
+
+        key, val = line.split("=")
+        action = _KEY_MAP.get(key)
+        if action is None:
+            continue
         try:
-            with open(file, encoding="utf-8") as f:
-                contents = f.readlines()
-        except UnicodeDecodeError:
-            with open(file, encoding="utf-16") as f:
-                contents = f.readlines()
-
-        for line in contents:
-            line = line.strip()
-            if line.count("=") != 1:
-                continue
+            export[action] = float(val)
+        except ValueError:
+            export[action] = val
+
+        if len(export) == len(_KEY_MAP):
+            break
+    return export
+
+
+def _most_recent(path: str, directories: bool) -> str:
+    """Returns the most recently modified file or directory in a directory."""
+    with os.scandir(path) as it:
+        entries = [entry for entry in it if entry.is_dir() == directories]
+    if not entries:
+        raise FileNotFoundError(f"Nothing to load in {path}.")
+    return max(entries, key=lambda entry: entry.stat().st_mtime_ns).path
+
+
+@dataclass(frozen=True)
+class ExportEntry:
+    """An export file indexed by the `DinoExportCatalog`.
+
+    Attributes
+    ----------
+    path :class:`str`:
+        The path of the export file
+
+    modified :class:`float`:
+        When the file was last modified, as timestamp
+
+    export :class:`DinoExport`:
+        The parsed export
+    """
+
+    path: str
+    modified: float
+    export: DinoExport
+
+    @property
+    def species(self) -> str:
+        return self.export.dino_name
+
+
+class DinoExportCatalog:
+    """An index over all exports in one or more export directories.
 
-            key, val = line.split("=")
-            action = _KEY_MAP.get(key)
-            if action is None:
+    The directories are listed with `os.scandir`, which provides the
+    modification time and size of every file without statting them one
+    by one. A rescan only parses the files that are new or have changed
+    since the last scan, in bulk on the `exports` task pool.
+
+    Parameters
+    ----------
+    directories :class:`str`:
+        The directories to index including their subdirectories, the
+        `DinoExports` directory of `ARK_PATH` by default
+    """
+
+    def __init__(self, *directories: str) -> None:
+        self.directories = directories or (
+            f"{config.ARK_PATH}\ShooterGame\Saved\DinoExports",
+        )
+        self._signatures: dict[str, tuple[int, int]] = {}
+        # files that could not be parsed, retried once their signature changes
+        self._failed: dict[str, tuple[int, int]] = {}
+        self._entries: dict[str, ExportEntry] = {}
+        self._by_species: dict[str, dict[str, ExportEntry]] = {}
+        self._ordered: Optional[list[ExportEntry]] = None
+        self._times: list[float] = []
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[ExportEntry]:
+        """Iterates the entries from the oldest to the most recent."""
+        return iter(self._order())
+
+    def scan(self) -> list[ExportEntry]:
+        """Indexes the directories, parsing the exports that are new or have
+        changed since the last scan and dropping those that were removed.
+
+        Returns
+        -------
+        :class:`list[ExportEntry]`:
+            The entries that have been added or updated by this scan
+        """
+        listed = self._list()
+        changed = [
+            (path, signature)
+            for path, signature in listed.items()
+            if self._signatures.get(path) != signature
+            and self._failed.get(path) != signature
+        ]
+
+        pool = get_pool("exports")
+        futures = [pool.submit(DinoExport.load, path) for path, _ in changed]
+
+        added, failed = [], {}
+        for (path, signature), future in zip(changed, futures):
+            try:
+                export = future.result()
+            except Exception:
+                # incomplete or still being written, a file that is still
+                # being written changes its signature and is retried then
+                failed[path] = signature
                 continue
+            added.append(ExportEntry(path, signature[0] / 1e9, export))
+
+        with self._lock:
+            for path in (set(self._entries) | set(self._failed)) - set(listed):
+                self._remove(path)
+            self._failed.update(failed)
+            for entry in added:
+                self._remove(entry.path)
+                self._entries[entry.path] = entry
+                self._by_species.setdefault(entry.species, {})[entry.path] = entry
+                self._signatures[entry.path] = listed[entry.path]
+            self._ordered = None
+        return added
+
+    def latest(self, species: Optional[str] = None) -> Optional[ExportEntry]:
+        """Returns the most recent export, of the given species if passed."""
+        if species is None:
+            order = self._order()
+            return order[-1] if order else None
+
+        entries = self._by_species.get(species)
+        if not entries:
+            return None
+        return max(entries.values(), key=lambda entry: entry.modified)
+
+    def since(self, timestamp: float) -> list[ExportEntry]:
+        """Returns the exports modified after the timestamp, oldest first."""
+        order, times = self._order_and_times()
+        return order[bisect.bisect_right(times, timestamp) :]
+
+    def species(self, name: str) -> list[ExportEntry]:
+        """Returns the exports of the given species, oldest first."""
+        entries = self._by_species.get(name, {})
+        return sorted(entries.values(), key=lambda entry: entry.modified)
+
+    def _list(self) -> dict[str, tuple[int, int]]:
+        """Lists the export files of all directories with their signatures."""
+        files: dict[str, tuple[int, int]] = {}
+        stack = list(self.directories)
+        while stack:
             try:
-                settings[action] = float(val)
-            except ValueError:
-                settings[action] = val
+                it = os.scandir(stack.pop())
+            except OSError:
+                continue
+
+            with it:
+                for entry in it:
+                    if entry.is_dir():
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(".ini"):
+                        stat = entry.stat()
+                        files[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return files
+
+    def _remove(self, path: str) -> None:
+        entry = self._entries.pop(path, None)
+        self._signatures.pop(path, None)
+        self._failed.pop(path, None)
+        if entry is not None:
+            self._by_species.get(entry.species, {}).pop(path, None)
+
+    def _order(self) -> list[ExportEntry]:
+        return self._order_and_times()[0]
 
-        return dacite.from_dict(DinoExport, settings)
+    def _order_and_times(self) -> tuple[list[ExportEntry], list[float]]:
+        """Returns the entries from the oldest to the most recent along with
+        their modification times, both from the same state of the index."""
+        with self._lock:
+            if self._ordered is None:
+                self._ordered = sorted(
+                    self._entries.values(), key=lambda entry: entry.modified
+                )
+                self._times = [entry.modified for entry in self._ordered]
+            return self._ordered, self._times
 
 
 _KEY_MAP = {
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+
+from ..executor import get_pool
+from .dino_export import DinoExport, DinoExportCatalog, ExportEntry, read_export
+
+STATS = ("health", "stamina", "oxygen", "food", "weight", "melee", "speed", "crafting")
+
+# species and tamed names are interned, the columns hold their index
+_DTYPE = np.dtype(
+    [
+        ("species", np.int32),
+        ("name", np.int32),
+        ("modified", np.float64),
+        *((stat, np.float32) for stat in STATS),
+    ]
+)
+
+
+class DinoStatTable:
+    """The stats of many dino exports as a single structured array, so they
+    can be analyzed with vectorized queries rather than one `DinoExport`
+    object at a time. A row takes 48 bytes, the species and tamed names are
+    only stored once each.
+
+    Parameters
+    ----------
+    rows :class:`np.ndarray`:
+        The rows of the table
+
+    species :class:`list[str]`:
+        The species the `species` column of the rows indexes
+
+    names :class:`list[str]`:
+        The tamed names the `name` column of the rows indexes
+    """
+
+    def __init__(self, rows: np.ndarray, species: list[str], names: list[str]) -> None:
+        self._rows = rows.astype(_DTYPE, copy=False)
+        self._species = list(species)
+        self._names = list(names)
+        self._species_index = {name: idx for idx, name in enumerate(self._species)}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return f"DinoStatTable(rows={len(self)}, species={len(self._species)})"
+
+    @property
+    def rows(self) -> np.ndarray:
+        return self._rows
+
+    @property
+    def species(self) -> list[str]:
+        return self._species
+
+    @property
+    def nbytes(self) -> int:
+        """The memory taken by the rows and the interned strings."""
+        strings = sum(len(s) for s in self._species) + sum(len(s) for s in self._names)
+        return self._rows.nbytes + strings
+
+    @classmethod
+    def from_exports(
+        cls, exports: Iterable[DinoExport | ExportEntry]
+    ) -> DinoStatTable:
+        """Builds the table from parsed exports or catalog entries."""
+        builder = _Builder()
+        for export in exports:
+            if isinstance(export, ExportEntry):
+                builder.add(vars(export.export), export.modified)
+            else:
+                builder.add(vars(export), 0)
+        return builder.build()
+
+    @classmethod
+    def from_catalog(cls, catalog: DinoExportCatalog) -> DinoStatTable:
+        return cls.from_exports(catalog)
+
+    @classmethod
+    def from_files(cls, paths: Iterable[str | Path]) -> DinoStatTable:
+        """Builds the table straight from export files, the files are read
+        in bulk on the `exports` task pool. Files that can not be read, lack
+        a stat or have a stat that is not a number are skipped."""
+        paths = list(paths)
+        futures = get_pool("exports").map(read_export, paths)
+
+        builder = _Builder()
+        for path, future in zip(paths, futures):
+            try:
+                values = future.result()
+                modified = os.stat(path).st_mtime
+            except Exception:
+                continue
+            if not all(key in values for key in ("dino_name", "tamed_name", *STATS)):
+                continue
+            try:
+                stats = {stat: float(values[stat]) for stat in STATS}
+            except ValueError:
+                # e.g. `1.#INF` that was kept as string when reading the file
+                continue
+            builder.add({**values, **stats}, modified)
+        return builder.build()
+
+    @classmethod
+    def load(cls, path: str | Path) -> DinoStatTable:
+        """Loads a table that was saved with `save`."""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data["rows"], data["species"].tolist(), data["names"].tolist())
+
+    def save(self, path: str | Path) -> None:
+        """Saves the table as compressed `.npz` file."""
+        np.savez_compressed(
+            path,
+            rows=self._rows,
+            species=np.array(self._species, dtype=str),
+            names=np.array(self._names, dtype=str),
+        )
+
+    def column(self, stat: str, species: Optional[str] = None) -> np.ndarray:
+        """Returns the values of a stat, of the given species if passed."""
+        return self._select(species)[stat]
+
+    def top_k(
+        self, stat: str, k: int = 1, species: Optional[str] = None
+    ) -> list[tuple[str, str, float]]:
+        """Returns the `k` highest values of a stat.
+
+        Returns
+        -------
+        :class:`list[tuple[str, str, float]]`:
+            The species, the tamed name and the value, highest value first
+        """
+        rows = self._select(species)
+        k = min(k, len(rows))
+        if k <= 0:
+            return []
+
+        values = rows[stat]
+        best = np.argpartition(-values, k - 1)[:k]
+        best = best[np.argsort(-values[best], kind="stable")]
+        return [self._describe(row, stat) for row in rows[best]]
+
+    def top_k_per_species(self, stat: str, k: int = 1) -> dict[str, list[tuple[str, float]]]:
+        """Returns the `k` highest values of a stat of every species.
+
+        Returns
+        -------
+        :class:`dict[str, list[tuple[str, float]]]`:
+            The tamed names and values of each species, highest value first
+        """
+        if not len(self._rows):
+            return {}
+
+        # sorted by species first and by descending value within each species
+        order = np.lexsort((-self._rows[stat], self._rows["species"]))
+        species = self._rows["species"][order]
+        starts = np.flatnonzero(np.r_[True, species[1:] != species[:-1]])
+        sizes = np.diff(np.r_[starts, len(order)])
+        rank = np.arange(len(order)) - np.repeat(starts, sizes)
+
+        result: dict[str, list[tuple[str, float]]] = {}
+        for row in self._rows[order[rank < k]]:
+            name, value = self._describe(row, stat)[1:]
+            result.setdefault(self._species[row["species"]], []).append((name, value))
+        return result
+
+    def histogram(
+        self, stat: str, bins: int | Iterable[float] = 10, species: Optional[str] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the counts and the bin edges of a stat, see `np.histogram`."""
+        return np.histogram(self.column(stat, species), bins=bins)  # type: ignore[arg-type]
+
+    def _select(self, species: Optional[str]) -> np.ndarray:
+        if species is None:
+            return self._rows
+
+        idx = self._species_index.get(species)
+        if idx is None:
+            return self._rows[:0]
+        return self._rows[self._rows["species"] == idx]
+
+    def _describe(self, row: np.void, stat: str) -> tuple[str, str, float]:
+        return self._species[row["species"]], self._names[row["name"]], float(row[stat])
+
+
+class _Builder:
+    """Collects rows, interning the species and tamed names."""
+
+    def __init__(self) -> None:
+        self.rows: list[tuple] = []
+        self.species: dict[str, int] = {}
+        self.names: dict[str, int] = {}
+
+    def add(self, values: dict, modified: float) -> None:
+        species = self.species.setdefault(str(values["dino_name"]), len(self.species))
+        name = self.names.setdefault(str(values["tamed_name"]), len(self.names))
+        self.rows.append((species, name, modified, *(values[stat] for stat in STATS)))
+
+    def build(self) -> DinoStatTable:
+        return DinoStatTable(
+            np.array(self.rows, dtype=_DTYPE), list(self.species), list(self.names)
+        )
@@ -8,6 +8,7 @@ from typing import Optional
 import dacite
 
 from .. import config
+from ._ini import iter_lines, load_cached
 
 
 @dataclass
@@ -39,68 +40,67 @@ class InputSettings:
     @staticmethod
     def load(path: Optional[str] = None) -> InputSettings:
         """Loads the settings from input.ini, using the `ARK_PATH` provided
-        in the configs or an alternatively passed path."""
+        in the configs or an alternatively passed path. The file is only
+        parsed again if it has changed since it was last loaded."""
         if path is None:
             path = f"{config.ARK_PATH}\ShooterGame\Saved\Config\WindowsNoEditor\Input.ini"
 
-        try:
-            with open(path, encoding="utf-8") as f:
-                contents = f.readlines()
-        except UnicodeDecodeError:
-            with open(path, encoding="utf-16") as f:
-                contents = f.readlines()
-           
-        settings: dict[str, float | bool | str | Path] = {
-            "console": "tab",
-            "crouch": "c",
-            "drop": "o",
-            "inventory": "i",
-            "prone": "x",
-            "target_inventory": "f",
-            "toggle_hud": "backspace",
-            "hud_info": "h",
-            "use": "e",
-            "logs": "l",
-            "transfer": "t",
-            "hotbar_0": "0",
-            "hotbar_1": "1",
-            "hotbar_2": "2",
-            "hotbar_3": "3",
-            "hotbar_4": "4",
-            "hotbar_5": "5",
-            "hotbar_6": "6",
-            "hotbar_7": "7",
-            "hotbar_8": "8",
-            "hotbar_9": "9",
-        }
-
-        settings["path"] = Path(path)
-        for line in contents:
-            if not "=" in line:
+        return load_cached(path, _parse)
+
+
+def _parse(path: str) -> InputSettings:
+    settings: dict[str, float | bool | str | Path] = {
+        "console": "tab",
+        "crouch": "c",
+        "drop": "o",
+        "inventory": "i",
+        "prone": "x",
+        "target_inventory": "f",
+        "toggle_hud": "backspace",
+        "hud_info": "h",
+        "use": "e",
+        "logs": "l",
+        "transfer": "t",
+        "hotbar_0": "0",
+        "hotbar_1": "1",
+        "hotbar_2": "2",
+        "hotbar_3": "3",
+        "hotbar_4": "4",
+        "hotbar_5": "5",
+        "hotbar_6": "6",
+        "hotbar_7": "7",
+        "hotbar_8": "8",
+        "hotbar_9": "9",
+    }
+
+    settings["path"] = Path(path)
+    for line in iter_lines(path):
+        if "=" not in line:
+            continue
+
+        if "ConsoleKeys" in line:
+            action_name = "ConsoleKeys"
+            key = line.split("=")[1].strip()
+        else:
+            matches = _ACTION_MAPPING.search(line)
+
+            if matches is None:
                 continue
 
-            if "ConsoleKeys" in line:
-                action_name = "ConsoleKeys"
-                key = line.split("=")[1].strip()
-            else:
-                pattern = r'ActionName="([^"]+)",Key=([^,]+)'
-                matches = re.search(pattern, line)
+            action_name = matches.group(1)
+            key = matches.group(2)
 
-                if matches is None:
-                    continue
+        action = _KEY_MAP.get(action_name)
+        if key.lower() in _REPLACE and action is not None:
+            settings[action] = str(_REPLACE.index(key.lower()))
 
-                action_name = matches.group(1)
-                key = matches.group(2)
+        elif action is not None:
+            settings[action] = key.lower()
 
-            action = _KEY_MAP.get(action_name)
-            if key.lower() in _REPLACE and action is not None:
-                settings[action] = str(_REPLACE.index(key.lower()))
+    return dacite.from_dict(InputSettings, settings)
 
-            elif action is not None:
-                settings[action] = key.lower()
-
-        return dacite.from_dict(InputSettings, settings)
 
+_ACTION_MAPPING = re.compile(r'ActionName="([^"]+)",Key=([^,]+)')
 
 _KEY_MAP = {
     "ConsoleKeys": "console",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -8,6 +9,7 @@ from typing import Optional
 import dacite
 
 from .. import config
+from ._ini import file_signature, iter_lines, load_cached
 
 @dataclass
 class UserSettings:
@@ -39,44 +41,12 @@ class UserSettings:
     @staticmethod
     def load(path: Optional[str] = None) -> UserSettings:
         """Loads the settings from GameUserSettings.ini, using the `ARK_PATH`
-        provided in the configs or an alternatively passed path."""
+        provided in the configs or an alternatively passed path. The file is
+        only parsed again if it has changed since it was last loaded."""
         if path is None:
             path = f"{config.ARK_PATH}\ShooterGame\Saved\Config\WindowsNoEditor\GameUserSettings.ini"
 
-        try:
-            with open(path, encoding="utf-8") as f:
-                contents = f.readlines()
-        except UnicodeDecodeError:
-            with open(path, encoding="utf-16") as f:
-                contents = f.readlines()
-                
-        settings: dict[str, float | bool | str | Path] = {}
-        settings["path"] = Path(path)
-
-        # keep track of the session occurrences so we can find the last joined
-        # server for the selected category, which is stored as an integer from 0-7
-        session_occurences = 0
-        for line in contents:
-            if line.startswith("[ScalabilityGroups]"):
-                break
-
-            if "=" not in line:
-                continue
-
-            if "LastJoinedSessionPerCategory" in line and not settings.get("last_server"):
-                if session_occurences == settings.get("server_filter"):
-                    settings["last_server"] = line.split("=")[1].strip().strip('"')
-                    continue
-                else:
-                    session_occurences += 1
-
-            option, value = line.rstrip().split("=")
-            setting = _KEY_MAP.get(option)
-
-            if setting is not None:
-                settings[setting] = _set_type(value)  # type: ignore[assignment]
-
-        return dacite.from_dict(UserSettings, settings)
+        return load_cached(path, _parse)
 
     @property
     def last_modified(self) -> str:
@@ -84,20 +54,21 @@ class UserSettings:
         return datetime.fromtimestamp(epoch).strftime("%Y-%m-%d %H:%M:%S")
 
     def listen_for_change(self) -> None:
-        """Listens to any changes made to the file, this is done by loading the
-        data of the last modified timestamp, and then waiting for the timestamp
-        to change. Once it has we compare the new data to the previous data and
-        notify about any changes.
-        
+        """Listens to any changes made to the file, this is done by waiting for
+        the modification time or size of the file to change. Once it has we
+        compare the new data to the previous data and notify about any changes.
+
         Particularly useful to find the name of a setting in the .ini by just
         changing it ingame, listening to the changes and see what value gets
-        changed."""
-        last_change = self.last_modified
+        changed.
+
+        To reload the settings whenever they change, use a `SettingsWatcher`."""
+        last_change = file_signature(self.path)
         with open(self.path) as f:
             old_data = f.readlines()
 
-        while self.last_modified == last_change:
-            pass
+        while file_signature(self.path) == last_change:
+            time.sleep(config.SETTINGS_POLL_INTERVAL)
 
         print("Change detected in GameUserSettings.ini!")
         while True:
@@ -105,7 +76,7 @@ class UserSettings:
                 with open(self.path) as f:
                     new_data = f.readlines()
             except PermissionError:
-                continue
+                time.sleep(config.SETTINGS_POLL_INTERVAL)
             else:
                 break
 
@@ -114,6 +85,36 @@ class UserSettings:
                 print(f"Setting '{old_line.strip()}' changed to '{new_line.strip()}'!")
 
 
+def _parse(path: str) -> UserSettings:
+    settings: dict[str, float | bool | str | Path] = {}
+    settings["path"] = Path(path)
+
+    # keep track of the session occurrences so we can find the last joined
+    # server for the selected category, which is stored as an integer from 0-7
+    session_occurences = 0
+    for line in iter_lines(path):
+        if line.startswith("[ScalabilityGroups]"):
+            break
+
+        if "=" not in line:
+            continue
+
+        if "LastJoinedSessionPerCategory" in line and not settings.get("last_server"):
+            if session_occurences == settings.get("server_filter"):
+                settings["last_server"] = line.split("=")[1].strip().strip('"')
+                continue
+            else:
+                session_occurences += 1
+
+        option, _, value = line.rstrip().partition("=")
+        setting = _KEY_MAP.get(option)
+
+        if setting is not None:
+            settings[setting] = _set_type(value)  # type: ignore[assignment]
+
+    return dacite.from_dict(UserSettings, settings)
+
+
 _KEY_MAP = {
     "UIScaling": "ui_scaling",
     "FOVMultiplier": "fov_multiplier",
@@ -1,8 +1,171 @@
-class State:
-    """Controls the state of the program."""
+import time
+from contextlib import contextmanager
+from threading import Condition, local
+from typing import Iterator, Optional
+from weakref import WeakSet
 
-    running = True
-    paused = False
+from .exceptions import TerminatedError
+
+
+class StateToken:
+    """A token to pause, resume and cancel the threads that are bound to it.
+
+    Paused threads block on a condition rather than polling and continue as
+    soon as the token is resumed, cancelling the token interrupts running
+    sleeps right away. A token created from a parent is paused or cancelled
+    whenever its parent is, so each bot in a process can have its own token
+    while still being controllable all at once.
+
+    Parameters
+    ----------
+    parent :class:`StateToken` [Optional]:
+        The token this token inherits its pause and cancellation from
+
+    name :class:`str` [Optional]:
+        A name to identify the token by
+    """
+
+    def __init__(self, parent: Optional["StateToken"] = None, name: str = "") -> None:
+        self.name = name
+        self._parent = parent
+        self._children: WeakSet[StateToken] = WeakSet()
+        self._condition = Condition()
+        self._paused = False
+        self._cancelled = False
+
+        if parent is not None:
+            parent._children.add(self)
+
+    def __repr__(self) -> str:
+        return f"StateToken(name={self.name!r}, paused={self.paused}, cancelled={self.cancelled})"
+
+    @property
+    def paused(self) -> bool:
+        return self._paused or (self._parent is not None and self._parent.paused)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled or (self._parent is not None and self._parent.cancelled)
+
+    def child(self, name: str = "") -> "StateToken":
+        """Creates a token that is paused and cancelled along with this token."""
+        return StateToken(self, name)
+
+    def pause(self) -> None:
+        self._set(paused=True)
+
+    def resume(self) -> None:
+        self._set(paused=False)
+
+    def cancel(self) -> None:
+        self._set(cancelled=True)
+
+    def reset(self) -> None:
+        """Resumes the token and revokes its cancellation."""
+        self._set(paused=False, cancelled=False)
+
+    def check(self) -> None:
+        """Blocks while the token is paused.
+
+        Raises
+        ------
+        `TerminatedError`
+            If the token has been cancelled
+        """
+        with self._condition:
+            while self.paused and not self.cancelled:
+                self._condition.wait()
+
+        if self.cancelled:
+            raise TerminatedError
+
+    def sleep(self, duration: float) -> None:
+        """Sleeps for the given duration, a pause extends the sleep until the
+        token is resumed.
+
+        Raises
+        ------
+        `TerminatedError`
+            If the token is cancelled before or during the sleep
+        """
+        self.check()
+        deadline = time.monotonic() + duration
+        with self._condition:
+            while not self.cancelled and (remaining := deadline - time.monotonic()) > 0:
+                self._condition.wait(remaining)
+        self.check()
+
+    def _set(self, **state: bool) -> None:
+        with self._condition:
+            if "paused" in state:
+                self._paused = state["paused"]
+            if "cancelled" in state:
+                self._cancelled = state["cancelled"]
+        self._notify()
+
+    def _notify(self) -> None:
+        with self._condition:
+            self._condition.notify_all()
+        for child in list(self._children):
+            child._notify()
+
+
+DEFAULT_TOKEN = StateToken(name="default")
+_bound = local()
+
+
+def current_token() -> StateToken:
+    """Returns the token bound to the current thread, the default token
+    if no token has been bound."""
+    return getattr(_bound, "token", DEFAULT_TOKEN)
+
+
+@contextmanager
+def bind_token(token: StateToken) -> Iterator[StateToken]:
+    """Binds the token to the current thread for the duration of the block."""
+    prev = getattr(_bound, "token", None)
+    _bound.token = token
+    try:
+        yield token
+    finally:
+        if prev is None:
+            del _bound.token
+        else:
+            _bound.token = prev
+
+
+class _StateMeta(type):
+    """Maps the class attributes of `State` onto the default token."""
+
+    @property
+    def running(cls) -> bool:
+        return not DEFAULT_TOKEN.cancelled
+
+    @running.setter
+    def running(cls, value: bool) -> None:
+        if value:
+            DEFAULT_TOKEN._set(cancelled=False)
+        else:
+            DEFAULT_TOKEN.cancel()
+
+    @property
+    def paused(cls) -> bool:
+        return DEFAULT_TOKEN.paused
+
+    @paused.setter
+    def paused(cls, value: bool) -> None:
+        if value:
+            DEFAULT_TOKEN.pause()
+        else:
+            DEFAULT_TOKEN.resume()
+
+
+class State(metaclass=_StateMeta):
+    """Controls the state of the program.
+
+    `running` and `paused` control the default token, which every thread
+    uses unless it has been bound to a token of its own.
+    """
 
     def __init__(self) -> None:
-        raise RuntimeError("State class is not meant to be instantiated")
\ No newline at end of file
+        raise RuntimeError("State class is not meant to be instantiated")
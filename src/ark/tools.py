@@ -1,8 +1,10 @@
 import math
+from dataclasses import dataclass, field
+from typing import Optional
 
 import psutil  # type:ignore[import]
 
-from .items import Item
+from .items import Item, RecipeGraph, get_recipe_graph
 
 
 def ark_is_running() -> bool:
@@ -26,26 +28,11 @@ def break_into_components(recipe: dict[Item, int]) -> dict[Item, int]:
     But since electronics are a sub component, the total cost would be
     210 Metal, 50 Paste, 210 Silica Pearls...
 
-    The cost is extracted recursively until there are no sub components left.
-    Cementing paste is not considered crafted by stone and chitin.
+    The cost is looked up in the recipe graph, where the base materials of
+    every item have been computed once. Cementing paste is not considered
+    crafted by stone and chitin.
     """
-    cost: dict[Item, int] = {}
-
-    def extract_cost(item: Item, amount_needed: int) -> None:
-        assert item.recipe is not None
-
-        for item, amount in item.recipe.items():
-            if item.recipe is None:
-                cost[item] = cost.get(item, 0) + (amount * amount_needed)
-            else:
-                extract_cost(item, amount)
-
-    for item, amount in recipe.items():
-        if item.recipe is None:
-            cost[item] = cost.get(item, 0) + amount
-        elif amount:
-            extract_cost(item, amount)
-    return cost
+    return get_recipe_graph(*recipe).break_down(recipe)
 
 
 def compute_crafting_plan(
@@ -78,114 +65,317 @@ def compute_crafting_plan(
     if item_to_craft.recipe is None:
         raise ValueError(f"{item_to_craft.name} cannot be crafted.")
 
-    available_materials = available_materials.copy()
+    stock = available_materials.copy()
+    amount, batch = _craft_repeatedly(item_to_craft, stock)
 
+    graph = get_recipe_graph(item_to_craft)
+    sub_components_to_craft = {
+        item: batch.crafted[item]
+        for item in sorted(batch.crafted, key=graph.depth)
+    }
     cost = {item: 0 for item in item_to_craft.recipe}
-    _complement_available_mats(available_materials, item_to_craft.recipe)
+    cost.update(batch.consumed)
+    return amount, sub_components_to_craft, cost
 
-    craftable_right_away = _compute_craftable_instantly(
-        item_to_craft, available_materials
-    )
 
-    for item, amount in item_to_craft.recipe.items():
-        can_craft = round(amount * craftable_right_away)
-        cost[item] += can_craft
-        available_materials[item] -= can_craft
+@dataclass
+class CraftTarget:
+    """An item to craft as part of a batch sharing the same materials.
 
-    pcost = cost.copy()
-    extra_crafts, sub_components_to_craft = _can_craft(
-        item_to_craft, available_materials, cost
-    )
+    Parameters
+    ----------
+    item :class:`Item`:
+        The item to craft, must define a `recipe`
 
-    if not extra_crafts:
-        cost = pcost
+    amount :class:`int` [Optional]:
+        The most to craft, as many as the materials allow if not passed
 
-    subcomp_order = list(sub_components_to_craft)
-    subcomp_order.sort(key=lambda item: _get_component_depth(item))
-    sub_components_to_craft = {k: sub_components_to_craft[k] for k in subcomp_order}
+    priority :class:`int`:
+        Targets of a higher priority are given materials first
 
-    return (
-        math.floor(extra_crafts + craftable_right_away),
-        sub_components_to_craft,
-        cost,
-    )
+    ratio :class:`float`:
+        The share of this target relative to the other targets of the same
+        priority, a target with ratio 2 is planned twice as often as one with 1
+    """
 
+    item: Item
+    amount: Optional[int] = None
+    priority: int = 0
+    ratio: float = 1
 
-def _get_component_depth(item: Item, depth=0) -> int:
 
-    if item.recipe is None:
-        return depth
-    else:
-        depth += 1
-    for item in item.recipe:
-        depth = _get_component_depth(item, depth)
-    return depth
+@dataclass
+class BatchPlan:
+    """The plan to craft a batch of targets from a shared pool of materials.
 
+    Parameters
+    ----------
+    allocation :class:`dict[Item, int]`:
+        How many of each target to craft
 
-def _compute_craftable_instantly(
-    item_to_craft: Item, available_materials: dict[Item, int]
-) -> int:
-    if item_to_craft.recipe is None:
-        raise ValueError(f"{item_to_craft.name} cannot be crafted.")
+    queue :class:`list[tuple[Item, int]]`:
+        The sub-components to craft and how many of them, in the order
+        they have to be crafted in
 
-    craftable_right_away = min(
-        available_materials[material] / amount
-        for material, amount in item_to_craft.recipe.items()
-    )
-    return math.floor(craftable_right_away)
+    cost :class:`dict[Item, int]`:
+        The total amount taken from the available materials
 
+    residual :class:`dict[Item, int]`:
+        The materials left over once everything has been crafted
+    """
 
-def _can_craft(
-    item: Item,
-    available: dict[Item, int],
-    cost: dict[Item, int],
-    thiscraft=None,
-    amount=1,
-    components_to_craft=None,
-) -> tuple[int, dict[Item, int]]:
-    assert item.recipe is not None
+    allocation: dict[Item, int]
+    queue: list[tuple[Item, int]]
+    cost: dict[Item, int]
+    residual: dict[Item, int]
 
-    master = components_to_craft is None
-    if components_to_craft is None:
-        components_to_craft = {}
 
-    crafts = 0
-    while True:
-        if thiscraft is None or master:
-            thiscraft = {}
-
-        for component, amount_needed in item.recipe.items():
-            if amount_needed <= available.get(component, 0):
-                available[component] -= amount_needed
-                thiscraft[component] = thiscraft.get(component, 0) + amount_needed
+def compute_batch_plan(
+    targets: list[CraftTarget], available_materials: dict[Item, int]
+) -> BatchPlan:
+    """Computes how many of each target can be crafted from one pool of
+    available materials, taking sub-components into consideration the same
+    way `compute_crafting_plan` does.
+
+    Targets of the highest priority are planned first, targets of the same
+    priority are raised in step according to their ratio until they can not
+    be raised any further. The amount of feasibility checks depends on the
+    amount of targets, not on the amounts crafted, so the plan is cheap
+    enough to recompute whenever the available materials change.
+
+    Parameters
+    ----------
+    targets :class:`list[CraftTarget]`:
+        The items to craft, each item may only be targeted once
+
+    available_materials :class:`dict[Item, int]`:
+        A dictionary storing the available materials to craft
+
+    Returns
+    -------
+    `BatchPlan`:
+        The amount of each target, the sub-components to craft, the total
+        cost and the materials left over
+    """
+    for target in targets:
+        if target.item.recipe is None:
+            raise ValueError(f"{target.item.name} cannot be crafted.")
+        if target.ratio <= 0:
+            raise ValueError(f"Ratio of {target.item.name} must be positive.")
+    if len({target.item for target in targets}) != len(targets):
+        raise ValueError("Each item may only be targeted once.")
+
+    graph = get_recipe_graph(*available_materials, *(t.item for t in targets))
+    limits = _upper_limits(graph, targets, available_materials)
+
+    allocation: dict[Item, int] = {}
+    for priority in sorted({target.priority for target in targets}, reverse=True):
+        group = [target for target in targets if target.priority == priority]
+        allocation.update(_fill_group(group, allocation, limits, available_materials))
+
+    result = _craft_allocation(allocation, available_materials)
+    assert result is not None
+    residual, batch = result
+
+    queue = [
+        (item, batch.crafted[item])
+        for item in sorted(batch.crafted, key=graph.depth)
+    ]
+    return BatchPlan(allocation, queue, batch.consumed, residual)
+
+
+def _upper_limits(
+    graph: RecipeGraph, targets: list[CraftTarget], available: dict[Item, int]
+) -> dict[Item, int]:
+    """Bounds how many of each target could be crafted if it got all of the
+    materials, with every material broken down into its base materials."""
+    base_available = graph.vector(available) @ graph.base_cost
+    limits = {}
+    for target in targets:
+        cost = graph.base_cost[graph.index(target.item)]
+        needed = cost > 0
+        limit = int((base_available[needed] // cost[needed]).min())
+        if target.amount is not None:
+            limit = min(limit, target.amount)
+        limits[target.item] = limit
+    return limits
+
+
+def _fill_group(
+    group: list[CraftTarget],
+    allocated: dict[Item, int],
+    limits: dict[Item, int],
+    available: dict[Item, int],
+) -> dict[Item, int]:
+    """Raises the targets of a group in step, on top of what has already
+    been allocated to targets of a higher priority.
+
+    The group is raised to the highest feasible level by bisection, every
+    target that can not go beyond that level is then fixed and the rest
+    of the group is raised further until no target is left.
+    """
+    top_ratio = max(target.ratio for target in group)
+    fixed: dict[Item, int] = {}
+    active = list(group)
+    level = 0
+
+    def at(level: int) -> dict[Item, int]:
+        amounts = {**allocated}
+        for target in group:
+            if target.item in fixed:
+                amounts[target.item] = fixed[target.item]
+            else:
+                share = math.floor(level * target.ratio / top_ratio)
+                amounts[target.item] = min(limits[target.item], share)
+        return amounts
+
+    while active:
+        # the level at which every active target has reached its limit
+        hi = max(
+            math.ceil(limits[target.item] * top_ratio / target.ratio)
+            for target in active
+        )
+        lo = level
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if _craft_allocation(at(mid), available) is None:
+                hi = mid - 1
+            else:
+                lo = mid
+        level = lo
+
+        # raise each target that would be raised at the next level on its
+        # own, those that can not be raised are done
+        amounts = at(level)
+        for target in active:
+            if amounts[target.item] >= limits[target.item]:
+                fixed[target.item] = amounts[target.item]
                 continue
 
-            elif component.recipe is None:
-                return crafts, components_to_craft
-
-            craftable, _ = _can_craft(
-                component,
-                available,
-                cost,
-                thiscraft,
-                amount_needed,
-                components_to_craft,
-            )
-            if not craftable or craftable != amount_needed:
-                return crafts, components_to_craft
+            if at(level + 1)[target.item] == amounts[target.item]:
+                continue
+            raised = {**amounts, target.item: amounts[target.item] + 1}
+            if _craft_allocation(raised, available) is None:
+                fixed[target.item] = amounts[target.item]
             else:
-                components_to_craft[component] = (
-                    components_to_craft.get(component, 0) + craftable
-                )
+                amounts = raised
+
+        active = [target for target in active if target.item not in fixed]
+        level += 1
+
+    return at(level)
+
+
+def _craft_allocation(
+    allocation: dict[Item, int], available: dict[Item, int]
+) -> Optional[tuple[dict[Item, int], "_Batch"]]:
+    """Crafts the items one after another from the same stock, returns the
+    stock left over and what was taken, or `None` if it is not enough."""
+    stock = available.copy()
+    total = _Batch()
+    for item, amount in allocation.items():
+        if not amount:
+            continue
+        crafted, batch = _craft_repeatedly(item, stock, amount)
+        if crafted != amount:
+            return None
+        total.add(batch)
+    return stock, total
+
+
+@dataclass
+class _Batch:
+    """What crafting an item a number of times in a row took.
+
+    Every time a component is taken from the stock rather than crafted,
+    the stock it was taken from and the amount taken are recorded. Stock
+    only ever decreases, so a craft that took everything from the same
+    places as the previous one can be repeated until one of these takes
+    would no longer fit, without simulating each of the crafts.
+    """
+
+    consumed: dict[Item, int] = field(default_factory=dict)
+    crafted: dict[Item, int] = field(default_factory=dict)
+    takes: list[tuple[Item, int, int]] = field(default_factory=list)
+    uniform: bool = True
+
+    def repeats(self) -> int:
+        """Returns how often this batch can be repeated in a row, itself included."""
+        if not self.uniform:
+            return 1
+        return min(
+            (stock - needed) // self.consumed[item] + 1
+            for item, stock, needed in self.takes
+        )
+
+    def add(self, other: "_Batch", times: int = 1) -> None:
+        for item, amount in other.consumed.items():
+            self.consumed[item] = self.consumed.get(item, 0) + amount * times
+        for item, amount in other.crafted.items():
+            self.crafted[item] = self.crafted.get(item, 0) + amount * times
+
+        # the takes of the last repetition decide whether it can go on
+        self.takes.extend(
+            (item, stock - (times - 1) * other.consumed[item], needed)
+            for item, stock, needed in other.takes
+        )
+        self.uniform = self.uniform and other.uniform
+
+
+def _craft_once(item: Item, stock: dict[Item, int]) -> Optional[_Batch]:
+    """Crafts the item once, components that are not in stock in the full
+    amount needed are crafted. Returns `None` if it can not be crafted."""
+    assert item.recipe is not None
+    batch = _Batch()
+
+    for component, needed in item.recipe.items():
+        available = stock.get(component, 0)
+        if needed <= available:
+            stock[component] = available - needed
+            batch.add(_Batch({component: needed}, takes=[(component, available, needed)]))
+            continue
 
-        crafts += 1
-        if master:
-            for material, needed in thiscraft.items():
-                cost[material] = cost.get(material, 0) + needed
+        if component.recipe is None:
+            return None
 
-        if crafts == amount and not master:
-            return crafts, components_to_craft
+        crafted, sub_batch = _craft_repeatedly(component, stock, needed)
+        if crafted != needed:
+            return None
+        batch.add(sub_batch)
+        batch.crafted[component] = batch.crafted.get(component, 0) + needed
 
+    return batch
+
+
+def _craft_repeatedly(
+    item: Item, stock: dict[Item, int], limit: Optional[int] = None
+) -> tuple[int, _Batch]:
+    """Crafts the item until the limit is reached or the stock runs out.
+
+    Rather than crafting one at a time, each craft is repeated as often as
+    the stock allows it to be done the same way, so the time taken depends
+    on how often the way an item is crafted changes, not the amount crafted.
+    """
+    total = _Batch()
+    crafts = 0
 
-def _complement_available_mats(available: dict, required: dict) -> None:
-    available.update({item: 0 for item in set(required) - set(available)})
+    while limit is None or crafts < limit:
+        trial = stock.copy()
+        batch = _craft_once(item, trial)
+        if batch is None:
+            break
+
+        times = batch.repeats()
+        if limit is not None:
+            times = min(times, limit - crafts)
+        for material, amount in batch.consumed.items():
+            trial[material] -= amount * (times - 1)
+        stock.update(trial)
+
+        # a batch that was crafted in several ways may be crafted differently next time
+        if crafts:
+            total.uniform = False
+        total.add(batch, times)
+        crafts += times
+
+    return crafts, total
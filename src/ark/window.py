@@ -11,6 +11,7 @@ from pytesseract import pytesseract as tes  # type: ignore[import]
 from screeninfo import get_monitors  # type: ignore[import]
 import pyscreeze
 
+from ._atlas import get_template
 from ._helpers import get_center
 
 pg.useImageNotFoundException(False)
@@ -144,6 +145,13 @@ class ArkWindow:
             tools.to_png(img.rgb, img.size, output=path)
             return path
 
+    def grab_signature(self, region: tuple[int, int, int, int]) -> np.ndarray:
+        """Grabs a coarse signature of the given region, which only changes
+        when the contents of the region visibly change. Useful as trigger
+        for `await_event`."""
+        img = np.asarray(self.grab_screen(region))[::4, ::4, :3]
+        return img >> 4
+
     def begin_snapshot(self) -> None:
         self._snapshot = self.grab_screen((0, 0, 1920, 1080))
 
@@ -289,15 +297,33 @@ class ArkWindow:
             return image
 
         # open the image in PIL and use ImageOps to upscale it (maintains aspect ratio)
-        raw_image = Image.open(image)
+        packed = get_template(image)
+        if packed is not None:
+            raw_image = Image.fromarray(packed[:, :, ::-1])
+        else:
+            raw_image = Image.open(image)
         new_width = self.convert_point(raw_image.width, raw_image.height)
         return ImageOps.contain(raw_image, new_width, PIL.Image.Resampling.LANCZOS)
 
+    def load_template(self, template, grayscale: bool = False):
+        """Returns the template from the template atlas if it is a path to a
+        packed asset, otherwise the template as it was passed."""
+        if isinstance(template, str):
+            packed = get_template(template, grayscale)
+            if packed is not None:
+                return packed
+        return template
+
     def locate_in_image(
         self, template: str, image, confidence: float, grayscale: bool = False
     ):
         """Finds the location of the given image in the given template."""
-        return pg.locate(template, image, confidence=confidence, grayscale=grayscale)
+        return pg.locate(
+            self.load_template(template, grayscale),
+            image,
+            confidence=confidence,
+            grayscale=grayscale,
+        )
 
     def locate_all_in_image(
         self, template: str, image, confidence: float, grayscale: bool = False
@@ -306,7 +332,7 @@ class ArkWindow:
         return self.filter_points(
             set(
                 pg.locateAll(
-                    template,
+                    self.load_template(template, grayscale),
                     image,
                     confidence=confidence,
                     grayscale=grayscale,
@@ -382,7 +408,9 @@ class ArkWindow:
         image_rgb = cv.cvtColor(haystack, cv.COLOR_BGR2RGB)
         img = Image.fromarray(image_rgb)
         box = pg.locate(
-            self.convert_image(template) if convert else template,
+            self.load_template(
+                self.convert_image(template) if convert else template, grayscale
+            ),
             img,
             confidence=confidence,
             grayscale=grayscale,
@@ -409,7 +437,7 @@ class ArkWindow:
         return self.filter_points(
             set(
                 pg.locateAll(
-                    self.convert_image(template),
+                    self.load_template(self.convert_image(template), grayscale),
                     img,
                     confidence=confidence,
                     grayscale=grayscale,
@@ -0,0 +1,33 @@
+from types import SimpleNamespace
+
+from ark import ArkContext, current_context
+from ark.interfaces import Inventory
+
+
+def _context(name: str) -> ArkContext:
+    return ArkContext(
+        window=SimpleNamespace(name=name),
+        keybinds=SimpleNamespace(),
+        settings=SimpleNamespace(),
+        name=name,
+    )
+
+
+def test_inventories_resolve_their_context() -> None:
+    first, second = _context("first"), _context("second")
+    vault = Inventory("Vault", context=first)
+    fridge = Inventory("Fridge", context=second)
+
+    assert vault.window is first.window
+    assert fridge.window is second.window
+    assert vault._tooltips.window is first.window
+    assert current_context().window is not first.window
+
+
+def test_active_context_does_not_override_bound() -> None:
+    first, second = _context("first"), _context("second")
+    vault = Inventory("Vault", context=first)
+
+    with second.activate():
+        assert vault.window is first.window
+        assert Inventory("Fridge").window is second.window
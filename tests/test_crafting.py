@@ -137,4 +137,87 @@ def test_tek_turret() -> None:
         items.METAL_INGOT: 600,
         items.ORGANIC_POLYMER: 300,
         items.ELEMENT: 18
-    }
\ No newline at end of file
+    }
+
+def test_break_into_nested_components() -> None:
+    cost = tools.break_into_components({items.HEAVY_AUTO_TURRET: 2})
+    assert cost == {
+        items.PASTE: 400,
+        items.SILICA_PEARL: 1620,
+        items.METAL_INGOT: 1620,
+        items.ORGANIC_POLYMER: 140,
+    }
+
+
+def test_recipe_graph_topological() -> None:
+    graph = items.get_recipe_graph()
+    for item in graph.items:
+        for component in item.recipe or ():
+            assert graph.index(component) < graph.index(item)
+
+    assert graph.depth(items.METAL_INGOT) == 0
+    assert graph.depth(items.ELECTRONICS) == 1
+    assert graph.depth(items.HEAVY_AUTO_TURRET) == 3
+
+
+def test_craft_large_amount() -> None:
+    available = {
+        items.PASTE: 2_000_000,
+        items.METAL_INGOT: 1_500_000,
+        items.CRYSTAL: 150_000,
+        items.SILICA_PEARL: 2_250_000,
+        items.ORGANIC_POLYMER: 500_000,
+    }
+    amount, plan, cost = tools.compute_crafting_plan(items.C4_DETONATOR, available)
+
+    assert amount == 15_000
+    assert plan == {items.ELECTRONICS: 750_000}
+    assert cost[items.SILICA_PEARL] == 2_250_000
+    assert cost[items.METAL_INGOT] == 900_000
+
+
+def test_batch_plan_single_target() -> None:
+    available = {
+        items.SILICA_PEARL: 5211,
+        items.PASTE: 2600,
+        items.METAL_INGOT: 8757,
+        items.ELECTRONICS: 1100,
+        items.ORGANIC_POLYMER: 10000,
+    }
+    plan = tools.compute_batch_plan(
+        [tools.CraftTarget(items.HEAVY_AUTO_TURRET)], available
+    )
+    amount, sub_components, cost = tools.compute_crafting_plan(
+        items.HEAVY_AUTO_TURRET, available
+    )
+
+    assert plan.allocation == {items.HEAVY_AUTO_TURRET: amount}
+    assert plan.queue == list(sub_components.items())
+    assert plan.cost == {k: v for k, v in cost.items() if v}
+    assert all(
+        plan.residual[item] == available[item] - plan.cost.get(item, 0)
+        for item in available
+    )
+
+
+def test_batch_plan_priorities() -> None:
+    available = {
+        items.SILICA_PEARL: 5211,
+        items.PASTE: 2600,
+        items.METAL_INGOT: 8757,
+        items.ELECTRONICS: 1100,
+        items.CRYSTAL: 10000,
+        items.ORGANIC_POLYMER: 10000,
+    }
+    targets = [
+        tools.CraftTarget(items.C4_DETONATOR),
+        tools.CraftTarget(items.HEAVY_AUTO_TURRET, priority=1),
+        tools.CraftTarget(items.METAL_FOUNDATION, amount=5),
+    ]
+    plan = tools.compute_batch_plan(targets, available)
+
+    assert plan.allocation[items.HEAVY_AUTO_TURRET] == 10
+    assert plan.allocation[items.METAL_FOUNDATION] == 5
+    assert plan.allocation[items.C4_DETONATOR] > 0
+    assert [item for item, _ in plan.queue] == [items.ELECTRONICS, items.AUTO_TURRET]
+    assert all(amount >= 0 for amount in plan.residual.values())
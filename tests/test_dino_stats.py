@@ -0,0 +1,62 @@
+from pathlib import Path
+
+import numpy as np
+
+from ark.settings import DinoStatTable
+
+_STATS = {
+    "Health": 1000,
+    "Stamina": 300,
+    "Oxygen": 150,
+    "food": 3000,
+    "Weight": 300,
+    "Melee Damage": 3.5,
+    "Movement Speed": 1.0,
+    "Crafting Skill": 1.0,
+}
+
+
+def _export(path: Path, species: str, name: str, **stats: object) -> Path:
+    lines = ["[Dino Data]", f"DinoNameTag={species}", f"TamedName={name}"]
+    lines += [f"{key}={value}" for key, value in {**_STATS, **stats}.items()]
+    path.write_text("\n".join(lines))
+    return path
+
+
+def _table(tmp_path: Path) -> DinoStatTable:
+    return DinoStatTable.from_files(
+        [
+            _export(tmp_path / "1.ini", "Rex", "Rexy", Health=1200),
+            _export(tmp_path / "2.ini", "Rex", "Rexo", Health=1500),
+            _export(tmp_path / "3.ini", "Rex", "Rexa", Health=900),
+            _export(tmp_path / "4.ini", "Argentavis", "Argy", Health=800),
+            _export(tmp_path / "5.ini", "Rex", "Broken", Health="1.#INF"),
+        ]
+    )
+
+
+def test_skips_stats_that_are_not_numbers(tmp_path: Path) -> None:
+    table = _table(tmp_path)
+
+    assert len(table) == 4
+    assert table.column("health", "Rex").tolist() == [1200, 1500, 900]
+
+
+def test_top_k_per_species(tmp_path: Path) -> None:
+    table = _table(tmp_path)
+
+    assert table.top_k_per_species("health", k=2) == {
+        "Rex": [("Rexo", 1500.0), ("Rexy", 1200.0)],
+        "Argentavis": [("Argy", 800.0)],
+    }
+    assert table.top_k_per_species("health", k=0) == {}
+
+
+def test_save_load_round_trip(tmp_path: Path) -> None:
+    table = _table(tmp_path)
+    table.save(tmp_path / "table.npz")
+    loaded = DinoStatTable.load(tmp_path / "table.npz")
+
+    assert np.array_equal(loaded.rows, table.rows)
+    assert loaded.species == table.species
+    assert loaded.top_k("health", k=4) == table.top_k("health", k=4)
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from ark.interfaces.inventories._recognizer import ItemRecognizer
+
+
+@pytest.fixture(scope="module")
+def recognizer() -> ItemRecognizer:
+    return ItemRecognizer()
+
+
+def _tiles(recognizer: ItemRecognizer, offset: int) -> np.ndarray:
+    tiles = []
+    for item in recognizer.catalog:
+        icon = recognizer._load_icon(item.inventory_icon)
+        tile = np.full((93, 93), 30, dtype=np.uint8)
+        h, w = icon.shape
+        y = min(max((93 - h) // 2 + offset, 0), 93 - h)
+        x = min(max((93 - w) // 2 - offset, 0), 93 - w)
+        tile[y : y + h, x : x + w] = icon
+        tiles.append(tile)
+    return np.stack(tiles)
+
+
+@pytest.mark.parametrize("offset", [0, 3, -4, 7])
+def test_recognize_every_catalog_icon(recognizer: ItemRecognizer, offset: int) -> None:
+    recognized = recognizer.recognize(_tiles(recognizer, offset))
+
+    for item, result in zip(recognizer.catalog, recognized):
+        # items sharing an icon can not be told apart
+        assert result is not None, item.name
+        assert result.inventory_icon == item.inventory_icon, item.name
+
+
+def test_recognize_empty_tile(recognizer: ItemRecognizer) -> None:
+    assert recognizer.recognize(np.full((1, 93, 93), 30, dtype=np.uint8)) == [None]
@@ -0,0 +1,86 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+from ark import ArkContext
+from ark.settings import (
+    InputSettings,
+    SettingChange,
+    SettingsChanged,
+    SettingsWatcher,
+    UserSettings,
+)
+
+_USER_SETTINGS = """[/Script/ShooterGame.ShooterGameUserSettings]
+UIScaling=1.000000
+FOVMultiplier=1.250000
+LookLeftRightSensitivity=1.600000
+LookUpDownSensitivity=3.200000
+HideItemTextOverlay=True
+bEnableInventoryItemTooltips=True
+bShowChatBox=False
+bToggleExtendedHUDInfo=False
+bDisableMenuTransitions=True
+ResolutionSizeX=1920
+ResolutionSizeY=1080
+LastServerSearchType=0
+LastJoinedSessionPerCategory="Server 1"
+bReverseTribeLogOrder=False
+bLocalInventoryItemsShowAllItems=True
+LocalItemSortType=0
+RemoteItemSortType=0
+bRemoteInventoryShowEngrams=True
+bInventoryHideUnlearnedEngrams=False
+bRemoteInventoryCraftingShowAllItems=True
+bRemoteInventoryShowCraftables=False
+[ScalabilityGroups]
+"""
+
+_INPUT = """[/Script/Engine.InputSettings]
+ActionMappings=(ActionName="ShowMyInventory",Key=I,bShift=False)
+ActionMappings=(ActionName="AccessInventory",Key=F,bShift=False)
+"""
+
+
+def _watcher(tmp_path: Path) -> SettingsWatcher:
+    (tmp_path / "GameUserSettings.ini").write_text(_USER_SETTINGS)
+    (tmp_path / "Input.ini").write_text(_INPUT)
+    context = ArkContext(
+        window=SimpleNamespace(),
+        keybinds=InputSettings.load(str(tmp_path / "Input.ini")),
+        settings=UserSettings.load(str(tmp_path / "GameUserSettings.ini")),
+    )
+    return SettingsWatcher(context, debounce=0)
+
+
+def test_reloads_changed_keybinds(tmp_path: Path) -> None:
+    watcher = _watcher(tmp_path)
+    published: list[SettingsChanged] = []
+    watcher.subscribe(published.append)
+
+    (tmp_path / "Input.ini").write_text(
+        _INPUT.replace("AccessInventory\",Key=F", "AccessInventory\",Key=Three")
+    )
+    events = watcher.poll()
+
+    assert watcher.context.keybinds.target_inventory == "3"
+    assert published == events
+    assert published[0].kind == "keybinds"
+    assert published[0].current is watcher.context.keybinds
+    assert published[0].changes == (SettingChange("target_inventory", "f", "3"),)
+
+
+def test_failing_subscriber_does_not_stop_others(tmp_path: Path) -> None:
+    watcher = _watcher(tmp_path)
+    published: list[SettingsChanged] = []
+
+    def fail(_: SettingsChanged) -> None:
+        raise RuntimeError
+
+    watcher.subscribe(fail)
+    watcher.subscribe(published.append)
+
+    (tmp_path / "Input.ini").write_text(_INPUT.replace("Key=I", "Key=Tab"))
+    watcher.poll()
+
+    assert watcher.context.keybinds.inventory == "tab"
+    assert len(published) == 1
@@ -0,0 +1,79 @@
+from ark.interfaces.tribelog._parser import (
+    TribeLogEventType,
+    parse_event,
+    parse_events,
+)
+
+
+def test_parse_destroyed_by_entity() -> None:
+    event = parse_event("Bob - Lvl 50 (Tribe of Bob) destroyed your 'Stone Wall'!")
+
+    assert event.type == TribeLogEventType.DESTROYED
+    assert event.actor == "Bob"
+    assert event.level == 50
+    assert event.tribe == "Tribe of Bob"
+    assert event.structure == "Stone Wall"
+
+
+def test_parse_destroyed_pin_coded() -> None:
+    event = parse_event(
+        "Gigi - Lvl 200 (Giganotosaurus) (The Raiders) destroyed your "
+        "'Metal Door (Pin Coded)'!"
+    )
+
+    assert event.actor == "Gigi"
+    assert event.tribe == "The Raiders"
+    assert event.structure == "Metal Door"
+    assert event.pin_coded
+
+
+def test_parse_destroyed_by_tribe() -> None:
+    event = parse_event("Tribe of Bob destroyed your 'Tek Turret'!")
+
+    assert event.actor == event.tribe == "Tribe of Bob"
+    assert event.level is None
+    assert event.structure == "Tek Turret"
+
+
+def test_parse_auto_decay() -> None:
+    event = parse_event("Your 'Wooden Wall' was auto-decay destroyed!")
+
+    assert event.type == TribeLogEventType.DESTROYED
+    assert event.auto_decay
+    assert event.structure == "Wooden Wall"
+    assert event.actor is None and event.tribe is None
+
+
+def test_parse_killed() -> None:
+    event = parse_event(
+        "Your Rexy - Lvl 150 (Rex) was killed by "
+        "Gigi - Lvl 200 (Giganotosaurus) (The Raiders)!"
+    )
+
+    assert event.type == TribeLogEventType.KILLED
+    assert event.victim == "Rexy"
+    assert event.actor == "Gigi"
+    assert event.level == 150
+    assert event.tribe == "The Raiders"
+
+
+def test_parse_batch_keeps_order() -> None:
+    events = parse_events(
+        [
+            "Your Tribe Tamed a Rex - Lvl 150 (Rex)!",
+            "no event in here",
+            "'Tek Sensor' triggered by Bob - Lvl 50 (Tribe of Bob)!",
+            "Your Tribe killed Bob - Lvl 50 (Tribe of Bob)!",
+        ]
+    )
+
+    assert [event.type for event in events] == [
+        TribeLogEventType.TAMED,
+        TribeLogEventType.UNKNOWN,
+        TribeLogEventType.SENSOR,
+        TribeLogEventType.KILLED,
+    ]
+    assert events[0].victim == "Rex"
+    assert events[2].structure == "Tek Sensor"
+    assert events[2].tribe == "Tribe of Bob"
+    assert events[3].victim == "Bob" and events[3].tribe == "Tribe of Bob"